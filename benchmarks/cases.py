@@ -0,0 +1,135 @@
+"""
+Benchmark cases.
+
+A case is a function taking two Sets of the same kind and size, s and other,
+and returning a pair (setup, run):
+setup() prepares whatever run() mutates and is not timed, run(state) is timed.
+setup may be None, then run() gets None.
+"""
+# pylint: disable=unused-argument
+from __future__ import annotations
+from typing import Callable
+
+from set_algebra import Interval, Set
+
+from benchmarks.generators import probes
+
+
+# Number of queries or updates done in a single run of per-item cases.
+BATCH = 1000
+
+
+CASES: dict[str, Callable] = {}
+
+
+def case(fn: Callable) -> Callable:
+    CASES[fn.__name__] = fn
+    return fn
+
+
+def _new_pieces(s: Set) -> list:
+    """Return BATCH pieces to add or remove, half scalars and half intervals."""
+    xs = probes(s, BATCH, seed=2)
+    return [x if i % 2 else Interval(x, x + 3, '[)') for i, x in enumerate(xs)]
+
+
+@case
+def search(s, other):
+    xs = probes(s, BATCH)
+
+    def run(_):
+        search = s.search
+        for x in xs:
+            search(x)
+
+    return None, run
+
+
+@case
+def contains(s, other):
+    xs = probes(s, BATCH)
+
+    def run(_):
+        for x in xs:
+            x in s # pylint: disable=pointless-statement
+
+    return None, run
+
+
+@case
+def add(s, other):
+    pieces = _new_pieces(s)
+
+    def run(t):
+        for p in pieces:
+            t.add(p)
+
+    return s.copy, run
+
+
+@case
+def remove(s, other):
+    pieces = _new_pieces(s)
+
+    def run(t):
+        for p in pieces:
+            t.remove(p)
+
+    return s.copy, run
+
+
+@case
+def union(s, other):
+    return None, lambda _: s | other
+
+
+@case
+def intersection(s, other):
+    return None, lambda _: s & other
+
+
+@case
+def symmetric_difference(s, other):
+    return None, lambda _: s ^ other
+
+
+@case
+def complement(s, other):
+    return None, lambda _: ~s
+
+
+@case
+def superset(s, other):
+    # Every tenth piece, so that the whole of it has to be checked.
+    subset = Set.from_pieces(s.pieces[::10], presorted=True)
+    return None, lambda _: s >= subset
+
+
+@case
+def isdisjoint(s, other):
+    # Complement is disjoint from s and has as many pieces.
+    complement_ = ~s
+    return None, lambda _: s.isdisjoint(complement_)
+
+
+@case
+def parse(s, other):
+    notation = s.notation
+    return None, lambda _: Set(notation)
+
+
+@case
+def notation(s, other):
+    return None, lambda _: s.notation
+
+
+@case
+def from_pieces(s, other):
+    # Two interleaved halves, so that pieces are sorted, merged and built anew.
+    pieces = s.pieces[1::2] + s.pieces[::2]
+    return None, lambda _: Set.from_pieces(pieces)
+
+
+@case
+def copy(s, other):
+    return None, lambda _: s.copy()
@@ -0,0 +1,68 @@
+"""
+Compare two JSON files written by benchmarks.run.
+
+    python -m benchmarks.compare baseline.json results.json --threshold 1.1
+
+Prints best time per run of every case present in both files and the ratio
+of the new time to the baseline one. Exits with status 1 if any ratio
+exceeds the threshold.
+"""
+from __future__ import annotations
+import argparse
+import json
+import sys
+
+
+def _load(path: str) -> tuple[dict, dict]:
+    with open(path, encoding='utf-8') as f:
+        report = json.load(f)
+    results = {(r['case'], r['kind'], r['n']): r for r in report['results']}
+    return report['meta'], results
+
+
+def compare(baseline: dict, new: dict, threshold: float) -> tuple[list[str], int]:
+    """Return lines of the report and the number of regressions."""
+    lines = ['%-22s %-10s %8s  %12s  %12s  %7s' % ('case', 'kind', 'n', 'baseline', 'new', 'ratio')]
+    regressions = 0
+
+    for key in sorted(baseline.keys() & new.keys()):
+        old_time = baseline[key]['best']
+        new_time = new[key]['best']
+        ratio = new_time / old_time if old_time else float('inf')
+        mark = ''
+        if ratio > threshold:
+            mark = '  slower'
+            regressions += 1
+        elif ratio < 1 / threshold:
+            mark = '  faster'
+        lines.append('%-22s %-10s %8d  %12.6f  %12.6f  %7.2f%s'
+                     % (*key, old_time, new_time, ratio, mark))
+
+    return lines, regressions
+
+
+def main(argv: list[str]|None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('baseline')
+    parser.add_argument('new')
+    parser.add_argument('--threshold', type=float, default=1.1,
+                        help='ratio of new to baseline time regarded as a regression')
+    args = parser.parse_args(argv)
+
+    baseline_meta, baseline = _load(args.baseline)
+    new_meta, new = _load(args.new)
+
+    print('baseline: %(set_algebra)s %(commit)s, Python %(python)s' % baseline_meta)
+    print('new:      %(set_algebra)s %(commit)s, Python %(python)s' % new_meta)
+    lines, regressions = compare(baseline, new, args.threshold)
+    print('\n'.join(lines))
+
+    if regressions:
+        print('%d regression(s) above %.2f' % (regressions, args.threshold))
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""
+Synthetic Sets for benchmarks.
+
+Every generator returns a Set of exactly n pieces built from a seeded
+random.Random, so the same arguments always give the same Set:
+    dense       intervals separated by small gaps
+    sparse      short intervals separated by large gaps
+    scalars     mostly scalars, every tenth piece is an interval
+    intervals   intervals only, with all four kinds of bounds
+    mixed       half scalars, half intervals
+"""
+from __future__ import annotations
+import random
+
+from set_algebra import Interval, Set
+
+
+BOUNDS = ('[]', '[)', '(]', '()')
+
+
+def _build(n: int, rnd: random.Random, gap: tuple[int, int], length: tuple[int, int],
+           scalar_ratio: float) -> Set:
+    pieces = []
+    x = 0
+
+    for _ in range(n):
+        x += rnd.randint(*gap)
+        if rnd.random() < scalar_ratio:
+            pieces.append(x)
+        else:
+            b = x + rnd.randint(*length)
+            pieces.append(Interval(x, b, rnd.choice(BOUNDS)))
+            x = b
+
+    return Set.from_pieces(pieces, presorted=True)
+
+
+def dense(n: int, seed: int = 0) -> Set:
+    return _build(n, random.Random(seed), gap=(1, 2), length=(5, 50), scalar_ratio=0.0)
+
+
+def sparse(n: int, seed: int = 0) -> Set:
+    return _build(n, random.Random(seed), gap=(100, 1000), length=(1, 5), scalar_ratio=0.0)
+
+
+def scalars(n: int, seed: int = 0) -> Set:
+    return _build(n, random.Random(seed), gap=(1, 10), length=(1, 10), scalar_ratio=0.9)
+
+
+def intervals(n: int, seed: int = 0) -> Set:
+    return _build(n, random.Random(seed), gap=(1, 20), length=(1, 20), scalar_ratio=0.0)
+
+
+def mixed(n: int, seed: int = 0) -> Set:
+    return _build(n, random.Random(seed), gap=(1, 20), length=(1, 20), scalar_ratio=0.5)
+
+
+GENERATORS = {
+    'dense': dense,
+    'sparse': sparse,
+    'scalars': scalars,
+    'intervals': intervals,
+    'mixed': mixed,
+}
+
+
+def probes(s: Set, k: int, seed: int = 0) -> list[float]:
+    """Return k random values spread over the span of Set s and a bit beyond it."""
+    rnd = random.Random(seed)
+    bounds = s.bounds()
+    lo = bounds.a.value if bounds is not None else 0
+    hi = bounds.b.value if bounds is not None else 1
+    margin = (hi - lo) / 20 + 1
+    return [rnd.uniform(lo - margin, hi + margin) for _ in range(k)]
@@ -0,0 +1,141 @@
+"""
+Run benchmarks and write results as JSON.
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --sizes 1000 10000 --kinds dense scalars --cases search union
+
+Every case is run on every kind of generated Set of every size.
+Each sample times as many runs as needed to take at least --min-time seconds,
+and the best and median time per run over --repeat samples are recorded.
+Garbage collection is disabled while timing, as timeit does,
+and validation of Set pieces is off regardless of SET_ALGEBRA_VALIDATION.
+"""
+from __future__ import annotations
+import argparse
+import datetime
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import set_algebra
+from set_algebra.validation import OFF, validation
+
+from benchmarks.cases import CASES
+from benchmarks.generators import GENERATORS
+
+
+DEFAULT_SIZES = (100, 1000, 10000, 100000)
+
+
+def time_case(setup, run, repeat: int, min_time: float) -> tuple[int, list[float]]:
+    """Return number of runs per sample and seconds per run of every sample."""
+    number = 1
+
+    while True:
+        samples = [_sample(setup, run, number) for _ in range(repeat)]
+        if min(samples) * number >= min_time or number >= 1 << 20:
+            return number, samples
+        number *= 2
+
+
+def _sample(setup, run, number: int) -> float:
+    states = [setup() if setup is not None else None for _ in range(number)]
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        start = time.perf_counter()
+        for state in states:
+            run(state)
+        elapsed = time.perf_counter() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return elapsed / number
+
+
+def _git_commit() -> str|None:
+    try:
+        out = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                             check=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip()
+
+
+def metadata() -> dict:
+    return {
+        'set_algebra': set_algebra.__version__,
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'date': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+    }
+
+
+def run_benchmarks(cases, kinds, sizes, repeat: int = 5, min_time: float = 0.05,
+                   log=None) -> list[dict]:
+    results = []
+
+    for kind in kinds:
+        for n in sizes:
+            s = GENERATORS[kind](n, seed=0)
+            other = GENERATORS[kind](n, seed=1)
+
+            for name in cases:
+                setup, run = CASES[name](s, other)
+                number, samples = time_case(setup, run, repeat, min_time)
+                result = {
+                    'case': name,
+                    'kind': kind,
+                    'n': n,
+                    'number': number,
+                    'repeat': repeat,
+                    'best': min(samples),
+                    'median': statistics.median(samples),
+                }
+                results.append(result)
+                if log is not None:
+                    log('%-22s %-10s %8d  %12.6f s' % (name, kind, n, result['best']))
+
+    return results
+
+
+def main(argv: list[str]|None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--cases', nargs='+', choices=sorted(CASES), default=list(CASES))
+    parser.add_argument('--kinds', nargs='+', choices=sorted(GENERATORS), default=list(GENERATORS))
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.05,
+                        help='minimal duration of a sample, seconds')
+    parser.add_argument('--output', '-o', help='JSON file to write results to')
+    parser.add_argument('--quiet', '-q', action='store_true')
+    args = parser.parse_args(argv)
+
+    log = None if args.quiet else lambda line: print(line, file=sys.stderr, flush=True)
+    with validation(OFF):
+        results = run_benchmarks(args.cases, args.kinds, args.sizes, args.repeat, args.min_time,
+                                 log)
+    report = {'meta': metadata(), 'results': results}
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,18 +3,32 @@ Set Algebra
 
 Provides:
     Infinity, Negative Infinity
-    Endpoint
-    Interval
+    Endpoint, FrozenEndpoint
+    Interval, FrozenInterval
     Set
+    FrozenSet
+    IntervalIndex
+    IntervalMap
+    CompactSet
+    ChunkedSet
+    PersistentSet
+    ConcurrentSet
 """
 
-__version__ = '0.4.0'
+__version__ = '0.5.0'
 __author__ = 'Constantine Parkhimovich'
 __license__ = 'MIT'
 __copyright__ = 'Copyright 2014-present Constantine Parkhimovich'
 
 
-from set_algebra.endpoint import Endpoint, are_bounding
+from set_algebra.endpoint import Endpoint, FrozenEndpoint, are_bounding
 from set_algebra.infinity import Infinity, NegativeInfinity, is_finite, inf, neg_inf
-from set_algebra.interval import Interval, is_interval, is_scalar, unbounded
+from set_algebra.interval import FrozenInterval, Interval, is_interval, is_scalar, unbounded
 from set_algebra.set_ import Set
+from set_algebra.compact import CompactSet
+from set_algebra.chunked import ChunkedSet
+from set_algebra.persistent import PersistentSet
+from set_algebra.frozen import FrozenSet
+from set_algebra.index import IntervalIndex
+from set_algebra.interval_map import IntervalMap
+from set_algebra.threadsafe import ConcurrentSet
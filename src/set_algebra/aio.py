@@ -0,0 +1,178 @@
+"""
+Building and combining Sets without blocking an asyncio event loop.
+
+Coroutines from_pieces(), union(), intersection(), difference(),
+symmetric_difference() and update() do the same work as the Set methods
+of the same names, in steps of at most chunk_size pieces, returning
+control to the event loop between the steps. Other tasks wait for a step
+at most, rather than for the whole operation.
+
+Pieces are given as Sets, iterables or asynchronous iterables of pieces,
+e.g. rows of an async database cursor. Input is read chunk by chunk, every
+chunk is sorted and merged on its own, and the resulting runs are swept
+at once, in O(N log k) for N pieces in k chunks. Operations on Sets are
+the generators of set_algebra.stream, consumed chunk_size pieces at a time.
+
+>>> import asyncio
+>>> from set_algebra import Interval, Set
+>>> async def rows():
+...     for i in range(5):
+...         yield Interval(i * 10, i * 10 + 6, '[)')
+>>> async def rebuild():
+...     s = await from_pieces(rows(), chunk_size=2)
+...     return await difference(s, Set('[0, 40)'))
+>>> asyncio.run(rebuild())
+Set([Interval('[40, 46)')])
+"""
+from __future__ import annotations
+import asyncio
+import heapq
+import itertools
+from typing import AsyncIterable, AsyncIterator, Iterable
+
+from set_algebra import stream
+from set_algebra.cuts import _coalesce_cuts, _cuts_to_pieces
+from set_algebra.frozen import FrozenSet
+from set_algebra.interval import Interval
+from set_algebra.set_ import Scalar, Set
+from set_algebra.stream import _pieces
+
+
+# Number of pieces processed between returns to the event loop, unless given.
+CHUNK_SIZE = 10000
+
+Pieces = Iterable[Interval|Scalar] | AsyncIterable[Interval|Scalar] # For type annotations
+
+
+async def _chunks(pieces: Pieces, chunk_size: int) -> AsyncIterator[list[Interval|Scalar]]:
+    """Yield lists of at most chunk_size pieces, returning to the event loop after each of them."""
+    if isinstance(pieces, AsyncIterable):
+        chunk = []
+        async for piece in pieces:
+            chunk.append(piece)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+                # An async iterator does not necessarily suspend.
+                await asyncio.sleep(0)
+        if chunk:
+            yield chunk
+        return
+
+    it = iter(pieces)
+    while chunk := list(itertools.islice(it, chunk_size)):
+        yield chunk
+        await asyncio.sleep(0)
+
+
+async def collect(pieces: Pieces, chunk_size: int|None = None) -> list[Interval|Scalar]:
+    """
+    Return list of the pieces, reading them chunk_size at a time,
+    e.g. from a stream generator.
+    """
+    result = []
+    async for chunk in _chunks(pieces, chunk_size or CHUNK_SIZE):
+        result += chunk
+    return result
+
+
+def _union_cuts(runs: list[list[tuple]]):
+    """
+    Yield cuts of the union of runs, ascending cuts of normalized pieces,
+    sweeping them at once in O(N log k) for N cuts in k runs.
+    """
+    # At the same cut, starts (0) come before ends (1), so that touching pieces are joined.
+    events = heapq.merge(*(zip(run, itertools.cycle((0, 1))) for run in runs))
+    depth = 0
+    for cut, is_end in events:
+        if is_end:
+            depth -= 1
+            if not depth:
+                yield cut
+        else:
+            if not depth:
+                yield cut
+            depth += 1
+
+
+async def _normalized_pieces(pieces: Pieces, presorted: bool,
+                             chunk_size: int|None) -> list[Interval|Scalar]:
+    """Return normalized pieces of a Set containing all the pieces, see from_pieces()."""
+    chunk_size = chunk_size or CHUNK_SIZE
+
+    runs = []
+    async for chunk in _chunks(pieces, chunk_size):
+        runs.append(_coalesce_cuts(chunk, presorted))
+
+    if len(runs) == 1:
+        return _cuts_to_pieces(runs[0])
+
+    result = await collect(_pieces(_union_cuts(runs)), chunk_size)
+
+    # Freeing all the cuts at once would block the event loop as well.
+    while runs:
+        runs.pop().clear()
+        await asyncio.sleep(0)
+
+    return result
+
+
+async def from_pieces(pieces: Pieces, presorted: bool = False, chunk_size: int|None = None,
+                      cls: type[Set] = Set) -> Set:
+    """
+    Same as cls.from_pieces(), returning to the event loop every chunk_size pieces.
+    pieces may be an asynchronous iterable.
+    """
+    return cls._from_normalized(await _normalized_pieces(pieces, presorted, chunk_size))
+
+
+async def _combine(sweep, first: Set, others: tuple[Set | Pieces, ...],
+                   chunk_size: int|None) -> Set:
+    """
+    Return Set of the type of first, the result of a Set operation on first and others,
+    sweep being one of the functions of set_algebra.stream.
+    Others that are not Sets are read with from_pieces() first.
+    """
+    sets = []
+    for other in others:
+        if not isinstance(other, Set):
+            other = Set._from_normalized(await _normalized_pieces(other, False, chunk_size))
+        sets.append(other)
+
+    pieces = await collect(sweep(first, *sets), chunk_size)
+    return type(first)._from_normalized(pieces)
+
+
+async def union(first: Set, *others: Set | Pieces, chunk_size: int|None = None) -> Set:
+    """
+    Same as first.union(*others), returning to the event loop every chunk_size pieces.
+    Others are Sets, iterables or asynchronous iterables of pieces.
+    """
+    return await _combine(stream.union, first, others, chunk_size)
+
+
+async def intersection(first: Set, *others: Set | Pieces, chunk_size: int|None = None) -> Set:
+    """Same as first.intersection(*others), see union()."""
+    return await _combine(stream.intersection, first, others, chunk_size)
+
+
+async def difference(first: Set, *others: Set | Pieces, chunk_size: int|None = None) -> Set:
+    """Same as first.difference(*others), see union()."""
+    return await _combine(stream.difference, first, others, chunk_size)
+
+
+async def symmetric_difference(first: Set, *others: Set | Pieces,
+                               chunk_size: int|None = None) -> Set:
+    """Same as first.symmetric_difference(*others), see union()."""
+    return await _combine(stream.symmetric_difference, first, others, chunk_size)
+
+
+async def update(s: Set, *others: Set | Pieces, chunk_size: int|None = None) -> None:
+    """
+    Same as s.update(*others), see union().
+    The Set is left unchanged until the union is complete,
+    so other tasks never see it partially updated.
+    """
+    if isinstance(s, FrozenSet):
+        raise TypeError('FrozenSet is immutable')
+    s.pieces = (await union(s, *others, chunk_size=chunk_size)).pieces
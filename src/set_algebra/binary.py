@@ -0,0 +1,183 @@
+"""
+Binary format of Sets of real numbers.
+
+    offset      size    content
+    0           4       magic b'SETA'
+    4           1       format version, 1
+    5           1       byte order of numbers: b'<' little-endian or b'>' big-endian
+    6           2       reserved, zero
+    8           8       n - number of pieces, unsigned integer
+    16          8*n     left values of pieces, float64
+    16+8*n      8*n     right values of pieces, float64
+    16+16*n     n       flags: LEFT_OPEN and RIGHT_OPEN bits
+
+A scalar is stored as a piece with equal closed endpoints.
+Infinities are stored as float64 infinities.
+Numbers are written in native byte order. Arrays start at 8-byte aligned
+offsets, so a buffer in native byte order is read without copying -
+arrays are memoryviews cast over the buffer.
+
+Data is not trusted: from_buffer() of Set and CompactSet checks it with
+check() unless told otherwise.
+
+Pieces are represented here by cuts - tuples (value, side) where side
+is True if the axis is cut just after the value and False if just before.
+"""
+from __future__ import annotations
+from array import array
+import struct
+import sys
+
+from set_algebra.infinity import Infinity, NegativeInfinity, inf, neg_inf
+
+
+MAGIC = b'SETA'
+VERSION = 1
+
+# Bits of flags
+LEFT_OPEN = 1
+RIGHT_OPEN = 2
+
+_NATIVE_ORDER = b'<' if sys.byteorder == 'little' else b'>'
+_HEADER = struct.Struct('=4sBcxxQ')
+
+_FLOAT_INF = float('inf')
+
+
+def to_float(value: object) -> float:
+    """Return value as float, preserving infinities."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+
+    if isinstance(value, Infinity):
+        return _FLOAT_INF
+
+    if isinstance(value, NegativeInfinity):
+        return -_FLOAT_INF
+
+    classname = type(value).__name__
+    raise TypeError(f'only real numbers are supported, not {classname}')
+
+
+def from_float(value: float) -> float|Infinity|NegativeInfinity:
+    """Return value, replacing float infinities with inf and neg_inf."""
+    if value == _FLOAT_INF:
+        return inf
+
+    if value == -_FLOAT_INF:
+        return neg_inf
+
+    return value
+
+
+def arrays_from_cuts(cuts) -> tuple[array, array, array]:
+    """Return arrays of left values, right values and flags of pieces given by ascending cuts."""
+    lefts = array('d')
+    rights = array('d')
+    flags = array('B')
+
+    it = iter(cuts)
+    for (a_value, a_side), (b_value, b_side) in zip(it, it):
+        lefts.append(to_float(a_value))
+        rights.append(to_float(b_value))
+        flags.append((LEFT_OPEN if a_side else 0) | (0 if b_side else RIGHT_OPEN))
+
+    return lefts, rights, flags
+
+
+def iter_cuts(lefts, rights, flags):
+    """Yield cuts of pieces given by arrays, two per piece."""
+    for a, b, f in zip(lefts, rights, flags):
+        yield a, bool(f & LEFT_OPEN)
+        yield b, not f & RIGHT_OPEN
+
+
+def check(lefts, rights, flags) -> None:
+    """
+    Raise ValueError unless arrays describe pieces of a Set: each of them
+    nonempty and closed only at finite values, all of them ascending
+    with gaps between them.
+    """
+    prev_b = None
+    prev_open = False
+
+    for i, (a, b, f) in enumerate(zip(lefts, rights, flags)):
+        if f & ~(LEFT_OPEN | RIGHT_OPEN):
+            raise ValueError(f'pieces[{i}]: invalid flags {f}')
+
+        a_open = bool(f & LEFT_OPEN)
+        b_open = bool(f & RIGHT_OPEN)
+
+        # Comparisons with nan are False, so nan fails here.
+        if not (a < b or a == b and not f):
+            raise ValueError(f'pieces[{i}]: empty piece from {a} to {b}')
+
+        if abs(a) == _FLOAT_INF and not a_open or abs(b) == _FLOAT_INF and not b_open:
+            raise ValueError(f'pieces[{i}]: closed at infinity')
+
+        if prev_b is not None and not prev_b < a:
+            if not prev_b == a:
+                raise ValueError(f'pieces[{i-1}] and pieces[{i}]: {prev_b} > {a}')
+            if not (prev_open and a_open):
+                raise ValueError(f'pieces[{i-1}] and pieces[{i}]: no gap at {a}')
+
+        prev_b, prev_open = b, b_open
+
+
+def dumps(lefts, rights, flags) -> bytes:
+    """Return bytes of Set given by arrays of left values, right values and flags."""
+    n = len(lefts)
+
+    if not len(rights) == len(flags) == n:
+        raise ValueError('arrays must be of the same length')
+
+    header = _HEADER.pack(MAGIC, VERSION, _NATIVE_ORDER, n)
+
+    return b''.join([header, bytes(lefts), bytes(rights), bytes(flags)])
+
+
+def loads(buf) -> tuple[memoryview|array, memoryview|array, memoryview]:
+    """
+    Return arrays of left values, right values and flags from buf,
+    any object supporting the buffer protocol: bytes, bytearray, mmap, memoryview...
+    If byte order of buf is native, no data is copied and memoryviews of buf are returned.
+    """
+    view = memoryview(buf).cast('B')
+
+    if len(view) < _HEADER.size:
+        raise ValueError('buffer is too short for a Set header')
+
+    magic, version, order = struct.unpack_from('4sBc', view)
+
+    if magic != MAGIC:
+        raise ValueError('buffer does not contain a Set')
+
+    if version != VERSION:
+        raise ValueError(f'unsupported Set format version {version}')
+
+    if order not in (b'<', b'>'):
+        raise ValueError(f'invalid byte order {order!r}')
+
+    (n,) = struct.unpack_from(order.decode() + 'Q', view, 8)
+
+    start = _HEADER.size
+    size = start + 17 * n
+
+    if len(view) != size:
+        raise ValueError(f'buffer size must be {size} bytes for {n} pieces, not {len(view)}')
+
+    raw_lefts = view[start:start + 8*n]
+    raw_rights = view[start + 8*n:start + 16*n]
+    flags = view[start + 16*n:size]
+
+    if order == _NATIVE_ORDER:
+        return raw_lefts.cast('d'), raw_rights.cast('d'), flags
+
+    lefts = array('d')
+    rights = array('d')
+    lefts.frombytes(raw_lefts)
+    rights.frombytes(raw_rights)
+    lefts.byteswap()
+    rights.byteswap()
+
+    return lefts, rights, flags
@@ -0,0 +1,285 @@
+from __future__ import annotations
+from collections.abc import MutableSequence
+import itertools
+from typing import Iterable
+
+from set_algebra.interval import Interval
+from set_algebra.set_ import Set, Scalar
+from set_algebra.splice import _search
+
+
+class ChunkedList(MutableSequence):
+    """
+    List-like sequence stored as a list of chunks (short lists).
+
+    Inserting or deleting an item moves at most a chunk worth of pointers
+    instead of the whole tail of a list, and positions of chunks are tracked
+    by a Fenwick tree over their lengths.
+    So indexing, insert() and slice assignment of k items run in
+    O(log n + LOAD + k), while the same operations on a list are O(n).
+
+    Chunks longer than 2*LOAD are split, empty ones are dropped and
+    small ones are joined with a neighbour.
+    """
+
+    __slots__ = ('_chunks', '_tree', '_len')
+
+    LOAD = 256
+
+    def __init__(self, iterable: Iterable = ()) -> None:
+        self._reset(list(iterable))
+
+    def _reset(self, items: list) -> None:
+        load = self.LOAD
+        self._chunks = [items[i:i+load] for i in range(0, len(items), load)]
+        self._len = len(items)
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        """Build Fenwick tree over lengths of chunks in O(number of chunks)."""
+        n = len(self._chunks)
+        tree = [0] * (n+1)
+
+        for i, chunk in enumerate(self._chunks, 1):
+            tree[i] += len(chunk)
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+
+        self._tree = tree
+
+    def _grow(self, ci: int, delta: int) -> None:
+        """Account for length of chunk ci changed by delta."""
+        tree = self._tree
+        n = len(tree) - 1
+        i = ci + 1
+
+        while i <= n:
+            tree[i] += delta
+            i += i & -i
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        """
+        Return (chunk index, index within the chunk) of item at index.
+        index must be in range(len(self)).
+        """
+        tree = self._tree
+        n = len(tree) - 1
+        ci = 0
+        bit = 1 << (n.bit_length() - 1)
+
+        while bit:
+            nxt = ci + bit
+            if nxt <= n and tree[nxt] <= index:
+                ci = nxt
+                index -= tree[nxt]
+            bit >>= 1
+
+        return ci, index
+
+    def _offset(self, ci: int) -> int:
+        """Return index of the first item of chunk ci."""
+        tree = self._tree
+        offset = 0
+
+        while ci > 0:
+            offset += tree[ci]
+            ci -= ci & -ci
+
+        return offset
+
+    def _normalize_index(self, index: int) -> int:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError('ChunkedList index out of range')
+        return index
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(self._chunks)
+
+    def __reversed__(self):
+        for chunk in reversed(self._chunks):
+            yield from reversed(chunk)
+
+    def __getitem__(self, index: int|slice):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step != 1 or start >= stop:
+                return list(self)[index]
+            ci, k = self._locate(start)
+            items = itertools.chain(self._chunks[ci][k:], *self._chunks[ci+1:])
+            return list(itertools.islice(items, stop - start))
+
+        ci, k = self._locate(self._normalize_index(index))
+        return self._chunks[ci][k]
+
+    def __setitem__(self, index: int|slice, value) -> None:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step != 1:
+                items = list(self)
+                items[index] = value
+                self._reset(items)
+                return
+            self._replace(start, max(start, stop), list(value))
+            return
+
+        ci, k = self._locate(self._normalize_index(index))
+        self._chunks[ci][k] = value
+
+    def __delitem__(self, index: int|slice) -> None:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step != 1:
+                items = list(self)
+                del items[index]
+                self._reset(items)
+                return
+            self._replace(start, max(start, stop), [])
+            return
+
+        index = self._normalize_index(index)
+        self._replace(index, index + 1, [])
+
+    def insert(self, index: int, value) -> None:
+        """Insert value before index, clamping index like list.insert() does."""
+        if index < 0:
+            index = max(0, index + self._len)
+        index = min(index, self._len)
+        self._replace(index, index, [value])
+
+    def _replace(self, start: int, stop: int, items: list) -> None:
+        """Replace items in range(start, stop) with items. Same as list slice assignment."""
+        chunks = self._chunks
+
+        if not chunks:
+            self._reset(items)
+            return
+
+        if start == self._len:
+            ci = len(chunks) - 1
+            k = len(chunks[ci])
+        else:
+            ci, k = self._locate(start)
+
+        # Delete items from chunk ci onwards.
+        remaining = stop - start
+        cj, kj = ci, k
+        while remaining:
+            chunk = chunks[cj]
+            take = min(remaining, len(chunk) - kj)
+            del chunk[kj:kj+take]
+            self._grow(cj, -take)
+            remaining -= take
+            cj += 1
+            kj = 0
+
+        chunk = chunks[ci]
+        chunk[k:k] = items
+        self._grow(ci, len(items))
+        self._len += len(items) - (stop - start)
+
+        load = self.LOAD
+        last = max(ci + 1, cj)
+
+        if len(chunk) > 2 * load \
+           or len(chunk) < load // 4 \
+           or any(not c for c in chunks[ci+1:last]):
+            self._rechunk(ci, last)
+
+    def _rechunk(self, lo: int, hi: int) -> None:
+        """Split, join or drop chunks in range(lo, hi) and their neighbours."""
+        chunks = self._chunks
+        load = self.LOAD
+
+        lo = max(0, lo - 1)
+        hi = min(len(chunks), hi + 1)
+        items = list(itertools.chain.from_iterable(chunks[lo:hi]))
+
+        if len(items) > 2 * load:
+            new_chunks = [items[i:i+load] for i in range(0, len(items), load)]
+            if len(new_chunks) > 1 and len(new_chunks[-1]) < load // 2:
+                tail = new_chunks.pop()
+                new_chunks[-1] += tail
+        elif items:
+            new_chunks = [items]
+        else:
+            new_chunks = []
+
+        chunks[lo:hi] = new_chunks
+        self._rebuild()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (list, tuple, ChunkedList)):
+            return NotImplemented
+        return len(self) == len(other) and all(x == y for x, y in zip(self, other))
+
+    def __ne__(self, other: object) -> bool:
+        eq = self.__eq__(other)
+        return eq if eq is NotImplemented else not eq
+
+    def __add__(self, other: Iterable) -> list:
+        return list(self) + list(other)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def copy(self) -> ChunkedList:
+        return type(self)(self)
+
+
+class ChunkedSet(Set):
+    """
+    Set keeping its pieces in a ChunkedList.
+    Adding and removing pieces does not move the whole tail of the pieces,
+    which pays off for Sets of hundreds of thousands of pieces and more.
+    Operations on ChunkedSets return ChunkedSets.
+    """
+    container = ChunkedList
+
+    def search(self, x: Scalar,
+               lo: int = 0,
+               hi: int|None = None) -> tuple[int, Interval|Scalar|None]:
+        """
+        Search scalar x in Set, see Set.search.
+        Finds the chunk first, then searches within the chunk,
+        so that pieces are not accessed through ChunkedList indexing.
+        """
+        if lo < 0:
+            raise ValueError('lo must be non-negative')
+
+        pieces = self.pieces
+        if hi is None:
+            hi = len(pieces)
+
+        chunks = pieces._chunks # pylint: disable=protected-access
+        c_lo = 0
+        c_hi = len(chunks)
+
+        # Find the first chunk that does not end before x.
+        while c_lo < c_hi:
+            mid = (c_lo+c_hi) // 2
+            last = chunks[mid][-1]
+            end = last.b if isinstance(last, Interval) else last
+            if end < x:
+                c_lo = mid + 1
+            else:
+                c_hi = mid
+
+        if c_lo == len(chunks):
+            idx, piece = len(pieces), None
+        else:
+            idx, piece = _search(chunks[c_lo], x)
+            idx += pieces._offset(c_lo) # pylint: disable=protected-access
+
+        # Pieces are ascending, so searching within lo:hi
+        # is the same as clamping the result of searching everywhere.
+        if idx < lo:
+            return lo, None
+        if idx >= hi:
+            return hi, None
+        return idx, piece
@@ -0,0 +1,234 @@
+from __future__ import annotations
+from array import array
+import bisect
+import operator
+from typing import Iterable
+
+from set_algebra import binary
+from set_algebra.binary import LEFT_OPEN, RIGHT_OPEN, from_float as _from_float
+from set_algebra.cuts import (_AFTER, _BEFORE, _coalesce, _difference_op, _iter_cuts, _merge_cuts,
+    _piece_from_cuts)
+from set_algebra.infinity import inf, neg_inf
+from set_algebra.interval import Interval
+from set_algebra.set_ import Set
+
+
+_UNIVERSE_CUTS = ((neg_inf, _AFTER), (inf, _BEFORE))
+
+
+class CompactSet:
+    """
+    Set of real numbers stored in flat arrays instead of Intervals and Endpoints.
+
+    Piece i spans from lefts[i] to rights[i], both being float64,
+    and flags[i] tells whether its endpoints are open (LEFT_OPEN, RIGHT_OPEN bits).
+    A scalar is stored as a piece with equal closed endpoints.
+    That is 17 bytes per piece, while a Set keeps an Interval and two Endpoints.
+
+    CompactSet can be instantiated from anything Set can be instantiated from,
+    or from another CompactSet.
+    Values are converted to float, so integers beyond 2**53 lose precision,
+    and pieces are returned with float values:
+    >>> CompactSet('[1, 2], {3}')
+    CompactSet([Interval('[1.0, 2.0]'), 3.0])
+
+    CompactSet supports the same queries and operators as Set:
+    search(), "in", |, &, -, ^, ~, notation.
+    Operands of binary operators may be either CompactSets or Sets.
+    CompactSet has no mutating methods; augmented assignments rebind to a new CompactSet.
+    """
+
+    __slots__ = ('lefts', 'rights', 'flags')
+
+    def __init__(self, arg: str | Iterable[Interval|float] | Set | CompactSet | None = None):
+        if isinstance(arg, CompactSet):
+            self.lefts = array('d', arg.lefts)
+            self.rights = array('d', arg.rights)
+            self.flags = array('B', arg.flags)
+            return
+
+        if arg is None:
+            pieces = []
+        elif isinstance(arg, Set):
+            pieces = arg.pieces
+        elif isinstance(arg, str):
+            pieces = Set(arg).pieces
+        else:
+            pieces = _coalesce(arg)
+
+        self._load(_iter_cuts(pieces))
+
+    def _load(self, cuts) -> None:
+        """Fill arrays from ascending cuts."""
+        self.lefts, self.rights, self.flags = binary.arrays_from_cuts(cuts)
+
+    @classmethod
+    def _from_cuts(cls, cuts) -> CompactSet:
+        new = cls.__new__(cls)
+        new._load(cuts)
+        return new
+
+    def _iter_cuts(self):
+        """Yield cuts of the pieces, two per piece."""
+        return binary.iter_cuts(self.lefts, self.rights, self.flags)
+
+    def _piece(self, i: int) -> Interval|float:
+        """Build piece i as a scalar or an Interval."""
+        f = self.flags[i]
+        start = _from_float(self.lefts[i]), bool(f & LEFT_OPEN)
+        end = _from_float(self.rights[i]), not f & RIGHT_OPEN
+        return _piece_from_cuts(start, end)
+
+    @property
+    def pieces(self) -> list[Interval|float]:
+        """List of pieces, built on every access."""
+        return [self._piece(i) for i in range(len(self.lefts))]
+
+    def to_set(self) -> Set:
+        """Return a Set with the same pieces."""
+        new = Set()
+        new.pieces = self.pieces
+        return new
+
+    def __repr__(self) -> str:
+        return '%s(%s)' % (type(self).__name__, self.pieces)
+
+    @property
+    def notation(self) -> str:
+        return self.to_set().notation
+
+    def __bool__(self) -> bool:
+        return len(self.lefts) > 0
+
+    def __eq__(self, other: CompactSet|object) -> bool:
+        """
+        self == other
+        Test whether the CompactSet contains all the pieces of the other and vice versa.
+        """
+        return isinstance(other, CompactSet) \
+           and self.lefts == other.lefts \
+           and self.rights == other.rights \
+           and self.flags == other.flags
+
+    def __ne__(self, other: CompactSet|object) -> bool:
+        """ self != other """
+        return not self == other
+
+    def search(self, x: float,
+               lo: int = 0,
+               hi: int|None = None) -> tuple[int, Interval|float|None]:
+        """
+        Search scalar x in CompactSet.
+        Return tuple of two elements:
+            the index where to insert x in list of pieces.
+            piece that contains x or equals to x, or None if none found.
+
+        Optional args lo (default 0) and hi (default number of pieces) bound the
+            slice of pieces to be searched.
+        """
+        if lo < 0:
+            raise ValueError('lo must be non-negative')
+
+        if hi is None:
+            hi = len(self.lefts)
+
+        # Pieces before i have left value <= x.
+        i = bisect.bisect_right(self.lefts, x, lo, hi)
+
+        if i == lo:
+            return i, None
+
+        j = i - 1
+        a = self.lefts[j]
+        b = self.rights[j]
+        f = self.flags[j]
+
+        if x == a and f & LEFT_OPEN:
+            return j, None
+
+        if x < b or (x == b and not f & RIGHT_OPEN):
+            return j, self._piece(j)
+
+        return i, None
+
+    def __contains__(self, x: Interval|float) -> bool:
+        """
+        x in self
+        Test scalar or interval x for membership in CompactSet.
+        """
+        if isinstance(x, Interval):
+            _, piece = self.search(x.a)
+            return isinstance(piece, Interval) and x.b <= piece.b
+
+        return self.search(x)[1] is not None
+
+    def __invert__(self) -> CompactSet:
+        """
+        ~self
+        Return a new CompactSet that is a complement of the CompactSet.
+        """
+        return self._from_cuts(_merge_cuts(self._iter_cuts(), _UNIVERSE_CUTS, operator.xor))
+
+    def _merge(self, other: CompactSet|Set, op, op_symbol: str) -> CompactSet:
+        if isinstance(other, CompactSet):
+            other_cuts = other._iter_cuts()
+        elif isinstance(other, Set):
+            other_cuts = _iter_cuts(other.pieces)
+        else:
+            emsg = "unsupported operand type for %s: %s and %s"
+            raise TypeError(emsg % (op_symbol, type(self), type(other)))
+
+        return self._from_cuts(_merge_cuts(self._iter_cuts(), other_cuts, op))
+
+    def __or__(self, other: CompactSet|Set) -> CompactSet:
+        """
+        self | other
+        Return a new CompactSet that is a union of the CompactSet and the other.
+        """
+        return self._merge(other, operator.or_, '|')
+
+    def __and__(self, other: CompactSet|Set) -> CompactSet:
+        """
+        self & other
+        Return a new CompactSet that is an intersection of the CompactSet and the other.
+        """
+        return self._merge(other, operator.and_, '&')
+
+    def __sub__(self, other: CompactSet|Set) -> CompactSet:
+        """
+        self - other
+        Return a new CompactSet with everything that is in the CompactSet but not in the other.
+        """
+        return self._merge(other, _difference_op, '-')
+
+    def __xor__(self, other: CompactSet|Set) -> CompactSet:
+        """
+        self ^ other
+        Return a new CompactSet with pieces in either the CompactSet or the other but not in both.
+        """
+        return self._merge(other, operator.xor, '^')
+
+    def to_bytes(self) -> bytes:
+        """Return the CompactSet in binary format, see set_algebra.binary."""
+        return binary.dumps(self.lefts, self.rights, self.flags)
+
+    @classmethod
+    def from_buffer(cls, buf, validate: bool = True) -> CompactSet:
+        """
+        Return CompactSet from data in binary format, see set_algebra.binary.
+        buf is any object supporting the buffer protocol, e.g. bytes or mmap.
+        Unless byte order of the data differs from the native one,
+        nothing is copied: arrays of the CompactSet are memoryviews of buf,
+        so buf must not be changed while the CompactSet is in use.
+        If validate is True (default), raise ValueError if the data does not
+        describe a valid Set; it is read once for that in O(n).
+        """
+        new = cls.__new__(cls)
+        new.lefts, new.rights, new.flags = binary.loads(buf)
+        if validate:
+            binary.check(new.lefts, new.rights, new.flags)
+        return new
+
+    def copy(self) -> CompactSet:
+        """Return a copy of the CompactSet."""
+        return CompactSet(self)
@@ -0,0 +1,76 @@
+"""
+Coverage depth of the axis by a number of Sets.
+
+The depth of a point is the number of Sets containing it.
+For example, with a Set of free time of every room,
+at_least(rooms, 3) is when at least 3 rooms are free.
+
+>>> from set_algebra import Set
+>>> rooms = [Set('[9, 12]'), Set('[10, 14]'), Set('[11, 12), {13}')]
+>>> for piece, depth in coverage(rooms):
+...     print(piece, depth)
+Interval('[9, 10)') 1
+Interval('[10, 11)') 2
+Interval('[11, 12)') 3
+12 2
+Interval('(12, 13)') 1
+13 2
+Interval('(13, 14]') 1
+>>> at_least(rooms, 2)
+Set([Interval('[10, 12]'), 13])
+"""
+from __future__ import annotations
+from typing import Iterable, Iterator
+
+from set_algebra.cuts import (_cuts_to_pieces, _depth_cuts, _iter_cuts, _piece_from_cuts,
+    _threshold_cuts)
+from set_algebra.interval import Interval
+from set_algebra.set_ import Scalar, Set
+
+
+def _sets_depth_cuts(sets: Iterable[Set | Iterable[Interval|Scalar]]):
+    sets = [s if isinstance(s, Set) else Set(s) for s in sets]
+    return _depth_cuts([_iter_cuts(s.pieces) for s in sets])
+
+
+def iter_coverage(sets: Iterable[Set | Iterable[Interval|Scalar]]
+                  ) -> Iterator[tuple[Interval|Scalar, int]]:
+    """
+    Yield tuples (piece, depth) for ascending pieces of the axis
+    covered by at least one of the sets, see coverage().
+    """
+    start = None
+    start_depth = 0
+
+    for cut, depth in _sets_depth_cuts(sets):
+        if depth == start_depth:
+            # Pieces touch here, depth does not change.
+            continue
+        if start_depth:
+            yield _piece_from_cuts(start, cut), start_depth
+        start = cut
+        start_depth = depth
+
+
+def coverage(sets: Iterable[Set | Iterable[Interval|Scalar]]) -> list[tuple[Interval|Scalar, int]]:
+    """
+    Return list of tuples (piece, depth), where pieces are ascending
+    intervals and scalars, each contained in exactly depth of the sets.
+    Parts of the axis not covered by any of the sets are omitted,
+    and adjacent pieces have different depths.
+    Items that are not Sets are iterables of pieces, see Set.__init__.
+    Runs in O(N log k) for N pieces in k sets.
+    """
+    return list(iter_coverage(sets))
+
+
+def at_least(sets: Iterable[Set | Iterable[Interval|Scalar]], k: int) -> Set:
+    """
+    Return a new Set of everything contained in at least k of the sets.
+    at_least(sets, 1) is the union of the sets, and at_least(sets, len(sets)) is the intersection.
+    Runs in O(N log k) for N pieces in k sets.
+    """
+    if k < 1:
+        raise ValueError(f'k must be positive, not {k}')
+
+    return Set._from_normalized(_cuts_to_pieces(_threshold_cuts(_sets_depth_cuts(sets), k)))
@@ -0,0 +1,214 @@
+"""
+Cuts and the sweep engine behind Set operations.
+
+Every Endpoint cuts the axis either just before or just after its value.
+A cut is represented by a tuple (value, side):
+  [v and v) cut the axis just before v: (v, _BEFORE)
+  (v and v] cut the axis just after v:  (v, _AFTER)
+A scalar v spans from (v, _BEFORE) to (v, _AFTER).
+Tuples order cuts the same way Endpoints are ordered on the axis,
+and touching pieces share the same cut, which makes merging trivial.
+
+Ascending pieces of a Set give ascending cuts, two per piece, and operations
+on Sets sweep cuts of their operands at once, see _merge_cuts() and _depth_cuts().
+"""
+from __future__ import annotations
+import operator
+from typing import Iterable
+
+from set_algebra.endpoint import Endpoint
+from set_algebra.infinity import is_finite, inf, neg_inf
+from set_algebra.interval import Interval
+
+
+Scalar = object # For type annotations
+
+_BEFORE = False
+_AFTER = True
+
+# Cuts where the axis starts and ends: pieces of a Set are within (-inf, inf).
+_AXIS_START = (neg_inf, _AFTER)
+_AXIS_END = (inf, _BEFORE)
+
+
+def _iter_cuts(pieces: Iterable[Interval|Scalar]):
+    """Yield cuts of ascending pieces, two per piece."""
+    for p in pieces:
+        if isinstance(p, Interval):
+            a, b = p.a, p.b
+            yield a.value, a.open
+            yield b.value, not b.open
+        else:
+            yield p, _BEFORE
+            yield p, _AFTER
+
+
+def _piece_from_cuts(start: tuple, end: tuple) -> Interval|Scalar:
+    """Return scalar or Interval spanning from cut start to cut end."""
+    a_value, a_side = start
+    b_value, b_side = end
+
+    if a_side is _BEFORE and b_side is _AFTER and a_value == b_value:
+        return a_value
+
+    # Cuts of pieces are valid, so Endpoints need no checks.
+    a = Endpoint._make(a_value, a_side, True)
+    b = Endpoint._make(b_value, not b_side, False)
+
+    return Interval._make(a, b)
+
+
+def _cuts_to_pieces(cuts) -> list[Interval|Scalar]:
+    """Build list of pieces from ascending cuts, taking them in pairs."""
+    it = iter(cuts)
+    return [_piece_from_cuts(start, end) for start, end in zip(it, it)]
+
+
+def _difference_op(x: bool, y: bool) -> bool:
+    return x and not y
+
+
+def _merge_cuts(cuts1, cuts2, op):
+    """
+    Sweep two ascending sequences of cuts at once.
+    op is a function of two booleans - whether a region belongs to the first
+    and to the second operand. It must return False for (False, False).
+    Yield cuts where the value of op changes, i.e. cuts of the resulting Set.
+    Runs in O(n+m).
+    """
+    it1 = iter(cuts1)
+    it2 = iter(cuts2)
+    c1 = next(it1, None)
+    c2 = next(it2, None)
+    in1 = in2 = inside = False
+
+    while c1 is not None or c2 is not None:
+        if c2 is None or (c1 is not None and c1 < c2):
+            cut = c1
+            in1 = not in1
+            c1 = next(it1, None)
+        elif c1 is None or c2 < c1:
+            cut = c2
+            in2 = not in2
+            c2 = next(it2, None)
+        else:
+            # Both operands cut the axis at the same place.
+            cut = c1
+            in1 = not in1
+            in2 = not in2
+            c1 = next(it1, None)
+            c2 = next(it2, None)
+
+        if op(in1, in2) is not inside:
+            inside = not inside
+            yield cut
+
+
+def _depth_cuts(cut_sequences):
+    """
+    Sweep any number of ascending sequences of cuts at once.
+    Yield (cut, depth) for every distinct cut, depth being the number of
+    sequences whose pieces contain the region just after the cut.
+
+    Starts and ends of pieces of all sequences are gathered and sorted.
+    Each sequence contributes an ascending run, and sort() merges k runs
+    in O(N log k) for N cuts, much like a heap would, but without
+    a Python-level step per cut.
+    """
+    starts = []
+    ends = []
+    for cuts in cut_sequences:
+        cuts = list(cuts)
+        starts += cuts[::2]
+        ends += cuts[1::2]
+
+    starts.sort()
+    ends.sort()
+
+    n = len(starts)
+    i = j = 0
+    depth = 0
+
+    while j < n:
+        cut = starts[i] if i < n and starts[i] < ends[j] else ends[j]
+        while i < n and starts[i] == cut:
+            depth += 1
+            i += 1
+        while j < n and ends[j] == cut:
+            depth -= 1
+            j += 1
+        yield cut, depth
+
+
+def _threshold_cuts(depth_cuts, k: int):
+    """Yield cuts where depth from _depth_cuts() crosses k, i.e. cuts of regions of depth >= k."""
+    inside = False
+    for cut, depth in depth_cuts:
+        if (depth >= k) is not inside:
+            inside = not inside
+            yield cut
+
+
+def _span(p: Interval|Scalar) -> tuple[tuple, tuple]:
+    """Return (start cut, end cut) of a piece."""
+    if isinstance(p, Interval):
+        return (p.a.value, p.a.open), (p.b.value, not p.b.open)
+
+    if not is_finite(p):
+        raise ValueError('x must be finite')
+
+    return (p, _BEFORE), (p, _AFTER)
+
+
+def _start_cut(p: Interval|Scalar) -> tuple:
+    return _span(p)[0]
+
+
+def _end_cut(p: Interval|Scalar) -> tuple:
+    return _span(p)[1]
+
+
+def _coalesce_cuts(pieces: Iterable[Interval|Scalar], presorted: bool = False) -> list[tuple]:
+    """
+    Return cuts of normalized pieces of a Set containing all the given pieces.
+    Pieces are sorted by their left side unless presorted is True,
+    then overlapping and touching ones are joined in one linear pass.
+    Runs in O(n log n), or in O(n) if presorted.
+    """
+    spans = [_span(p) for p in pieces]
+
+    if not presorted:
+        spans.sort(key=operator.itemgetter(0))
+
+    cuts = []
+    prev_start = None
+
+    for start, end in spans:
+        if presorted:
+            if prev_start is not None and start < prev_start:
+                raise ValueError('pieces are not sorted by their left side')
+            prev_start = start
+
+        if not start < end:
+            # Degenerate interval other than [a, a] is empty.
+            continue
+
+        if cuts and start <= cuts[-1]:
+            if cuts[-1] < end:
+                cuts[-1] = end
+        else:
+            cuts.append(start)
+            cuts.append(end)
+
+    return cuts
+
+
+def _coalesce(pieces: Iterable[Interval|Scalar], presorted: bool = False) -> list[Interval|Scalar]:
+    """Return normalized pieces of a Set containing all the given pieces, see _coalesce_cuts()."""
+    return _cuts_to_pieces(_coalesce_cuts(pieces, presorted))
+
+
+def _merge_pieces(pieces1: list, pieces2: list, op) -> list[Interval|Scalar]:
+    """Return new pieces of op applied to two lists of ascending pieces."""
+    cuts = _merge_cuts(_iter_cuts(pieces1), _iter_cuts(pieces2), op)
+    return _cuts_to_pieces(cuts)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from set_algebra.infinity import Infinity, NegativeInfinity, neg_inf, is_finite
+from set_algebra.infinity import Infinity, NegativeInfinity, inf, neg_inf, is_finite
 from set_algebra.parser import (OPEN_LEFT_TO_BOUNDS_MAPPING, parse_bound,
     parse_endpoint_notation)
 
@@ -56,6 +56,18 @@ class Endpoint:
         self.open: bool = open_
         self.left: bool = left
 
+    @classmethod
+    def _make(cls, value: Scalar, open_: bool, left: bool) -> Endpoint:
+        """
+        Return a new Endpoint without parsing its bound and checking its value,
+        for internal use where they are known to be valid.
+        """
+        endpoint = cls.__new__(cls)
+        endpoint.value = value
+        endpoint.open = open_
+        endpoint.left = left
+        return endpoint
+
     @property
     def right(self) -> bool:
         return not self.left
@@ -195,13 +207,72 @@ class Endpoint:
         >>> ~Endpoint('[1')
         Endpoint('1)')
         """
-        bound = OPEN_LEFT_TO_BOUNDS_MAPPING[not self.open, not self.left]
-        return Endpoint(self.value, bound)
+        open_ = not self.open
+        if not open_ and not is_finite(self.value):
+            raise ValueError('Not open value cannot be infinite, use "(" or ")" as bound')
+        return type(self)._make(self.value, open_, not self.left)
 
     def copy(self) -> Endpoint:
         """Return a shallow copy of the Endpoint"""
-        bound = OPEN_LEFT_TO_BOUNDS_MAPPING[self.open, self.left]
-        return Endpoint(self.value, bound)
+        return Endpoint._make(self.value, self.open, self.left)
+
+
+class FrozenEndpoint(Endpoint):
+    """
+    Immutable and hashable Endpoint.
+    Slots cannot be changed once the FrozenEndpoint is created, so it can be
+    shared by any number of Intervals and Sets instead of being copied.
+    FrozenEndpoint is equal to, and hashes the same as,
+    an Endpoint or FrozenEndpoint with equal slots, and a closed one
+    is equal to, and hashes the same as, its value.
+
+    >>> FrozenEndpoint('[1') == Endpoint('[1')
+    True
+    >>> {1: 'one'}[FrozenEndpoint('1]')]
+    'one'
+    >>> ~FrozenEndpoint('[1')
+    FrozenEndpoint('1)')
+    """
+    __slots__ = ()
+
+    @classmethod
+    def _of(cls, e: Endpoint) -> FrozenEndpoint:
+        """
+        Return e if it is frozen, or a FrozenEndpoint equal to it, without parsing the bound.
+        Open infinite endpoints are interned, so all FrozenIntervals share them.
+        """
+        if isinstance(e, FrozenEndpoint):
+            return e
+        if e.open:
+            if e.value is neg_inf and e.left:
+                return _OPEN_NEG_INF
+            if e.value is inf and not e.left:
+                return _OPEN_INF
+        return cls._make(e.value, e.open, e.left)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        # Slots are set once, when the FrozenEndpoint is created.
+        if hasattr(self, name):
+            raise AttributeError(f'{type(self).__name__} is immutable')
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __hash__(self) -> int:
+        # A closed Endpoint is equal to its value, so it hashes the same.
+        if not self.open:
+            return hash(self.value)
+        return hash((self.value, self.open, self.left))
+
+    def copy(self) -> FrozenEndpoint:
+        """Return the FrozenEndpoint itself, as it cannot be changed."""
+        return self
+
+
+# Interned endpoints of unbounded FrozenIntervals, shared as they cannot be changed.
+_OPEN_NEG_INF = FrozenEndpoint._make(neg_inf, True, True)
+_OPEN_INF = FrozenEndpoint._make(inf, True, False)
 
 
 def are_bounding(e1: Endpoint, e2: Endpoint) -> bool:
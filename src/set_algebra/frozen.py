@@ -0,0 +1,102 @@
+from __future__ import annotations
+from typing import Iterable
+
+from set_algebra.interval import FrozenInterval, Interval
+from set_algebra.set_ import Set, Scalar
+
+
+def _freeze(piece: Interval|Scalar) -> FrozenInterval|Scalar:
+    if isinstance(piece, Interval) and not isinstance(piece, FrozenInterval):
+        return FrozenInterval(piece.a, piece.b)
+    return piece
+
+
+class FrozenSet(Set):
+    """
+    Immutable and hashable Set.
+
+    FrozenSet is instantiated the same way as Set, and supports all the Set
+    queries and operators, which return FrozenSets.
+    Pieces are kept in a tuple, intervals being FrozenIntervals.
+    Mutating methods raise TypeError, while augmented assignments
+    (|=, &=, -=, ^=) rebind the name to a new FrozenSet, like they do for frozenset.
+
+    FrozenSet is equal to a Set with the same pieces, and can be used as a dict key.
+    copy() returns the FrozenSet itself.
+    Hash, complement (~), bounds() and measure() are computed once
+    and cached, so repeated queries on long-lived FrozenSets are O(1).
+
+    >>> s = FrozenSet('[1, 2], {5}')
+    >>> s == Set('[1, 2], {5}')
+    True
+    >>> {s: 'reference'}[FrozenSet('[1, 2], {5}')]
+    'reference'
+    >>> ~s is ~s
+    True
+    """
+
+    container = tuple
+
+    @property
+    def pieces(self) -> tuple[FrozenInterval|Scalar, ...]:
+        return self._pieces
+
+    @pieces.setter
+    def pieces(self, pieces: Iterable[Interval|Scalar]) -> None:
+        # Pieces are set once, when the FrozenSet is created.
+        if '_pieces' in self.__dict__:
+            raise AttributeError('FrozenSet is immutable')
+        self._pieces = tuple(map(_freeze, pieces))
+
+    def __repr__(self) -> str:
+        return '%s(%s)' % (type(self).__name__, list(self.pieces))
+
+    def __hash__(self) -> int:
+        h = self.__dict__.get('_hash')
+        if h is None:
+            h = self._hash = hash(self.pieces)
+        return h
+
+    def __invert__(self) -> FrozenSet:
+        """
+        ~self
+        Return a FrozenSet that is a complement of the FrozenSet.
+        The complement is cached, and its own complement is the FrozenSet itself.
+        """
+        complement = self.__dict__.get('_complement')
+        if complement is None:
+            complement = self._complement = super().__invert__()
+            complement._complement = self
+        return complement
+
+    def bounds(self) -> FrozenInterval|None:
+        """Return the smallest FrozenInterval containing the FrozenSet, see Set.bounds."""
+        if '_bounds' not in self.__dict__:
+            self._bounds = _freeze(super().bounds())
+        return self._bounds
+
+    def copy(self) -> FrozenSet:
+        """Return the FrozenSet itself, as it cannot be changed."""
+        return self
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError('FrozenSet is immutable')
+
+    add = remove = clear = _immutable
+    update = intersection_update = difference_update = symmetric_difference_update = _immutable
+
+    def __ior__(self, other: Set) -> FrozenSet:
+        """ self |= other, same as self = self | other """
+        return self | other
+
+    def __iand__(self, other: Set) -> FrozenSet:
+        """ self &= other, same as self = self & other """
+        return self & other
+
+    def __isub__(self, other: Set) -> FrozenSet:
+        """ self -= other, same as self = self - other """
+        return self - other
+
+    def __ixor__(self, other: Set) -> FrozenSet:
+        """ self ^= other, same as self = self ^ other """
+        return self ^ other
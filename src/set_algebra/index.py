@@ -0,0 +1,142 @@
+from __future__ import annotations
+from typing import Iterable
+
+from set_algebra.compact import CompactSet
+from set_algebra.cuts import _AFTER, _BEFORE, _span
+from set_algebra.interval import Interval
+from set_algebra.set_ import Scalar, Set
+
+
+Label = object # For type annotations
+
+
+def _pieces(obj: Interval|Set|CompactSet|Scalar) -> Iterable[Interval|Scalar]:
+    if isinstance(obj, (Set, CompactSet)):
+        return obj.pieces
+    return [obj]
+
+
+class IntervalIndex:
+    """
+    Index of labeled Intervals, Sets and scalars answering which of them
+    contain a scalar (stab) or share at least a point with an Interval or Set (overlapping).
+
+    Pieces of all the indexed objects are kept sorted by their left side, and
+    an implicit balanced tree over them stores the rightmost end in every subtree,
+    so that subtrees that end before a query are skipped.
+    Queries run in O(log n + k) for n pieces, k of which match.
+    Open and closed endpoints are respected: (1, 2) and [2, 3] do not overlap.
+
+    The tree is rebuilt in O(n log n) on the first query after add().
+    Labels are returned in the order they were added, each once.
+
+    >>> index = IntervalIndex([('a', Interval('[0, 10)')), ('b', Set('[5, 7], {12}'))])
+    >>> index.stab(10)
+    []
+    >>> index.stab(5)
+    ['a', 'b']
+    >>> index.overlapping(Interval('(7, 12]'))
+    ['a', 'b']
+    """
+
+    __slots__ = ('_labels', '_entries', '_starts', '_ends', '_ids', '_max_ends')
+
+    def __init__(self, items: Iterable[tuple[Label, Interval|Set|CompactSet|Scalar]] = ()) -> None:
+        self._labels = []
+        self._entries = []
+        # Built by _build() on the first query, _starts is None when stale.
+        self._starts = None
+        self._ends = None
+        self._ids = None
+        self._max_ends = None
+        for label, obj in items:
+            self.add(label, obj)
+
+    def add(self, label: Label, obj: Interval|Set|CompactSet|Scalar) -> None:
+        """Add obj - an Interval, Set, CompactSet or scalar - to the index under label."""
+        label_id = len(self._labels)
+        entries = []
+
+        for piece in _pieces(obj):
+            start, end = _span(piece)
+            # Skip empty degenerate intervals such as (1, 1).
+            if start < end:
+                entries.append((start, end, label_id))
+
+        self._labels.append(label)
+        self._entries += entries
+        self._starts = None
+
+    def __len__(self) -> int:
+        """Return number of labels added."""
+        return len(self._labels)
+
+    def _build(self) -> None:
+        entries = sorted(self._entries, key=lambda entry: entry[0])
+        self._starts = [entry[0] for entry in entries]
+        self._ends = ends = [entry[1] for entry in entries]
+        self._ids = [entry[2] for entry in entries]
+        self._max_ends = max_ends = [None] * len(entries)
+
+        # Node mid of the implicit tree covers entries[lo:hi], where mid = (lo+hi) // 2.
+        def build(lo: int, hi: int):
+            mid = (lo+hi) // 2
+            max_end = ends[mid]
+            if lo < mid:
+                max_end = max(max_end, build(lo, mid))
+            if mid+1 < hi:
+                max_end = max(max_end, build(mid+1, hi))
+            max_ends[mid] = max_end
+            return max_end
+
+        if entries:
+            build(0, len(entries))
+
+    def _query(self, start: tuple, end: tuple, found: set[int]) -> None:
+        """Add to found ids of labels with pieces between cuts start and end."""
+        if self._starts is None:
+            self._build()
+
+        starts = self._starts
+        ends = self._ends
+        ids = self._ids
+        max_ends = self._max_ends
+        stack = [(0, len(starts))]
+
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+
+            mid = (lo+hi) // 2
+            if not start < max_ends[mid]:
+                # Everything in this subtree ends before the query starts.
+                continue
+
+            stack.append((lo, mid))
+
+            if starts[mid] < end:
+                if start < ends[mid]:
+                    found.add(ids[mid])
+                # Entries to the right start no earlier than mid, so are worth visiting
+                # only if mid starts before the query ends.
+                stack.append((mid+1, hi))
+
+    def _labels_of(self, found: set[int]) -> list[Label]:
+        labels = self._labels
+        return [labels[i] for i in sorted(found)]
+
+    def stab(self, x: Scalar) -> list[Label]:
+        """Return labels of objects containing scalar x."""
+        found = set()
+        self._query((x, _BEFORE), (x, _AFTER), found)
+        return self._labels_of(found)
+
+    def overlapping(self, obj: Interval|Set|CompactSet|Scalar) -> list[Label]:
+        """Return labels of objects sharing at least one point with obj."""
+        found = set()
+        for piece in _pieces(obj):
+            start, end = _span(piece)
+            if start < end:
+                self._query(start, end, found)
+        return self._labels_of(found)
@@ -18,6 +18,11 @@ def _is_orderable(x: object) -> bool:
     return True
 
 
+# Built once rather than by every comparison.
+_FLOAT_INF = float('inf')
+_FLOAT_NEG_INF = float('-inf')
+
+
 def _isnan(x: object) -> bool:
     return isinstance(x, Real) and math.isnan(x)
 
@@ -33,7 +38,7 @@ class Infinity:
         self == other
         Equality here is not purely type-based - it delegates to foreign `==`
         """
-        return isinstance(other, Infinity) or other == float('inf')
+        return isinstance(other, Infinity) or other == _FLOAT_INF
 
     def __ne__(self, other: object) -> bool:
         """ self != other """
@@ -41,7 +46,7 @@ class Infinity:
 
     def __gt__(self, other: object) -> bool|NotImplementedType:
         """ self > other """
-        if isinstance(other, Infinity) or other == float('inf') or _isnan(other):
+        if isinstance(other, Infinity) or other == _FLOAT_INF or _isnan(other):
             return False
 
         if _is_orderable(other):
@@ -83,6 +88,10 @@ class Infinity:
 
         return not gt
 
+    def __hash__(self) -> int:
+        """ Same as hash of float infinity, which is equal to inf. """
+        return hash(_FLOAT_INF)
+
     def __neg__(self) -> NegativeInfinity:
         """ -self """
         return neg_inf
@@ -102,7 +111,7 @@ class NegativeInfinity:
         self == other
         Equality here is not purely type-based - it delegates to foreign `==`
         """
-        return isinstance(other, NegativeInfinity) or other == float('-inf')
+        return isinstance(other, NegativeInfinity) or other == _FLOAT_NEG_INF
 
     def __ne__(self, other: object) -> bool:
         """ self != other """
@@ -120,7 +129,7 @@ class NegativeInfinity:
 
     def __lt__(self, other: object) -> bool|NotImplementedType:
         """ self < other """
-        if isinstance(other, NegativeInfinity) or other == float('-inf') or _isnan(other):
+        if isinstance(other, NegativeInfinity) or other == _FLOAT_NEG_INF or _isnan(other):
             return False
 
         if _is_orderable(other):
@@ -152,6 +161,10 @@ class NegativeInfinity:
 
         return not gt
 
+    def __hash__(self) -> int:
+        """ Same as hash of negative float infinity, which is equal to neg_inf. """
+        return hash(_FLOAT_NEG_INF)
+
     def __neg__(self) -> Infinity:
         """ -self """
         return inf
@@ -161,6 +174,13 @@ class NegativeInfinity:
 
 
 def is_finite(x: object) -> bool:
+    # Fast paths for the most common values.
+    cls = type(x)
+    if cls is int:
+        return True
+    if cls is float:
+        return math.isfinite(x)
+
     if _isnan(x):
         return False
 
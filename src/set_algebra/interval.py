@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from set_algebra.endpoint import Endpoint
+from set_algebra.endpoint import Endpoint, FrozenEndpoint
 from set_algebra.parser import OPEN_LEFT_TO_BOUNDS_MAPPING
 
 
@@ -132,6 +132,17 @@ class Interval:
         self.a = a
         self.b = b
 
+    @classmethod
+    def _make(cls, a: Endpoint, b: Endpoint) -> Interval:
+        """
+        Return a new Interval of two Endpoints without checking them,
+        for internal use where they are known to be valid.
+        """
+        interval = cls.__new__(cls)
+        interval.a = a
+        interval.b = b
+        return interval
+
     @property
     def notation(self) -> str:
         return '%s, %s' % (self.a.notation, self.b.notation)
@@ -163,16 +174,51 @@ class Interval:
     def copy(self) -> Interval:
         """
         Return a shallow copy of the Interval.
-        Endpoints are recreated.
+        Endpoints are recreated, except FrozenEndpoints, which are shared.
         copy is safe as long as endpoint values are of immutable types.
         """
-        return Interval(self.a.copy(), self.b.copy())
+        return Interval._make(self.a.copy(), self.b.copy())
 
     @property
     def is_degenerate(self) -> bool:
         return self.a.value == self.b.value
 
 
+class FrozenInterval(Interval):
+    """
+    Immutable and hashable Interval.
+    Endpoints cannot be replaced once the FrozenInterval is created,
+    and they are FrozenEndpoints, so the FrozenInterval can be shared
+    by any number of Sets instead of being copied.
+    FrozenInterval is equal to, and hashes the same as,
+    an Interval or FrozenInterval with equal endpoints.
+
+    >>> FrozenInterval('[0, 1)') == Interval('[0, 1)')
+    True
+    >>> len({FrozenInterval('[0, 1)'), FrozenInterval(0, 1, '[)')})
+    1
+    """
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: object) -> None:
+        # Slots are set once, in Interval.__init__.
+        if hasattr(self, name):
+            raise AttributeError(f'{type(self).__name__} is immutable')
+        super().__setattr__(name, FrozenEndpoint._of(value)) # pylint: disable=protected-access
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __hash__(self) -> int:
+        a = self.a
+        b = self.b
+        return hash((a.value, a.open, b.value, b.open))
+
+    def copy(self) -> FrozenInterval:
+        """Return the FrozenInterval itself, as it cannot be changed."""
+        return self
+
+
 def is_interval(obj: object) -> bool:
     return isinstance(obj, Interval)
 
@@ -0,0 +1,230 @@
+from __future__ import annotations
+import bisect
+import heapq
+from typing import Callable, Iterable, Iterator
+
+from set_algebra.cuts import _AFTER, _BEFORE, _piece_from_cuts, _span
+from set_algebra.interval import Interval
+from set_algebra.set_ import Scalar, Set
+
+
+Key = Interval|Set|Scalar # For type annotations
+
+
+def _spans(key: Key) -> list[tuple[tuple, tuple]]:
+    """Return non-empty spans (start cut, end cut) of key's pieces."""
+    pieces = key.pieces if isinstance(key, Set) else [key]
+    spans = [_span(p) for p in pieces]
+    return [(start, end) for start, end in spans if start < end]
+
+
+class IntervalMap:
+    """
+    Piecewise-constant mapping of the axis to values.
+
+    Keys are intervals and scalars, values are arbitrary objects compared with ==.
+    Assigning a value to an interval overwrites whatever was mapped there,
+    splitting pieces it partially covers, and touching pieces of equal values
+    are joined, so the mapping is always kept in its shortest form.
+
+    Pieces are kept as three lists - start cuts, end cuts and values,
+    see set_algebra.set_ - so lookups are binary searches in O(log n),
+    and assignments splice the lists in O(log n + n_moved).
+
+    >>> prices = IntervalMap()
+    >>> prices[Interval('[0, 100)')] = 'standard'
+    >>> prices[Interval('[10, 20)')] = 'discount'
+    >>> prices[Interval('[20, 30)')] = 'standard'
+    >>> prices.get(15)
+    'discount'
+    >>> prices # doctest: +NORMALIZE_WHITESPACE
+    IntervalMap([(Interval('[0, 10)'), 'standard'), (Interval('[10, 20)'), 'discount'),
+                 (Interval('[20, 100)'), 'standard')])
+    """
+
+    __slots__ = ('_starts', '_ends', '_values')
+
+    def __init__(self, items: Iterable[tuple[Key, object]] = ()) -> None:
+        self._starts = []
+        self._ends = []
+        self._values = []
+        for key, value in items:
+            self.assign(key, value)
+
+    def _append(self, start: tuple, end: tuple, value: object) -> None:
+        """Append piece after all the others, joining it with the last one if they touch."""
+        if self._ends and self._ends[-1] == start and self._values[-1] == value:
+            self._ends[-1] = end
+        else:
+            self._starts.append(start)
+            self._ends.append(end)
+            self._values.append(value)
+
+    def _splice(self, start: tuple, end: tuple, new: list[tuple[tuple, tuple, object]]) -> None:
+        """
+        Replace everything between cuts start and end with pieces new,
+        keeping parts of pieces beyond the cuts.
+        """
+        starts = self._starts
+        ends = self._ends
+        values = self._values
+
+        # Pieces in range(lo, hi) overlap or touch [start, end].
+        lo = bisect.bisect_left(ends, start)
+        hi = bisect.bisect_right(starts, end)
+
+        if lo < hi:
+            if starts[lo] < start:
+                new.insert(0, (starts[lo], start, values[lo]))
+            if end < ends[hi-1]:
+                new.append((end, ends[hi-1], values[hi-1]))
+
+        # Join touching pieces of equal values.
+        joined = []
+        for piece in new:
+            if joined and joined[-1][1] == piece[0] and joined[-1][2] == piece[2]:
+                joined[-1] = (joined[-1][0], piece[1], piece[2])
+            else:
+                joined.append(piece)
+
+        starts[lo:hi] = [p[0] for p in joined]
+        ends[lo:hi] = [p[1] for p in joined]
+        values[lo:hi] = [p[2] for p in joined]
+
+    def assign(self, key: Key, value: object) -> None:
+        """Map every point of key - an Interval, scalar or Set - to value."""
+        for start, end in _spans(key):
+            self._splice(start, end, [(start, end, value)])
+
+    def __setitem__(self, key: Key, value: object) -> None:
+        """ self[key] = value, same as assign() """
+        self.assign(key, value)
+
+    def remove(self, key: Key) -> None:
+        """Unmap every point of key - an Interval, scalar or Set."""
+        for start, end in _spans(key):
+            self._splice(start, end, [])
+
+    def __delitem__(self, key: Key) -> None:
+        """ del self[key], same as remove() """
+        self.remove(key)
+
+    def _index(self, x: Scalar) -> int|None:
+        i = bisect.bisect_right(self._starts, (x, _BEFORE)) - 1
+        if i >= 0 and (x, _AFTER) <= self._ends[i]:
+            return i
+        return None
+
+    def get(self, x: Scalar, default: object = None) -> object:
+        """Return value mapped to scalar x, or default if x is not mapped."""
+        i = self._index(x)
+        return default if i is None else self._values[i]
+
+    def __getitem__(self, x: Scalar) -> object:
+        """ self[x] - value mapped to scalar x. Raise KeyError if x is not mapped. """
+        i = self._index(x)
+        if i is None:
+            raise KeyError(x)
+        return self._values[i]
+
+    def __contains__(self, x: Scalar) -> bool:
+        """ x in self - test whether scalar x is mapped. """
+        return self._index(x) is not None
+
+    def __len__(self) -> int:
+        """Return number of pieces."""
+        return len(self._values)
+
+    def __bool__(self) -> bool:
+        return bool(self._values)
+
+    def items(self, within: Interval|Scalar|None = None
+              ) -> Iterator[tuple[Interval|Scalar, object]]:
+        """
+        Yield tuples (piece, value) in ascending order.
+        If within is given, only pieces within it are yielded, clipped to it.
+        """
+        starts = self._starts
+        ends = self._ends
+        values = self._values
+
+        if within is None:
+            for start, end, value in zip(starts, ends, values):
+                yield _piece_from_cuts(start, end), value
+            return
+
+        for lo_cut, hi_cut in _spans(within):
+            lo = bisect.bisect_right(ends, lo_cut)
+            hi = bisect.bisect_left(starts, hi_cut)
+            for i in range(lo, hi):
+                start = max(starts[i], lo_cut)
+                end = min(ends[i], hi_cut)
+                yield _piece_from_cuts(start, end), values[i]
+
+    def domain(self) -> Set:
+        """Return a Set of all the mapped points."""
+        cuts = []
+        for start, end in zip(self._starts, self._ends):
+            if cuts and cuts[-1] == start:
+                cuts[-1] = end
+            else:
+                cuts += [start, end]
+        it = iter(cuts)
+        return Set._from_normalized([_piece_from_cuts(start, end) for start, end in zip(it, it)])
+
+    def combine(self, other: IntervalMap, fn: Callable[[object, object], object],
+                default: object = None) -> IntervalMap:
+        """
+        Return a new IntervalMap mapping every point mapped by either map
+        to fn(value in self, value in other), where default stands for a missing value.
+        Both maps are swept at once in O(n+m).
+        """
+        if not isinstance(other, IntervalMap):
+            raise TypeError(f'other must be IntervalMap, not {type(other).__name__}')
+
+        def bounds(imap):
+            # Ascending cuts where pieces start or end, touching ones repeated.
+            for start, end in zip(imap._starts, imap._ends):
+                yield start
+                yield end
+
+        new = IntervalMap()
+        i = j = 0
+        prev = None
+
+        for cut in heapq.merge(bounds(self), bounds(other)):
+            if prev is not None and prev < cut:
+                # Region between cuts prev and cut.
+                while i < len(self._ends) and self._ends[i] <= prev:
+                    i += 1
+                while j < len(other._ends) and other._ends[j] <= prev:
+                    j += 1
+                in1 = i < len(self._starts) and self._starts[i] <= prev
+                in2 = j < len(other._starts) and other._starts[j] <= prev
+                if in1 or in2:
+                    value1 = self._values[i] if in1 else default
+                    value2 = other._values[j] if in2 else default
+                    new._append(prev, cut, fn(value1, value2))
+            prev = cut
+
+        return new
+
+    def __eq__(self, other: IntervalMap|object) -> bool:
+        return isinstance(other, IntervalMap) \
+           and self._starts == other._starts \
+           and self._ends == other._ends \
+           and self._values == other._values
+
+    def __ne__(self, other: IntervalMap|object) -> bool:
+        return not self == other
+
+    def __repr__(self) -> str:
+        return '%s(%s)' % (type(self).__name__, list(self.items()))
+
+    def copy(self) -> IntervalMap:
+        """Return a shallow copy of the IntervalMap. Values are not copied."""
+        new = IntervalMap()
+        new._starts = self._starts.copy()
+        new._ends = self._ends.copy()
+        new._values = self._values.copy()
+        return new
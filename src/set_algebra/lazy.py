@@ -0,0 +1,348 @@
+"""
+Lazy Set expressions.
+
+Operators on lazy(s) build a tree of operations instead of computing
+intermediate Sets. The tree is rewritten into a normal form: complements
+are pushed down to the Sets by De Morgan laws, so ~ never materializes,
+nested unions, intersections and symmetric differences are flattened,
+and a Set used several times is swept once.
+Then all the Sets are swept at once, and pieces of the result are built
+only by evaluate(). Membership, isdisjoint() and bool() need no result at all,
+and the latter two stop at its first piece.
+Note that ~ of a Set computes its complement right away, ~lazy(s) does not.
+
+>>> from set_algebra import Set
+>>> a, b, c = Set('[0, 10]'), Set('[5, 20]'), Set('[8, 9]')
+>>> expr = (lazy(a) | b) & ~lazy(c)
+>>> expr # doctest: +NORMALIZE_WHITESPACE
+Intersection(Union(Leaf(Set([Interval('[0, 10]')])), Leaf(Set([Interval('[5, 20]')]))),
+             Complement(Leaf(Set([Interval('[8, 9]')]))))
+>>> (~(lazy(a) | b) - c).simplify() # doctest: +NORMALIZE_WHITESPACE
+Intersection(Complement(Leaf(Set([Interval('[0, 10]')]))),
+             Complement(Leaf(Set([Interval('[5, 20]')]))),
+             Complement(Leaf(Set([Interval('[8, 9]')]))))
+>>> 8.5 in expr
+False
+>>> expr.evaluate()
+Set([Interval('[0, 8)'), Interval('(9, 20]')])
+"""
+from __future__ import annotations
+import functools
+import heapq
+import itertools
+import operator
+from typing import Callable, Iterable
+
+from set_algebra.cuts import _AXIS_END, _AXIS_START, _cuts_to_pieces, _iter_cuts
+from set_algebra.interval import Interval
+from set_algebra.set_ import Scalar, Set
+
+
+class _Table(dict):
+    """Values of a compiled expression by masks, computed when first looked up."""
+
+    def __init__(self, fn: Callable[[int], bool]) -> None:
+        super().__init__()
+        self.fn = fn
+
+    def __missing__(self, mask: int) -> bool:
+        value = self[mask] = self.fn(mask)
+        return value
+
+
+class Expression:
+    """
+    Base class of lazy Set expressions.
+    Operands of |, &, - and ^ are Expressions and Sets.
+    """
+
+    __slots__ = ()
+
+    def __or__(self, other: Expression|Set) -> Expression:
+        return Union(self, _expression(other))
+
+    def __and__(self, other: Expression|Set) -> Expression:
+        return Intersection(self, _expression(other))
+
+    def __sub__(self, other: Expression|Set) -> Expression:
+        return Intersection(self, Complement(_expression(other)))
+
+    def __xor__(self, other: Expression|Set) -> Expression:
+        return SymmetricDifference(self, _expression(other))
+
+    def __ror__(self, other: Set) -> Expression:
+        return Union(_expression(other), self)
+
+    def __rand__(self, other: Set) -> Expression:
+        return Intersection(_expression(other), self)
+
+    def __rsub__(self, other: Set) -> Expression:
+        return Intersection(_expression(other), Complement(self))
+
+    def __rxor__(self, other: Set) -> Expression:
+        return SymmetricDifference(_expression(other), self)
+
+    def __invert__(self) -> Expression:
+        return Complement(self)
+
+    def _negated(self) -> Expression:
+        """Return normal form of the complement of the normalized expression."""
+        raise NotImplementedError
+
+    def _normalized(self, leaves: dict[int, Leaf]) -> Expression:
+        """Return expression in normal form, see simplify()."""
+        raise NotImplementedError
+
+    def _compile(self, bits: dict[int, int]) -> Callable[[int], bool]:
+        """
+        Return a function of a mask of flags whether a region belongs to every Set,
+        bits of which are given by bits, telling whether the region belongs to the expression.
+        """
+        raise NotImplementedError
+
+    def _contains(self, x: Scalar) -> bool:
+        raise NotImplementedError
+
+    def _leaves(self) -> list[Leaf]:
+        raise NotImplementedError
+
+    def simplify(self) -> Expression:
+        """
+        Return an equivalent expression in normal form:
+        complements apply only to Sets, nested operations of the same kind are flattened,
+        and every Set appears in a single Leaf.
+        """
+        return self._normalized({})
+
+    def _cuts(self, stream: bool = False):
+        """
+        Yield cuts of the resulting Set, sweeping all the Sets at once.
+
+        Flags whether the current region belongs to every Set are bits of a mask,
+        and the value of the expression is computed once per distinct mask.
+        Cuts of all the Sets are gathered and sorted, which merges ascending runs
+        as in _depth_cuts(), or merged by a heap if stream is True, so that
+        the caller may stop early without going through all the cuts.
+        """
+        expr = self.simplify()
+        leaves = expr._leaves()
+        bits = {id(leaf.set): 1 << i for i, leaf in enumerate(leaves)}
+        table = _Table(expr._compile(bits))
+        runs = [zip(_iter_cuts(leaf.set.pieces), itertools.repeat(bits[id(leaf.set)]))
+                for leaf in leaves]
+
+        if stream:
+            events = heapq.merge(*runs, key=operator.itemgetter(0))
+        else:
+            events = [event for run in runs for event in run]
+            events.sort(key=operator.itemgetter(0))
+
+        # Several Sets may cut the axis at the same place, and the value may change
+        # back and forth there. A cut is held until the next change of the value,
+        # and dropped if that happens at the same cut.
+        mask = 0
+        inside = table[0]
+        pending = _AXIS_START if inside else None
+
+        for cut, bit in events:
+            mask ^= bit
+            if table[mask] is not inside:
+                inside = not inside
+                if pending == cut:
+                    pending = None
+                else:
+                    if pending is not None:
+                        yield pending
+                    pending = cut
+
+        if inside:
+            if pending == _AXIS_END:
+                pending = None
+            else:
+                if pending is not None:
+                    yield pending
+                pending = _AXIS_END
+
+        if pending is not None:
+            yield pending
+
+    def evaluate(self) -> Set:
+        """Return a new Set, the value of the expression."""
+        return Set._from_normalized(_cuts_to_pieces(self._cuts()))
+
+    def __contains__(self, x: Interval|Scalar) -> bool:
+        """
+        x in self
+        Test whether the value of the expression contains scalar or Interval x.
+        A scalar is looked up in every Set by binary search, nothing is swept.
+        An Interval is contained if the sweep of Interval - self finds nothing.
+        """
+        if isinstance(x, Interval):
+            return not Leaf(Set([x])) - self
+        return self.simplify()._contains(x)
+
+    def __bool__(self) -> bool:
+        """Return True if the value of the expression is not empty."""
+        return next(self._cuts(stream=True), None) is not None
+
+    def isdisjoint(self, other: Expression|Set) -> bool:
+        """
+        Return True if the value of the expression has no common points with other.
+        Stops at the first common point found.
+        """
+        return not Intersection(self, _expression(other))
+
+
+class Leaf(Expression):
+    """A Set as an operand of an Expression."""
+
+    __slots__ = ('set',)
+
+    def __init__(self, s: Set) -> None:
+        if not isinstance(s, Set):
+            raise TypeError(f'Set required, not {type(s).__name__}')
+        self.set = s
+
+    def __repr__(self) -> str:
+        return 'Leaf(%r)' % self.set
+
+    def _normalized(self, leaves: dict[int, Leaf]) -> Expression:
+        return leaves.setdefault(id(self.set), self)
+
+    def _negated(self) -> Expression:
+        return Complement(self)
+
+    def _compile(self, bits: dict[int, int]) -> Callable[[int], bool]:
+        bit = bits[id(self.set)]
+        return lambda mask: mask & bit != 0
+
+    def _contains(self, x: Scalar) -> bool:
+        return x in self.set
+
+    def _leaves(self) -> list[Leaf]:
+        return [self]
+
+
+class Complement(Expression):
+    """Everything on the axis not in the operand."""
+
+    __slots__ = ('operand',)
+
+    def __init__(self, operand: Expression) -> None:
+        self.operand = operand
+
+    def __repr__(self) -> str:
+        return 'Complement(%r)' % self.operand
+
+    def _normalized(self, leaves: dict[int, Leaf]) -> Expression:
+        return self.operand._normalized(leaves)._negated()
+
+    def _negated(self) -> Expression:
+        # Normalized complement applies only to a Leaf.
+        return self.operand
+
+    def _compile(self, bits: dict[int, int]) -> Callable[[int], bool]:
+        fn = self.operand._compile(bits)
+        return lambda mask: not fn(mask)
+
+    def _contains(self, x: Scalar) -> bool:
+        return not self.operand._contains(x)
+
+    def _leaves(self) -> list[Leaf]:
+        return self.operand._leaves()
+
+
+class _NaryExpression(Expression):
+    """Base class of operations on any number of operands, whose results _combine() tells."""
+
+    __slots__ = ('operands',)
+
+    def __init__(self, *operands: Expression) -> None:
+        self.operands = operands
+
+    @staticmethod
+    def _combine(values: Iterable[bool]) -> bool:
+        """Return whether a point is in the expression, given whether it is in each operand."""
+        raise NotImplementedError
+
+    def _compile(self, bits: dict[int, int]) -> Callable[[int], bool]:
+        fns = [operand._compile(bits) for operand in self.operands]
+        combine = self._combine
+        return lambda mask: combine(fn(mask) for fn in fns)
+
+    def _contains(self, x: Scalar) -> bool:
+        return self._combine(operand._contains(x) for operand in self.operands)
+
+    def __repr__(self) -> str:
+        return '%s(%s)' % (type(self).__name__, ', '.join(map(repr, self.operands)))
+
+    def _normalized(self, leaves: dict[int, Leaf]) -> Expression:
+        operands = []
+        for operand in self.operands:
+            operand = operand._normalized(leaves)
+            if type(operand) is type(self):
+                operands += operand.operands
+            else:
+                operands.append(operand)
+        return operands[0] if len(operands) == 1 else type(self)(*operands)
+
+    def _leaves(self) -> list[Leaf]:
+        leaves = {}
+        for operand in self.operands:
+            for leaf in operand._leaves():
+                leaves.setdefault(id(leaf.set), leaf)
+        return list(leaves.values())
+
+
+class Union(_NaryExpression):
+    """Everything in any of the operands."""
+
+    __slots__ = ()
+
+    _combine = staticmethod(any)
+
+    def _negated(self) -> Expression:
+        return Intersection(*[operand._negated() for operand in self.operands])
+
+
+class Intersection(_NaryExpression):
+    """Everything in all of the operands."""
+
+    __slots__ = ()
+
+    _combine = staticmethod(all)
+
+    def _negated(self) -> Expression:
+        return Union(*[operand._negated() for operand in self.operands])
+
+
+class SymmetricDifference(_NaryExpression):
+    """Everything in an odd number of the operands."""
+
+    __slots__ = ()
+
+    @staticmethod
+    def _combine(values: Iterable[bool]) -> bool:
+        # In an odd number of the operands.
+        return functools.reduce(operator.xor, values)
+
+    def _negated(self) -> Expression:
+        first, *rest = self.operands
+        return SymmetricDifference(first._negated(), *rest)
+
+
+def lazy(s: Set) -> Leaf:
+    """
+    Return Set s as an operand of a lazy expression.
+    (lazy(a) | b) & ~lazy(c) - d builds no intermediate Sets, while in
+    (lazy(a) | b) & ~c - d, ~c - d is computed right away, as - binds tighter than &.
+    """
+    return Leaf(s)
+
+
+def _expression(obj: Expression|Set) -> Expression:
+    if isinstance(obj, Expression):
+        return obj
+    if isinstance(obj, Set):
+        return Leaf(obj)
+    raise TypeError(f'Set or Expression required, not {type(obj).__name__}')
@@ -0,0 +1,154 @@
+"""
+Batch membership tests of Set.contains_many(), vectorized with NumPy.
+NumPy is optional: _import_numpy() returns None if it is not installed.
+"""
+from __future__ import annotations
+import bisect
+from typing import Iterable
+
+from set_algebra.cuts import _BEFORE, _iter_cuts
+from set_algebra.infinity import Infinity, NegativeInfinity
+from set_algebra.interval import Interval
+
+
+Scalar = object # For type annotations
+
+
+def _import_numpy():
+    """Return numpy module, or None if it is not installed."""
+    try:
+        import numpy # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    return numpy
+
+
+# Integers of greater magnitude are not all exactly representable as float64.
+_FLOAT_EXACT_INT = 2 ** 53
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _is_exact(value, integer: bool) -> bool:
+    """Whether finite value is exactly represented as int64 if integer is True, else as float64."""
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        if integer:
+            return _INT64_MIN <= value <= _INT64_MAX
+        return -_FLOAT_EXACT_INT <= value <= _FLOAT_EXACT_INT
+    return not integer and isinstance(value, float)
+
+
+def _is_exact_float64(array, np) -> bool:
+    """Whether all values of a numeric array are represented exactly as float64."""
+    if array.dtype.kind == 'f':
+        return np.can_cast(array.dtype, np.float64)
+    return bool(((array >= -_FLOAT_EXACT_INT) & (array <= _FLOAT_EXACT_INT)).all())
+
+
+def _compile_numeric(pieces: list[Interval|Scalar], np, integer: bool):
+    """
+    Return 4 numpy arrays describing pieces:
+    left values, right values, whether left and right endpoints are closed.
+    Values are int64 if integer is True, otherwise float64.
+    Return None if a value of pieces is not represented exactly,
+    as comparisons with the arrays would then differ from those with pieces.
+    """
+    lefts = np.empty(len(pieces), dtype=np.int64 if integer else np.float64)
+    rights = np.empty_like(lefts)
+    left_closed = np.ones(len(pieces), dtype=bool)
+    right_closed = np.ones_like(left_closed)
+
+    if integer:
+        # Integers are never infinite, so infinities become the extreme int64 values, closed.
+        low, high = _INT64_MIN, _INT64_MAX
+    else:
+        low, high = float('-inf'), float('inf')
+
+    for i, p in enumerate(pieces):
+        if isinstance(p, Interval):
+            a, b = p.a, p.b
+            left, right = a.value, b.value
+            left_closed[i] = not a.open
+            right_closed[i] = not b.open
+        else:
+            left = right = p
+
+        if isinstance(left, NegativeInfinity):
+            lefts[i] = low
+            left_closed[i] = integer
+        elif _is_exact(left, integer):
+            lefts[i] = left
+        else:
+            return None
+
+        if isinstance(right, Infinity):
+            rights[i] = high
+            right_closed[i] = integer
+        elif _is_exact(right, integer):
+            rights[i] = right
+        else:
+            return None
+
+    return lefts, rights, left_closed, right_closed
+
+
+def _contains_numeric(index: tuple, x, np):
+    """Return boolean array of whether each of values x is in pieces described by index."""
+    lefts, rights, left_closed, right_closed = index
+    i = np.searchsorted(lefts, x, side='right') - 1
+    found = i >= 0
+    i[~found] = 0
+    lo = lefts[i]
+    hi = rights[i]
+
+    return found \
+        & ((x > lo) | ((x == lo) & left_closed[i])) \
+        & ((x < hi) | ((x == hi) & right_closed[i]))
+
+
+def contains_many(s, values: Iterable[Scalar], np):
+    """
+    Test every scalar of values for membership in Set s, see Set.contains_many().
+    np is numpy module, or None to look up values one by one.
+    """
+    if np is not None:
+        array = np.asarray(values)
+        kind = array.dtype.kind
+
+        if kind in 'iuf' and not s.pieces:
+            return np.zeros(array.shape, dtype=bool)
+
+        # Arrays describing pieces, and values x converted to their type.
+        index = x = None
+        if kind in 'iu' and np.can_cast(array.dtype, np.int64):
+            x = array.astype(np.int64, copy=False)
+            index = s._numeric_arrays(np, True)
+        if index is None and kind in 'iuf' and _is_exact_float64(array, np):
+            x = array.astype(float, copy=False)
+            index = s._numeric_arrays(np, False)
+
+        if index is not None:
+            # A single value (0-d array) is looked up as an array of one.
+            return _contains_numeric(index, np.atleast_1d(x), np).reshape(array.shape)
+
+        if kind in 'iuf':
+            # Python numbers, compared exactly.
+            values = array.ravel().tolist()
+
+    cuts = list(_iter_cuts(s.pieces))
+    starts = cuts[::2]
+    ends = cuts[1::2]
+    result = []
+
+    for x in values:
+        cut = (x, _BEFORE)
+        i = bisect.bisect_right(starts, cut) - 1
+        result.append(i >= 0 and cut < ends[i])
+
+    if np is not None:
+        result = np.array(result, dtype=bool)
+        return result.reshape(array.shape) if kind in 'iuf' else result
+
+    return result
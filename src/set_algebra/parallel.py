@@ -0,0 +1,237 @@
+"""
+Set operations on large Sets of real numbers, computed by a pool of processes.
+
+The axis is split into partitions at Endpoint boundaries, pieces of both
+operands overlapping every partition are sent to a worker, which clips them
+to the partition and merges them, and the results are joined back, pieces
+touching at the boundaries being coalesced.
+
+Pieces travel between processes in the binary format of set_algebra.binary,
+17 bytes per piece, rather than as pickled Intervals and Endpoints.
+Operands are Sets or CompactSets of real numbers, and the result is of the
+type of the first operand. Building Intervals of a Set result is done by
+the calling process, so CompactSets benefit the most.
+
+>>> from set_algebra import Endpoint, Set
+>>> a = Set('[0, 10), [20, 30)')
+>>> b = Set('[5, 25]')
+>>> union(a, b, boundaries=[Endpoint('[7'), Endpoint('22]')], executor=serial)
+Set([Interval('[0.0, 30.0)')])
+"""
+from __future__ import annotations
+from array import array
+import bisect
+import concurrent.futures
+import operator
+import os
+from typing import Iterable
+
+from set_algebra import binary
+from set_algebra.binary import LEFT_OPEN, RIGHT_OPEN
+from set_algebra.compact import CompactSet
+from set_algebra.cuts import _AXIS_END, _AXIS_START, _cuts_to_pieces, _difference_op, _iter_cuts, \
+    _merge_cuts
+from set_algebra.endpoint import Endpoint
+from set_algebra.set_ import Set
+
+
+Operand = Set | CompactSet # For type annotations
+
+# Partitions are chosen by default so that each of them has at least that many pieces.
+MIN_PARTITION_PIECES = 50000
+
+
+class _SerialExecutor(concurrent.futures.Executor):
+    """Executor running every call in the calling thread, for testing and debugging."""
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = concurrent.futures.Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e: # pylint: disable=broad-exception-caught
+            future.set_exception(e)
+        return future
+
+
+serial = _SerialExecutor()
+
+
+def _arrays(s: Operand) -> tuple:
+    """Return arrays of left values, right values and flags of pieces of s."""
+    if isinstance(s, CompactSet):
+        return s.lefts, s.rights, s.flags
+    return binary.arrays_from_cuts(_iter_cuts(s.pieces))
+
+
+def _endpoint_cut(e: Endpoint) -> tuple[float, bool]:
+    """Return cut of the axis made by Endpoint e, see set_algebra.set_."""
+    return binary.to_float(e.value), e.open is not e.right
+
+
+def _default_boundaries(lefts, flags, partitions: int) -> list[tuple[float, bool]]:
+    """Return cuts at the starts of pieces splitting them into partitions of equal size."""
+    n = len(lefts)
+    cuts = []
+    if not n:
+        return cuts
+    for i in range(1, partitions):
+        k = i * n // partitions
+        cuts.append((lefts[k], bool(flags[k] & LEFT_OPEN)))
+    return cuts
+
+
+def _index_range(arrays: tuple, start: tuple, end: tuple) -> tuple[int, int]:
+    """Return range of indices of pieces that end after cut start and start before cut end."""
+    lefts, rights, flags = arrays
+    indices = range(len(lefts))
+    lo = bisect.bisect_right(indices, start, key=lambda i: (rights[i], not flags[i] & RIGHT_OPEN))
+    hi = bisect.bisect_left(indices, end, lo, key=lambda i: (lefts[i], bool(flags[i] & LEFT_OPEN)))
+    return lo, hi
+
+
+def _clipped_cuts(buf: bytes, start: tuple, end: tuple) -> list[tuple[float, bool]]:
+    """
+    Return cuts of pieces in binary format, clipped to cuts start and end.
+    Pieces are those overlapping the partition,
+    so only the first and the last cuts may be beyond it.
+    """
+    cuts = list(binary.iter_cuts(*binary.loads(buf)))
+    if cuts:
+        cuts[0] = max(cuts[0], start)
+        cuts[-1] = min(cuts[-1], end)
+    return cuts
+
+
+def _merge_partition(start: tuple, end: tuple, buf1: bytes, buf2: bytes, op) -> bytes:
+    """Worker: merge pieces of two operands in binary format clipped to cuts start and end."""
+    cuts1 = _clipped_cuts(buf1, start, end)
+    cuts2 = _clipped_cuts(buf2, start, end)
+    return binary.dumps(*binary.arrays_from_cuts(_merge_cuts(cuts1, cuts2, op)))
+
+
+def _join(bufs: Iterable[bytes]) -> tuple[array, array, array]:
+    """Join results of partitions, coalescing pieces touching at the boundaries."""
+    lefts = array('d')
+    rights = array('d')
+    flags = array('B')
+
+    for buf in bufs:
+        part_lefts, part_rights, part_flags = binary.loads(buf)
+        if not part_lefts:
+            continue
+
+        if lefts and rights[-1] == part_lefts[0] \
+           and (not flags[-1] & RIGHT_OPEN) is bool(part_flags[0] & LEFT_OPEN):
+            # Pieces share a cut at the boundary.
+            rights[-1] = part_rights[0]
+            flags[-1] = flags[-1] & LEFT_OPEN | part_flags[0] & RIGHT_OPEN
+            part_lefts, part_rights, part_flags = part_lefts[1:], part_rights[1:], part_flags[1:]
+
+        lefts.frombytes(memoryview(part_lefts).cast('B'))
+        rights.frombytes(memoryview(part_rights).cast('B'))
+        flags.frombytes(memoryview(part_flags).cast('B'))
+
+    return lefts, rights, flags
+
+
+def _partition_cuts(arrays1: tuple, arrays2: tuple, boundaries: Iterable[Endpoint]|None,
+                    partitions: int|None) -> list[tuple[float, bool]]:
+    """Return ascending cuts at the boundaries, or splitting pieces of the larger operand."""
+    if boundaries is not None:
+        return sorted(set(map(_endpoint_cut, boundaries)))
+
+    lefts, _, flags = max(arrays1, arrays2, key=lambda arrays: len(arrays[0]))
+    if partitions is None:
+        partitions = min(os.cpu_count() or 1, len(lefts) // MIN_PARTITION_PIECES)
+    return sorted(set(_default_boundaries(lefts, flags, partitions)))
+
+
+def _tasks(arrays1: tuple, arrays2: tuple, cuts: list, op) -> list[tuple]:
+    """Return arguments of _merge_partition() for every partition between the cuts."""
+    bounds = [(float('-inf'), _AXIS_START[1]), *cuts, (float('inf'), _AXIS_END[1])]
+    tasks = []
+    for start, end in zip(bounds, bounds[1:]):
+        bufs = []
+        for arrays in arrays1, arrays2:
+            lo, hi = _index_range(arrays, start, end)
+            bufs.append(binary.dumps(*(x[lo:hi] for x in arrays)))
+        tasks.append((start, end, *bufs, op))
+    return tasks
+
+
+def _map(tasks: list[tuple], executor: concurrent.futures.Executor|None) -> list[bytes]:
+    """Return results of _merge_partition() for the tasks."""
+    if len(tasks) == 1:
+        # A single partition is merged right away by the calling process.
+        return [_merge_partition(*tasks[0])]
+
+    if executor is None:
+        # No more processes than CPUs, however many partitions there are.
+        workers = min(len(tasks), os.cpu_count() or 1)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_merge_partition, *zip(*tasks)))
+
+    return list(executor.map(_merge_partition, *zip(*tasks)))
+
+
+def _run(op, operands: tuple[Operand, Operand], boundaries: Iterable[Endpoint]|None,
+         partitions: int|None, executor: concurrent.futures.Executor|None) -> Operand:
+    """Compute operation in partitions. op is a function of two booleans, see _merge_cuts."""
+    a, b = operands
+    if not isinstance(a, (Set, CompactSet)) or not isinstance(b, (Set, CompactSet)):
+        raise TypeError('Sets or CompactSets required, '
+                        f'not {type(a).__name__} and {type(b).__name__}')
+
+    # Both operands are converted on every path, so that the result does not depend
+    # on the number of partitions.
+    arrays1 = _arrays(a)
+    arrays2 = _arrays(b)
+    cuts = _partition_cuts(arrays1, arrays2, boundaries, partitions)
+    lefts, rights, flags = _join(_map(_tasks(arrays1, arrays2, cuts, op), executor))
+
+    if isinstance(a, CompactSet):
+        new = type(a).__new__(type(a))
+        new.lefts, new.rights, new.flags = lefts, rights, flags
+        return new
+
+    cuts = binary.iter_cuts(lefts, rights, flags)
+    return type(a)._from_normalized(_cuts_to_pieces(
+        (binary.from_float(value), side) for value, side in cuts))
+
+
+def union(a: Operand, b: Operand, *, boundaries: Iterable[Endpoint]|None = None,
+          partitions: int|None = None, executor: concurrent.futures.Executor|None = None
+          ) -> Operand:
+    """
+    Return a | b computed in partitions by a pool of processes.
+
+    The axis is split at boundaries, Endpoints, if given, otherwise into
+    partitions holding equal numbers of pieces of the larger operand;
+    by default, one per CPU, but no more than one per MIN_PARTITION_PIECES pieces.
+    A single partition is computed by the calling process. Otherwise, partitions
+    are computed by executor, a ProcessPoolExecutor started for the call if not given.
+    Reusing an executor saves starting processes.
+    Values of pieces of the result are floats, as in CompactSet, however many partitions there are.
+    """
+    return _run(operator.or_, (a, b), boundaries, partitions, executor)
+
+
+def intersection(a: Operand, b: Operand, *, boundaries: Iterable[Endpoint]|None = None,
+                 partitions: int|None = None, executor: concurrent.futures.Executor|None = None
+                 ) -> Operand:
+    """Return a & b computed in partitions by a pool of processes, see union()."""
+    return _run(operator.and_, (a, b), boundaries, partitions, executor)
+
+
+def difference(a: Operand, b: Operand, *, boundaries: Iterable[Endpoint]|None = None,
+               partitions: int|None = None, executor: concurrent.futures.Executor|None = None
+               ) -> Operand:
+    """Return a - b computed in partitions by a pool of processes, see union()."""
+    return _run(_difference_op, (a, b), boundaries, partitions, executor)
+
+
+def symmetric_difference(a: Operand, b: Operand, *, boundaries: Iterable[Endpoint]|None = None,
+                         partitions: int|None = None,
+                         executor: concurrent.futures.Executor|None = None) -> Operand:
+    """Return a ^ b computed in partitions by a pool of processes, see union()."""
+    return _run(operator.xor, (a, b), boundaries, partitions, executor)
@@ -1,3 +1,6 @@
+import math
+import re
+
 from set_algebra.infinity import Infinity, NegativeInfinity, inf, neg_inf
 
 
@@ -12,8 +15,10 @@ def parse_value(value_str: str) -> int | float | Infinity | NegativeInfinity:
         classname = type(value_str).__name__
         raise TypeError(f'value_str must be a string, not {classname}')
 
-    value_str = value_str.strip()
+    return _parse_stripped_value(value_str.strip())
+
 
+def _parse_stripped_value(value_str: str) -> int | float | Infinity | NegativeInfinity:
     if value_str.isdigit() or (value_str.startswith('-') and value_str[1:].isdigit()):
         value = int(value_str)
     elif value_str in ('-inf', 'neg_inf'):
@@ -26,6 +31,11 @@ def parse_value(value_str: str) -> int | float | Infinity | NegativeInfinity:
     return value
 
 
+def _is_finite_value(value: int | float | Infinity | NegativeInfinity) -> bool:
+    """Faster is_finite() for values returned by parse_value()."""
+    return type(value) is int or type(value) is float and math.isfinite(value)
+
+
 BOUNDS_TO_OPEN_LEFT_MAPPING = {
     '[': (False, True),
     '(': (True, True),
@@ -50,7 +60,8 @@ def parse_bound(bound: str) -> tuple[bool, bool]:
         raise ValueError(f'bound must be one of [](), not {bound}') from None
 
 
-def parse_endpoint_notation(notation: str) -> tuple[int|float|Infinity|NegativeInfinity, bool, bool]:
+def parse_endpoint_notation(notation: str
+                            ) -> tuple[int|float|Infinity|NegativeInfinity, bool, bool]:
     """
     Parse string representing Endpoint (endpoint notation).
 
@@ -90,3 +101,93 @@ def parse_endpoint_notation(notation: str) -> tuple[int|float|Infinity|NegativeI
     value = parse_value(value_str)
 
     return value, open_, left
+
+
+# A value is anything up to the next bound, brace or comma;
+# _parse_stripped_value() decides whether it is a number.
+_VALUE = r'\s*([^\s\[\](){},]+)\s*'
+
+# One piece of Set notation, either {scalar} or interval, with the following comma if any.
+_PIECE = re.compile(
+    r'\s*(?:\{%s\}|([\[(])%s,%s([\])]))\s*(,?)' % (_VALUE, _VALUE, _VALUE))
+
+
+def parse_set_notation(notation: str, validate: bool = True) -> list[tuple]:
+    """
+    Parse string representing Set (Set notation) in a single pass.
+
+    Returns list of pieces, each being a tuple of 4 elements:
+        (a_value, a_bound, b_value, b_bound) for interval,
+        (value, '{', value, '}') for scalar.
+    Raises ValueError for invalid notation.
+
+    If validate is True (default), also raises ValueError if an interval is
+    reversed, a closed bound or a scalar is infinite, or pieces are not
+    in ascending order with gaps between them.
+
+    >>> parse_set_notation('[1, 2.5), {4}, (5, inf)')
+    [(1, '[', 2.5, ')'), (4, '{', 4, '}'), (5, '(', inf, ')')]
+    """
+    if not isinstance(notation, str):
+        classname = type(notation).__name__
+        raise TypeError(f'notation must be a string, not {classname}')
+
+    pieces = []
+    append = pieces.append
+    match = _PIECE.match
+    parse = _parse_stripped_value
+    is_finite = _is_finite_value
+    end = len(notation)
+    pos = 0
+
+    # Pieces are checked as cuts (value, side), see set_algebra.set_;
+    # prev is the cut where the previous piece ends.
+    prev = None
+
+    while True:
+        m = match(notation, pos)
+        if m is None or m.end() == pos:
+            raise ValueError('Invalid notation at position %d' % pos)
+
+        scalar_str, a_bound, a_str, b_str, b_bound, comma = m.groups()
+        # Cuts where the piece starts and stops, found only if validate is True.
+        start = stop = None
+
+        if scalar_str is not None:
+            value = parse(scalar_str)
+            piece = (value, '{', value, '}')
+            if validate:
+                if not is_finite(value):
+                    raise ValueError('scalar %s must be finite' % scalar_str)
+                start = (value, False)
+                stop = (value, True)
+        else:
+            a = parse(a_str)
+            b = parse(b_str)
+            piece = (a, a_bound, b, b_bound)
+            if validate:
+                if a_bound == '[' and not is_finite(a) or b_bound == ']' and not is_finite(b):
+                    raise ValueError('closed bound of %s%s, %s%s cannot be infinite'
+                                     % (a_bound, a_str, b_str, b_bound))
+                if a > b:
+                    raise ValueError('%s%s, %s%s: left value is greater than the right one'
+                                     % (a_bound, a_str, b_str, b_bound))
+                start = (a, a_bound == '(')
+                stop = (b, b_bound == ']')
+
+        if validate:
+            if prev is not None and not prev < start:
+                raise ValueError('pieces must be ascending with gaps between them, '
+                                 'see position %d' % pos)
+            prev = stop
+
+        append(piece)
+        pos = m.end()
+
+        if not comma:
+            break
+
+    if pos != end:
+        raise ValueError('Invalid notation at position %d' % pos)
+
+    return pieces
@@ -0,0 +1,154 @@
+from __future__ import annotations
+from typing import Iterable
+
+from set_algebra.chunked import ChunkedList, ChunkedSet
+from set_algebra.set_ import _SPLICE_LIMIT, Set
+
+
+class PersistentList(ChunkedList):
+    """
+    ChunkedList sharing its chunks with its copies.
+
+    copy() is O(1): the copy refers to the same list of chunks.
+    Chunks are copied on write, one at a time, so a change to a list
+    of n items copies the list of chunks, O(n/LOAD) pointers, and the
+    chunks being changed, while all the other chunks stay shared.
+
+    A list may change a chunk in place only if it has created or copied
+    that chunk itself since it was last copied, which is tracked by ids
+    of the chunks it owns.
+    """
+
+    __slots__ = ('_owned', '_owns_chunks_list')
+
+    def _reset(self, items: list) -> None:
+        super()._reset(items)
+        self._owned = {id(chunk) for chunk in self._chunks}
+        self._owns_chunks_list = True
+
+    def _own_chunks_list(self) -> None:
+        if not self._owns_chunks_list:
+            self._chunks = list(self._chunks)
+            self._tree = list(self._tree)
+            self._owns_chunks_list = True
+
+    def _own_chunk(self, ci: int) -> list:
+        """Return chunk ci, copying it first unless it is owned."""
+        chunk = self._chunks[ci]
+        if id(chunk) not in self._owned:
+            chunk = self._chunks[ci] = list(chunk)
+            self._owned.add(id(chunk))
+        return chunk
+
+    def __setitem__(self, index: int|slice, value) -> None:
+        if isinstance(index, slice):
+            super().__setitem__(index, value)
+            return
+
+        self._own_chunks_list()
+        ci, k = self._locate(self._normalize_index(index))
+        self._own_chunk(ci)[k] = value
+
+    def _replace(self, start: int, stop: int, items: list) -> None:
+        if self._chunks:
+            self._own_chunks_list()
+            # Own the chunks ChunkedList._replace() changes in place.
+            if start == self._len:
+                first = last = len(self._chunks) - 1
+            else:
+                first = self._locate(start)[0]
+                last = self._locate(stop - 1)[0] if stop > start else first
+            for ci in range(first, last + 1):
+                self._own_chunk(ci)
+
+        super()._replace(start, stop, items)
+
+    def _rechunk(self, lo: int, hi: int) -> None:
+        # ChunkedList._rechunk() replaces chunks in lo:hi and their neighbours with new lists.
+        chunks = self._chunks
+        n = len(chunks)
+        first = max(0, lo - 1)
+        stop = min(n, hi + 1)
+        self._owned.difference_update(id(chunk) for chunk in chunks[first:stop])
+
+        super()._rechunk(lo, hi)
+
+        stop += len(chunks) - n
+        self._owned.update(id(chunk) for chunk in chunks[first:stop])
+
+    def copy(self) -> PersistentList:
+        """Return a copy sharing all the chunks with the list, in O(1)."""
+        new = type(self).__new__(type(self))
+        new._chunks = self._chunks
+        new._tree = self._tree
+        new._len = self._len
+        new._owned = set()
+        new._owns_chunks_list = False
+        self._owned = set()
+        self._owns_chunks_list = False
+        return new
+
+
+class PersistentSet(ChunkedSet):
+    """
+    ChunkedSet whose copies share pieces with it.
+
+    copy() is O(1), and changing a copy or the original copies only
+    the chunks of pieces being changed, see PersistentList.
+    This suits keeping many versions of a large Set, e.g. a snapshot per request.
+    Pieces are never changed in place, only replaced, so Intervals are shared as well.
+
+    | and - with a Set of few pieces return a changed copy rather than
+    merging all the pieces, in O(k log n) for k pieces of the other Set.
+
+    >>> base = PersistentSet('[0, 10], [20, 30]')
+    >>> version = base.copy()
+    >>> version.remove(5)
+    >>> version.pieces[-1] is base.pieces[-1]
+    True
+    >>> base
+    PersistentSet([Interval('[0, 10]'), Interval('[20, 30]')])
+    """
+    container = PersistentList
+
+    def copy(self) -> PersistentSet:
+        """Return a copy of the Set in O(1), sharing pieces and chunks of them with the Set."""
+        new = type(self)._from_normalized(self.pieces.copy())
+        # Prefix sums of lengths and numeric arrays are never changed, only dropped.
+        new._measure_index = self._measure_index
+        new._numeric_index = self._numeric_index
+        return new
+
+    def __or__(self, other: Set) -> PersistentSet:
+        """
+        self | other
+        Return a new Set that is a union of the Set and the other.
+        """
+        if isinstance(other, Set) and len(other.pieces) <= _SPLICE_LIMIT:
+            new = self.copy()
+            new |= other
+            return new
+        return super().__or__(other)
+
+    def __sub__(self, other: Set) -> PersistentSet:
+        """
+        self - other
+        Return a new Set with everything that is in the Set but not in the other.
+        """
+        if isinstance(other, Set) and len(other.pieces) <= _SPLICE_LIMIT:
+            new = self.copy()
+            new -= other
+            return new
+        return super().__sub__(other)
+
+    def union(self, *others: Set | Iterable) -> PersistentSet:
+        """Return a new Set that is a union with the Set and all the others."""
+        if len(others) == 1 and isinstance(others[0], Set):
+            return self | others[0]
+        return super().union(*others)
+
+    def difference(self, *others: Set | Iterable) -> PersistentSet:
+        """Return a new Set with everything that is in the Set but not in any of the others."""
+        if len(others) == 1 and isinstance(others[0], Set):
+            return self - others[0]
+        return super().difference(*others)
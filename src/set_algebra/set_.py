@@ -1,12 +1,21 @@
 from __future__ import annotations
+import bisect
 import functools
+import operator
 from types import NotImplementedType
-from typing import Iterable
+from typing import Iterable, Iterator
 
+from set_algebra import binary, numeric, splice
+from set_algebra.cuts import (_AFTER, _AXIS_END, _AXIS_START, _BEFORE, _coalesce, _cuts_to_pieces,
+    _depth_cuts, _difference_op, _end_cut, _iter_cuts, _merge_pieces, _piece_from_cuts, _span,
+    _start_cut, _threshold_cuts)
 from set_algebra.infinity import is_finite, inf, neg_inf
-from set_algebra.endpoint import Endpoint, are_bounding
+from set_algebra.endpoint import Endpoint
 from set_algebra.interval import Interval, is_interval, unbounded
-from set_algebra.parser import parse_value
+from set_algebra.numeric import _compile_numeric, _import_numpy
+from set_algebra.parser import parse_set_notation
+from set_algebra.splice import _search
+from set_algebra.validation import check_pieces
 
 
 Scalar = object # For type annotations
@@ -15,54 +24,70 @@ def _assert_pieces_are_ascending(fn):
     """
     Debug decorator for Set methods.
     Makes sure pieces are sorted in ascending order and do not intersect.
+    Whether and how thoroughly it is checked depends on the validation mode,
+    see set_algebra.validation.
     """
     @functools.wraps(fn)
     def wrapper(self, *args, **kwargs):
         result = fn(self, *args, **kwargs)
-        err_tpl = None
-
-        for i, cur in enumerate(self.pieces[:-1]):
-            nex = self.pieces[i+1]
-
-            if isinstance(cur, Interval):
-                if isinstance(nex, Interval):
-                    if cur.b >= nex.a:
-                        err_tpl = '%s >= %s in Set %s'
-                        err_format_args = (cur.b.notation, nex.a.notation, self.notation)
-                    elif are_bounding(cur.b, nex.a):
-                        err_tpl = 'no gap between %s and %s! in Set %s'
-                        err_format_args = (cur.b.notation, nex.a.notation, self.notation)
-                else:
-                    if cur.b >= nex:
-                        err_tpl = '%s >= %s in Set %s'
-                        err_format_args = (cur, nex, self.notation)
-                    elif cur.b.value == nex:
-                        err_tpl = 'no gap between %s and %s! in Set %s'
-                        err_format_args = (cur.b.notation, nex, self.notation)
-            else:
-                if isinstance(nex, Interval):
-                    if cur >= nex.a:
-                        err_tpl = '%s >= %s in Set %s'
-                        err_format_args = (cur, nex.a.notation, self.notation)
-                    elif cur == nex.a.value:
-                        err_tpl = 'no gap between %s and %s! in Set %s'
-                        err_format_args = (cur, nex.a.notation, self.notation)
-                else:
-                    if cur >= nex:
-                        err_tpl = '%s >= %s in Set %s'
-                        err_format_args = (cur, nex, self.notation)
-            if err_tpl:
-                raise AssertionError(err_tpl % err_format_args) # pylint: disable=used-before-assignment
-
+        check_pieces(self.pieces)
         return result
 
     return wrapper
 
 
 def _copy_pieces(pieces):
+    # Set algorithms replace pieces rather than change them, so copies guard only against
+    # changes made by the caller. FrozenIntervals cannot be changed and are shared;
+    # mutable Intervals, including those built by Set operations, are always copied.
     return [p.copy() if is_interval(p) else p for p in pieces]
 
 
+def _pieces_equal(pieces1, pieces2) -> bool:
+    """Compare pieces kept in sequences of possibly different types."""
+    if type(pieces1) is type(pieces2):
+        return pieces1 == pieces2
+    return len(pieces1) == len(pieces2) and all(map(operator.eq, pieces1, pieces2))
+
+
+def _clipped_length(p: Interval|Scalar, a: Scalar, b: Scalar):
+    """Return length of Interval p within values a and b, or None for a scalar."""
+    if not isinstance(p, Interval):
+        return None
+
+    start = max(p.a.value, a)
+    end = min(p.b.value, b)
+    if not is_finite(start) or not is_finite(end):
+        return inf
+
+    return end - start
+
+
+def _pieces_from_notation(notation: str, validate: bool) -> list[Interval|Scalar]:
+    """Build pieces from Set notation, see set_algebra.parser.parse_set_notation."""
+    pieces = []
+    append = pieces.append
+    make_interval = Interval._make
+    make_endpoint = Endpoint._make
+
+    for a_value, a_bound, b_value, b_bound in parse_set_notation(notation, validate):
+        if a_bound == '{':
+            append(a_value)
+        else:
+            a_open = a_bound == '('
+            b_open = b_bound == ')'
+            a = make_endpoint(a_value, a_open, True)
+            b = make_endpoint(b_value, b_open, False)
+            append(make_interval(a, b))
+
+    return pieces
+
+
+# In-place union and difference splice pieces of the other Set one by one
+# if it has at most that many pieces, otherwise both Sets are swept at once.
+_SPLICE_LIMIT = 64
+
+
 class Set:
     """
     Uncountable Infinite Set
@@ -81,51 +106,32 @@ class Set:
     For example, any two nonempty disjoint Sets are not equal and are not subsets of each other,
     so all of the following return False: a < b, a == b, or a > b.
 
-    Note, the non-operator versions of union(), intersection(), intersection_update(), difference(), difference_update(), symmetric_difference(), symmetric_difference_update(), issubset() and issuperset() methods will accept iterable of scalars and/or intervals as an argument.
+    Note, the non-operator versions of union(), intersection(), intersection_update(),
+    difference(), difference_update(), symmetric_difference(), symmetric_difference_update(),
+    issubset() and issuperset() methods will accept iterable of scalars and/or intervals
+    as an argument.
     In contrast, their operator based counterparts require their arguments to be Sets.
 
     In boolean context Set is True if it is not empty and False if it is empty.
+
+    Pieces are kept in a sequence of type container, list by default.
+    A subclass may set it to any mutable sequence supporting list-style indexing,
+    slice assignment and insert(), e.g. ChunkedList for Sets of many pieces.
     """
 
-    def __init_from_notation(self, notation: str):
+    container: type = list
 
-        a = None
-        for part in notation.split(','):
-            part = part.strip()
+    @property
+    def pieces(self):
+        return self._pieces
 
-            if part.startswith('{') and part.endswith('}'):
-                scalar = parse_value(part[1:-1])
-                if not is_finite(scalar):
-                    raise ValueError('scalar %s must be finite' % scalar)
-                if self.pieces:
-                    pre = self.pieces[-1]
-                    if isinstance(pre, Interval):
-                        pre = pre.b.value
-                    if pre >= scalar:
-                        raise ValueError('%s >= %s!' % (pre, scalar))
-                self.pieces.append(scalar)
-
-            else:
-                endpoint = Endpoint(part)
-                if a is None:
-                    a = endpoint
-                else:
-                    interval = Interval(a, endpoint)
-                    if self.pieces:
-                        pre = self.pieces[-1]
-                        if isinstance(pre, Interval):
-                            if pre.b > interval.a:
-                                raise ValueError('%s > %s!' % (pre.b, interval.a))
-                            if are_bounding(pre.b, interval.a):
-                                raise ValueError('%s and %s have no gap!' % (pre.b, interval.a))
-                        else:
-                            if pre >= interval.a.value:
-                                raise ValueError('%s >= %s!' % (pre, interval.a))
-                    self.pieces.append(interval)
-                    a = None
-
-        if a is not None:
-            raise ValueError('Invalid notation')
+    @pieces.setter
+    def pieces(self, pieces: Iterable[Interval|Scalar]) -> None:
+        if type(pieces) is not self.container:
+            pieces = self.container(pieces)
+        self._pieces = pieces
+        self._measure_index = None
+        self._numeric_index = None
 
     @_assert_pieces_are_ascending
     def __init__(self, arg: str | Iterable[Interval|Scalar] | Set | None = None):
@@ -133,23 +139,109 @@ class Set:
         if isinstance(arg, Set):
             # Init from Set
             # TODO: "arg" is unclear signature
-            self.pieces = _copy_pieces(arg.pieces)
-            return
-
-        self.pieces = []
+            pieces = _copy_pieces(arg.pieces)
 
-        if arg is None:
+        elif arg is None:
             # Init empty Set from None
-            return
+            pieces = []
 
-        if isinstance(arg, str):
+        elif isinstance(arg, str):
             # Init from notation string
-            self.__init_from_notation(arg)
+            pieces = _pieces_from_notation(arg, validate=True)
 
         else:
             # Init from iterable of intervals and/or scalars.
-            for p in arg:
-                self.add(p)
+            pieces = _coalesce(arg)
+
+        self.pieces = pieces
+
+    @classmethod
+    def _from_normalized(cls, pieces: list[Interval|Scalar]) -> Set:
+        """
+        Return a new instance with the pieces, bypassing __init__.
+        Pieces must be ascending with gaps between them and not shared with any other Set.
+        """
+        new = cls.__new__(cls)
+        new.pieces = pieces
+        return new
+
+    @classmethod
+    def from_pieces(cls, pieces: Iterable[Interval|Scalar], presorted: bool = False) -> Set:
+        """
+        Return a new Set containing all the pieces (intervals and/or scalars).
+        Pieces are sorted once and merged in a single pass, in O(n log n).
+        If presorted is True, pieces must already be sorted by their left side
+        (they may still overlap or touch), and sorting is skipped.
+        """
+        return cls._from_normalized(_coalesce(pieces, presorted))
+
+    @classmethod
+    def from_notation(cls, notation: str, validate: bool = True) -> Set:
+        """
+        Return a new Set from notation string, e.g. '[1, 2], {3}, [5, inf)'.
+        Same as Set(notation), but validation can be skipped for trusted input:
+        if validate is False, pieces are not checked to be finite where closed,
+        ascending and separated by gaps, and building an invalid Set is
+        the caller's responsibility.
+        """
+        return cls._from_normalized(_pieces_from_notation(notation, validate))
+
+    @classmethod
+    def union_all(cls, sets: Iterable[Set | Iterable[Interval|Scalar]]) -> Set:
+        """
+        Return a new Set that is a union of all the sets.
+        Pieces of all the sets are merged at once in O(N log k)
+        for N pieces in k sets, instead of folding the sets one by one.
+        Items that are not Sets are iterables of pieces, see Set.__init__.
+        """
+        sets = [s if isinstance(s, Set) else Set(s) for s in sets]
+        cuts = _threshold_cuts(_depth_cuts([_iter_cuts(s.pieces) for s in sets]), 1)
+        return cls._from_normalized(_cuts_to_pieces(cuts))
+
+    @classmethod
+    def intersection_all(cls, sets: Iterable[Set | Iterable[Interval|Scalar]]) -> Set:
+        """
+        Return a new Set that is an intersection of all the sets.
+        Raise ValueError if there are no sets, as their intersection is undefined.
+
+        Unlike union, an intersection never grows, so the sets are merged
+        one by one starting from the smallest, in O(N) for N pieces in all the sets,
+        and merging stops as soon as the intersection is empty.
+        """
+        sets = [s if isinstance(s, Set) else Set(s) for s in sets]
+        if not sets:
+            raise ValueError('intersection_all() requires at least one Set')
+
+        sets.sort(key=lambda s: len(s.pieces))
+        pieces = _copy_pieces(sets[0].pieces)
+        for s in sets[1:]:
+            if not pieces:
+                break
+            pieces = _merge_pieces(pieces, s.pieces, operator.and_)
+
+        return cls._from_normalized(pieces)
+
+    def to_bytes(self) -> bytes:
+        """
+        Return the Set in binary format, see set_algebra.binary.
+        Only Sets of real numbers are supported, values are stored as float64.
+        """
+        return binary.dumps(*binary.arrays_from_cuts(_iter_cuts(self.pieces)))
+
+    @classmethod
+    def from_buffer(cls, buf, validate: bool = True) -> Set:
+        """
+        Return a new Set from data in binary format, see set_algebra.binary.
+        buf is any object supporting the buffer protocol: bytes, bytearray, mmap, memoryview.
+        Numbers are read from buf in place, without copying it first.
+        If validate is True (default), raise ValueError if the data does not
+        describe a valid Set, e.g. pieces overlap or are not ascending.
+        """
+        arrays = binary.loads(buf)
+        if validate:
+            binary.check(*arrays)
+        cuts = ((binary.from_float(value), side) for value, side in binary.iter_cuts(*arrays))
+        return cls._from_normalized(_cuts_to_pieces(cuts))
 
     def __repr__(self) -> str:
         return '%s(%s)' % (type(self).__name__, self.pieces)
@@ -165,6 +257,107 @@ class Set:
 
         return ', '.join(chunks)
 
+    def bounds(self) -> Interval|None:
+        """
+        Return the smallest Interval containing the Set, or None if the Set is empty.
+        A Set of a single scalar x is bounded by the degenerate interval [x, x].
+        """
+        pieces = self.pieces
+        if not pieces:
+            return None
+
+        first = pieces[0]
+        last = pieces[-1]
+        a = first.a.copy() if isinstance(first, Interval) else Endpoint._make(first, False, True)
+        b = last.b.copy() if isinstance(last, Interval) else Endpoint._make(last, False, False)
+
+        return Interval._make(a, b)
+
+    def _measure_prefix(self) -> list:
+        """
+        Return prefix sums of lengths of pieces: item i is the total length of pieces[:i].
+        Scalars and unbounded intervals count as zero length.
+        Return empty list if the Set has no bounded intervals.
+        Built on first use and kept until the Set is changed.
+        """
+        prefix = self.__dict__.get('_measure_index')
+        if prefix is not None:
+            return prefix
+
+        lengths = []
+        for p in self.pieces:
+            if isinstance(p, Interval) and is_finite(p.a.value) and is_finite(p.b.value):
+                lengths.append(p.b.value - p.a.value)
+            else:
+                lengths.append(None)
+
+        first = next((length for length in lengths if length is not None), None)
+        if first is None:
+            prefix = []
+        else:
+            # Zero of the type of lengths, e.g. timedelta for dates.
+            zero = first - first
+            prefix = [zero]
+            for length in lengths:
+                prefix.append(prefix[-1] if length is None else prefix[-1] + length)
+
+        self._measure_index = prefix
+        return prefix
+
+    def measure(self):
+        """
+        Return total length of the Set, the sum of b - a over its intervals.
+        Scalars have zero length. Return inf if the Set is unbounded.
+        Values must support subtraction, e.g. numbers, or dates giving timedelta.
+        Return 0 if the Set has no intervals.
+        """
+        pieces = self.pieces
+        if not pieces:
+            return 0
+
+        # Only the first and the last pieces can be unbounded.
+        first = pieces[0]
+        last = pieces[-1]
+        if isinstance(first, Interval) and not is_finite(first.a.value) \
+           or isinstance(last, Interval) and not is_finite(last.b.value):
+            return inf
+
+        prefix = self._measure_prefix()
+        return prefix[-1] if prefix else 0
+
+    def measure_between(self, a: Scalar, b: Scalar):
+        """
+        Return total length of the part of the Set between values a and b, see measure().
+        Prefix sums of lengths of pieces are built on first call in O(n)
+        and kept until the Set is changed, then every call runs in O(log n).
+        """
+        if b < a:
+            raise ValueError(f'a must not be greater than b: {a} > {b}')
+
+        pieces = self.pieces
+        # Pieces in range(lo, hi) extend past a and start before b.
+        lo = bisect.bisect_right(pieces, (a, _AFTER), key=_end_cut)
+        hi = bisect.bisect_left(pieces, (b, _BEFORE), lo, key=_start_cut)
+        if lo >= hi:
+            return 0
+
+        # Edge pieces are clipped, the ones between them are within [a, b].
+        parts = [_clipped_length(pieces[lo], a, b)]
+        if hi - lo > 1:
+            parts.append(_clipped_length(pieces[hi-1], a, b))
+        if hi - lo > 2:
+            prefix = self._measure_prefix()
+            if prefix:
+                parts.append(prefix[hi-1] - prefix[lo+1])
+
+        parts = [part for part in parts if part is not None]
+        if not parts:
+            return 0
+        if inf in parts:
+            return inf
+
+        return sum(parts[1:], parts[0])
+
     def __bool__(self) -> bool:
         return len(self.pieces) > 0
 
@@ -185,26 +378,120 @@ class Set:
         if lo < 0:
             raise ValueError('lo must be non-negative')
 
-        if hi is None:
-            hi = len(self.pieces)
+        return _search(self.pieces, x, lo, hi)
 
-        while lo < hi:
-            mid = (lo+hi) // 2
-            piece = self.pieces[mid]
+    def irange(self, window: Interval|Scalar) -> Iterator[Interval|Scalar]:
+        """
+        Iterate over pieces of the Set within window, an Interval or a scalar,
+        clipping the first and the last ones to it. Same as (self & Set([window])).pieces,
+        but the window is located by two binary searches in O(log n + k) for k pieces found.
+        Pieces not clipped are the pieces of the Set itself, not copies, and must not be mutated.
+        """
+        start, end = _span(window)
+        if not start < end:
+            return
 
-            if isinstance(piece, Interval):
-                start, end = piece.a, piece.b
-            else:
-                start, end = piece, piece
+        pieces = self.pieces
+        # Pieces in range(lo, hi) end after the window starts and start before it ends.
+        lo = bisect.bisect_right(pieces, start, key=_end_cut)
+        hi = bisect.bisect_left(pieces, end, lo, key=_start_cut)
 
-            if end < x:
-                lo = mid + 1
-            elif start > x:
-                hi = mid
-            else:
-                return mid, piece
+        for i in range(lo, hi):
+            piece = pieces[i]
+            if i == lo or i == hi-1:
+                piece_start, piece_end = _span(piece)
+                if piece_start < start or end < piece_end:
+                    piece = _piece_from_cuts(max(piece_start, start), min(piece_end, end))
+            yield piece
+
+    def slice(self, window: Interval|Scalar) -> Set:
+        """
+        Return a new Set of everything in the Set within window, an Interval or a scalar.
+        Same as self & Set([window]), in O(log n + k) for k pieces within the window.
+        """
+        return type(self)._from_normalized(_copy_pieces(self.irange(window)))
+
+    def next_bound(self, x: Scalar) -> Endpoint|None:
+        """
+        Return the left Endpoint of the part of the Set at or after scalar x:
+        [x if the Set contains x, otherwise the left Endpoint of the first piece after x,
+        or None if there is none. The Endpoint is open if the Set does not contain its value,
+        as the Set has no nearest point after x then.
+        """
+        pieces = self.pieces
+        i, piece = _search(pieces, x)
+        if piece is not None:
+            return Endpoint._make(x, False, True)
+        if i == len(pieces):
+            return None
+        piece = pieces[i]
+        if isinstance(piece, Interval):
+            return piece.a.copy()
+        return Endpoint._make(piece, False, True)
 
-        return lo, None
+    def prev_bound(self, x: Scalar) -> Endpoint|None:
+        """
+        Return the right Endpoint of the part of the Set at or before scalar x:
+        x] if the Set contains x, otherwise the right Endpoint of the last piece before x,
+        or None if there is none. The Endpoint is open if the Set does not contain its value,
+        as the Set has no nearest point before x then.
+        """
+        pieces = self.pieces
+        i, piece = _search(pieces, x)
+        if piece is not None:
+            return Endpoint._make(x, False, False)
+        if i == 0:
+            return None
+        piece = pieces[i-1]
+        if isinstance(piece, Interval):
+            return piece.b.copy()
+        return Endpoint._make(piece, False, False)
+
+    def _gaps(self, start: tuple, end: tuple) -> Iterator[Interval|Scalar]:
+        """Yield pieces of the complement of the Set between cuts start and end, clipped to them."""
+        pieces = self.pieces
+        # Gap i lies between pieces i-1 and i. Gaps in range(lo, hi) end after start
+        # and start before end.
+        lo = bisect.bisect_right(pieces, start, key=_start_cut)
+        hi = bisect.bisect_left(pieces, end, lo, key=_end_cut) + 1
+
+        for i in range(lo, hi):
+            gap_start = _end_cut(pieces[i-1]) if i > 0 else _AXIS_START
+            gap_end = _start_cut(pieces[i]) if i < len(pieces) else _AXIS_END
+            gap_start = max(gap_start, start)
+            gap_end = min(gap_end, end)
+            if gap_start < gap_end:
+                yield _piece_from_cuts(gap_start, gap_end)
+
+    def gaps(self, window: Interval|Scalar|None = None) -> Iterator[Interval|Scalar]:
+        """
+        Iterate over pieces of the complement of the Set (~self), within window if given,
+        clipping the first and the last ones to it. The complement is not built:
+        gaps between adjacent pieces are found as they are iterated over,
+        in O(log n + k) for k gaps.
+        """
+        if window is None:
+            return self._gaps(_AXIS_START, _AXIS_END)
+
+        return self._gaps(*_span(window))
+
+    def next_gap(self, x: Scalar, min_length=None) -> Interval|Scalar|None:
+        """
+        Return the first piece of the complement of the Set at or after scalar x,
+        clipped to start at x, or None if there is none.
+        If min_length is given, return the first gap that is an Interval of at least that length,
+        e.g. the first free slot of a schedule long enough for a meeting.
+        Runs in O(log n + k) for k gaps skipped.
+        """
+        for gap in self._gaps((x, _BEFORE), _AXIS_END):
+            if min_length is None:
+                return gap
+            if isinstance(gap, Interval):
+                length = _clipped_length(gap, gap.a.value, gap.b.value)
+                if length >= min_length:
+                    return gap
+
+        return None
 
     def __contains__(self, x: Interval|Scalar) -> bool:
         """
@@ -219,6 +506,34 @@ class Set:
 
         return self.search(x)[1] is not None
 
+    def _numeric_arrays(self, np, integer: bool):
+        """
+        Return numpy arrays describing pieces, see _compile_numeric.
+        Built on first use and kept until the Set is changed.
+        """
+        cache = self.__dict__.get('_numeric_index')
+        if cache is None:
+            cache = self._numeric_index = {}
+        if integer not in cache:
+            cache[integer] = _compile_numeric(self.pieces, np, integer)
+        return cache[integer]
+
+    def contains_many(self, values: Iterable[Scalar]):
+        """
+        Test every scalar of values for membership in Set.
+        Return numpy array of booleans if numpy is installed, otherwise list of booleans.
+        Numeric arrays of values, including 0-d ones, give results of the same shape.
+
+        If numpy is installed, Set values are numbers or infinities and values are numeric,
+        whole batch is answered at once by numpy.searchsorted, comparing values as int64
+        if they are integers, otherwise as float64. Values that these types cannot
+        represent exactly, such as integers beyond 2**53 or longdouble values,
+        are looked up one by one instead, so that results are always the same as of `in`.
+        Arrays describing pieces are built on first use and kept until the Set is changed.
+        Otherwise, each value is looked up by bisect.
+        """
+        return numeric.contains_many(self, values, _import_numpy())
+
     @_assert_pieces_are_ascending
     def __invert__(self) -> Set:
         """
@@ -226,14 +541,11 @@ class Set:
         Return a new Set that is a compliment of the Set.
         Double inversion (~~self) returns Set that is equal to self.
         """
-        new = Set()
-
         if not self.pieces:
-            new.pieces.append(unbounded.copy())
-            return new
+            return type(self)._from_normalized([unbounded.copy()])
 
-        if self.pieces[0] == unbounded.copy():
-            return new
+        if self.pieces[0] == unbounded:
+            return type(self)._from_normalized([])
 
         # Get plain list of endpoints from original Set.
         endpoints = []
@@ -241,8 +553,8 @@ class Set:
             if isinstance(i, Interval):
                 endpoints += [i.a, i.b]
             else:
-                e1 = Endpoint(i, '[')
-                e2 = Endpoint(i, ']')
+                e1 = Endpoint._make(i, False, True)
+                e2 = Endpoint._make(i, False, False)
                 endpoints += [e1, e2]
 
         # Make sure the first endpoint is either -inf or inverted original one.
@@ -250,42 +562,43 @@ class Set:
             del endpoints[0]
             endpoints[0] = ~endpoints[0]
         else:
-            endpoints.insert(0, Endpoint('(-inf'))
+            endpoints.insert(0, Endpoint._make(neg_inf, True, True))
 
         # Make sure the last endpoint is either inf or inverted original one.
         if endpoints[-1].value == inf:
             del endpoints[-1]
             endpoints[-1] = ~endpoints[-1]
         else:
-            endpoints.append(Endpoint('inf)'))
+            endpoints.append(Endpoint._make(inf, True, False))
 
         # Invert inner endpoints.
         endpoints[1:-1] = [~e for e in endpoints[1:-1]]
 
         # Construct new Set`s intervals from endpoint pairs.
         # If values of endpoints are same add scalar.
+        pieces = []
         for a, b in zip(endpoints[::2], endpoints[1::2]):
             if a.value == b.value:
                 p = a.value
             else:
-                p = Interval(a, b)
-            new.pieces.append(p)
+                p = Interval._make(a, b)
+            pieces.append(p)
 
-        return new
+        return type(self)._from_normalized(pieces)
 
     def __eq__(self, other: Set|object) -> bool:
         """
         self == other
         Test whether the Set contains all the pieces of the other and vice versa.
         """
-        return isinstance(other, Set) and self.pieces == other.pieces
+        return isinstance(other, Set) and _pieces_equal(self.pieces, other.pieces)
 
     def __ne__(self, other: Set|object) -> bool:
         """
         self != other
         Test whether the Set contains anything that the other does not contain or vice versa.
         """
-        return not isinstance(other, Set) or self.pieces != other.pieces
+        return not isinstance(other, Set) or not _pieces_equal(self.pieces, other.pieces)
 
     def __gt__(self, other: Set|object) -> bool|NotImplementedType:
         """
@@ -379,21 +692,15 @@ class Set:
         # but I'll won't raise myself - let the other have a chance.
         return NotImplemented
 
-    def __or__(self, other: Set) -> Set:
+    def __or__(self, other: Set|object) -> Set|NotImplementedType:
         """
         self | other
         Return a new Set that is a union of the Set and the other.
         """
         if not isinstance(other, Set):
-            emsg = "unsupported operand type for |: %s and %s"
-            raise TypeError(emsg % (type(self), type(other)))
-
-        new = self.copy()
-        lo = 0
-        for x in other.pieces:
-            lo = new._add(x, lo)
+            return NotImplemented
 
-        return new
+        return type(self)._from_normalized(_merge_pieces(self.pieces, other.pieces, operator.or_))
 
     @_assert_pieces_are_ascending
     def __ior__(self, other: Set) -> Set:
@@ -406,6 +713,10 @@ class Set:
             emsg = "unsupported operand type for |=: %s and %s"
             raise TypeError(emsg % (type(self), type(other)))
 
+        if len(other.pieces) > _SPLICE_LIMIT:
+            self.pieces = _merge_pieces(self.pieces, other.pieces, operator.or_)
+            return self
+
         lo = 0
         for x in other.pieces:
             lo = self._add(x, lo)
@@ -414,43 +725,37 @@ class Set:
 
     def union(self, *others: Set | Iterable[Interval|Scalar] ) -> Set:
         """Return a new Set that is a union with the Set and all the others."""
-        new = self.copy()
+        if not others:
+            return self.copy()
 
-        for other in others:
-            if isinstance(other, Set):
-                lo = 0
-                for x in other.pieces:
-                    lo = new._add(x, lo)
-            else:
-                for x in other:
-                    new.add(x)
-        return new
+        return type(self).union_all((self, *others))
 
     @_assert_pieces_are_ascending
     def update(self, *others: Set | Iterable[Interval|Scalar] ) -> None:
         """Update the Set, adding pieces from all the others."""
+        others = [other if isinstance(other, Set) else Set(other) for other in others]
+
+        if sum(len(other.pieces) for other in others) > _SPLICE_LIMIT:
+            self.pieces = Set.union_all((self, *others)).pieces
+            return
+
         for other in others:
-            if isinstance(other, Set):
-                lo = 0
-                for x in other.pieces:
-                    lo = self._add(x, lo)
-            else:
-                for x in other:
-                    self._add(x)
+            lo = 0
+            for x in other.pieces:
+                lo = self._add(x, lo)
 
     @staticmethod
     def __and(A: Set, B: Set) -> Set:
         """Return a new Set that is an intersection of A and B."""
-        return A - ~B
+        return type(A)._from_normalized(_merge_pieces(A.pieces, B.pieces, operator.and_))
 
-    def __and__(self, other: Set) -> Set:
+    def __and__(self, other: Set|object) -> Set|NotImplementedType:
         """
         self & other
         Return a new Set that is an intersection of the Set`s and the other.
         """
         if not isinstance(other, Set):
-            emsg = "unsupported operand type for &: %s and %s"
-            raise TypeError(emsg % (type(self), type(other)))
+            return NotImplemented
 
         return Set.__and(self, other)
 
@@ -474,26 +779,16 @@ class Set:
         """
         Return a new Set that is an intersection of the Set`s and all the others.
         """
-        accumulator = self.copy()
+        if not others:
+            return self.copy()
 
-        for other in others:
-            if not isinstance(other, Set):
-                other = Set(other)
-            accumulator = Set.__and(accumulator, other)
-
-        return accumulator
+        return type(self).intersection_all((self, *others))
 
     @_assert_pieces_are_ascending
     def intersection_update(self, *others: Set | str | Iterable[Interval|Scalar] | None) -> None:
         """Update the Set, removing everything that is not in any of the others."""
-        accumulator = self
-
-        for other in others:
-            if not isinstance(other, Set):
-                other = Set(other)
-            accumulator = Set.__and(accumulator, other)
-
-        self.pieces = accumulator.pieces
+        if others:
+            self.pieces = Set.intersection_all((self, *others)).pieces
 
     def isdisjoint(self, other: Set) -> bool:
         """
@@ -533,18 +828,15 @@ class Set:
 
         return A
 
-    def __sub__(self, other: Set) -> Set:
+    def __sub__(self, other: Set|object) -> Set|NotImplementedType:
         """
         self - other
         Return a new Set with everything that is in the Set but not in the other.
         """
         if not isinstance(other, Set):
-            emsg = "unsupported operand type for -: %s and %s"
-            raise TypeError(emsg % (type(self), type(other)))
-
-        new = self.copy()
+            return NotImplemented
 
-        return Set.__sub(new, other)
+        return type(self)._from_normalized(_merge_pieces(self.pieces, other.pieces, _difference_op))
 
     @_assert_pieces_are_ascending
     def __isub__(self, other: Set) -> Set:
@@ -557,6 +849,10 @@ class Set:
             emsg = "unsupported operand type for -=: %s and %s"
             raise TypeError(emsg % (type(self), type(other)))
 
+        if len(other.pieces) > _SPLICE_LIMIT:
+            self.pieces = _merge_pieces(self.pieces, other.pieces, _difference_op)
+            return self
+
         return Set.__sub(self, other)
 
     def difference(self, *others: Set | Iterable[Interval|Scalar] ) -> Set:
@@ -564,15 +860,16 @@ class Set:
         Return a new Set with everything that is in the Set
         but not in any of the others.
         """
-        new = self.copy()
+        if not others:
+            return self.copy()
 
+        pieces = self.pieces
         for other in others:
-            if isinstance(other, Set):
-                Set.__sub(new, other)
-            else:
-                for x in other:
-                    new.remove(x)
-        return new
+            if not isinstance(other, Set):
+                other = Set(other)
+            pieces = _merge_pieces(pieces, other.pieces, _difference_op)
+
+        return type(self)._from_normalized(pieces)
 
     @_assert_pieces_are_ascending
     def difference_update(self, *others: Set | Iterable[Interval|Scalar]) -> None:
@@ -587,15 +884,14 @@ class Set:
     @staticmethod
     def __xor(A: Set, B: Set) -> Set:
         """Return a new Set with pieces in either the Set A or B but not in both."""
-        return A - B | B - A
+        return type(A)._from_normalized(_merge_pieces(A.pieces, B.pieces, operator.xor))
 
-    def __xor__(self, other: Set) -> Set:
+    def __xor__(self, other: Set|object) -> Set|NotImplementedType:
         """
         self ^ other
         Return a new Set with pieces in either the Set or the other but not in both."""
         if not isinstance(other, Set):
-            emsg = "unsupported operand type for ^: %s and %s"
-            raise TypeError(emsg % (type(self), type(other)))
+            return NotImplemented
 
         return Set.__xor(self, other)
 
@@ -629,7 +925,8 @@ class Set:
         return new
 
     @_assert_pieces_are_ascending
-    def symmetric_difference_update(self, *others: Set | str | Iterable[Interval|Scalar] | None) -> None:
+    def symmetric_difference_update(self, *others: Set | str | Iterable[Interval|Scalar] | None
+                                    ) -> None:
         """
         Update the Set, keeping only pieces found in either Set, but not in both.
         """
@@ -642,203 +939,29 @@ class Set:
 
         self.pieces = accumulator.pieces
 
-    def _add_scalar(self, x: Scalar, lo: int = 0) -> int:
-
-        if not is_finite(x):
-            raise ValueError('x must be finite')
-
-        idx, piece = self.search(x, lo)
-
-        if piece is not None:
-            return idx
-
-        pieces = self.pieces
-        pre = pieces[idx-1] if idx > 0 else None
-        nex = pieces[idx] if len(pieces) >= idx+1 else None
-        pre, nex = (isinstance(p, Interval) and p or None for p in [pre, nex])
-
-        if pre is not None:
-            if pre.b.value == x:
-                if nex is not None and nex.a.value == x:
-                    # Adding b to (a, b), (b, c)
-                    interval = Interval(pre.a.copy(), nex.b.copy())
-                    pieces[idx-1:idx+1] = [interval]
-                else:
-                    # Adding b to (a, b)
-                    b = Endpoint(x, ']')
-                    pieces[idx-1] = Interval(pre.a.copy(), b)
-
-                return idx
-
-        if nex is not None and nex.a.value == x:
-            # Adding a to (a, b)
-            a = Endpoint(x, '[')
-            pieces[idx] = Interval(a, nex.b.copy())
-
-            return idx
-
-        pieces.insert(idx, x)
-
-        return idx + 1
-
-    def _add_interval(self, x: Interval, lo: int = 0) -> int:
-
-        pieces = self.pieces
-
-        idx1, piece1 = self.search(x.a, lo)
-        idx2, piece2 = self.search(x.b, idx1)
-
-        a = x.a.copy()
-
-        if piece1 is not None:
-            if isinstance(piece1, Interval):
-                a = piece1.a.copy()
-
-        elif idx1 > 0:
-            pre = pieces[idx1-1]
-            if isinstance(pre, Interval):
-                if are_bounding(pre.b, x.a):
-                    a = pre.a.copy()
-                    idx1 -= 1
-            elif pre == x.a.value:
-                a = Endpoint(pre, '[')
-                idx1 -= 1
-
-        b = x.b.copy()
-
-        if piece2 is not None:
-            idx2 += 1
-            if isinstance(piece2, Interval):
-                b = piece2.b.copy()
-
-        elif len(pieces) >= idx2+1:
-            nex = pieces[idx2]
-            if isinstance(nex, Interval):
-                if are_bounding(x.b, nex.a):
-                    b = nex.b.copy()
-                    idx2 += 1
-
-            elif nex == x.b.value:
-                b = Endpoint(nex, ']')
-                idx2 += 1
-
-        pieces[idx1:idx2] = [Interval(a, b)]
-
-        return min([idx2, len(self.pieces)])
-
     def _add(self, x: Interval|Scalar, lo: int = 0) -> int:
         """
         Add scalar or interval x to Set, starting from piece at index lo.
-        return index of the first piece that does not intersect with x.
+        Return index to start adding the following pieces of a Set from:
+        that of the first piece that may contain anything after x.
         """
-        if isinstance(x, Interval):
-            if x.is_degenerate:
-                # Collapse degenerate interval into scalar.
-                # Only [a,a] contains that point; the other bound combos are empty.
-                if (not x.a.open) and (not x.b.open):
-                    return self._add_scalar(x.a.value, lo)
-                return lo  # empty interval, nothing to add
-
-            return self._add_interval(x, lo)
-
-        return self._add_scalar(x, lo)
+        self._measure_index = None
+        self._numeric_index = None
+        return splice.add(self, x, lo)
 
     @_assert_pieces_are_ascending
     def add(self, x: Interval|Scalar) -> None:
         """Add scalar or interval x to Set, merge ones that intersect."""
         self._add(x)
 
-    def _remove_scalar(self, x: Scalar, lo: int = 0) -> int:
-
-        idx, piece = self.search(x, lo)
-
-        if piece is None:
-            return idx
-
-        if isinstance(piece, Interval):
-            if piece.a.value == x:
-                piece.a.open = True
-            elif piece.b.value == x:
-                piece.b.open = True
-            else:
-                # Split interval by x.
-                b1 = Endpoint(x, ')')
-                i1 = Interval(piece.a, b1)
-                a2 = Endpoint(x, '(')
-                i2 = Interval(a2, piece.b)
-                self.pieces[idx:idx+1] = [i1, i2]
-        else:
-            self.pieces[idx:idx+1] = []
-
-        return idx
-
-    def _remove_interval(self, x: Interval, lo: int = 0) -> int:
-
-        pieces = self.pieces
-
-        idx1, piece1 = self.search(x.a, lo)
-        idx2, piece2 = self.search(x.b, idx1)
-
-        if piece1 is piece2 and piece1 is not None: # same interval
-            new_pieces = []
-
-            if x.a.value == piece1.a.value:
-                if x.a.open and not piece1.a.open:
-                    new_pieces.append(x.a.value)
-            else:
-                new_pieces.append(Interval(piece1.a, ~x.a))
-
-            if x.b.value == piece1.b.value:
-                if x.b.open and not piece1.b.open:
-                    new_pieces.append(x.b.value)
-            else:
-                new_pieces.append(Interval(~x.b, piece2.b))
-
-            pieces[idx1:idx1+1] = new_pieces
-
-            return idx1
-
-        if piece1 is not None:
-            if isinstance(piece1, Interval):
-                if x.a.value == piece1.a.value:
-                    if x.a.open and not piece1.a.open:
-                        pieces[idx1] = x.a.value
-                        idx1 += 1
-                else:
-                    piece1.b = ~x.a
-                    idx1 += 1
-
-        if piece2 is not None:
-            if isinstance(piece2, Interval):
-                if x.b.value == piece2.b.value:
-                    if x.b.open and not piece2.b.open:
-                        pieces[idx2] = x.b.value
-                    else:
-                        idx2 += 1
-                else:
-                    piece2.a = ~x.b
-            else:
-                idx2 += 1
-
-        pieces[idx1:idx2] = []
-
-        return idx1
-
     def _remove(self, x: Interval|Scalar, lo: int = 0) -> int:
         """
         Remove scalar or interval x from Set, starting from piece at index lo.
         return index of the first piece that does not intersect with x.
         """
-        if isinstance(x, Interval):
-            if x.is_degenerate:
-                # Collapse degenerate interval into scalar.
-                # Only [a,a] contains that point; the other bound combos are empty.
-                if (not x.a.open) and (not x.b.open):
-                    return self._remove_scalar(x.a.value, lo)
-
-            return self._remove_interval(x, lo)
-
-        return self._remove_scalar(x, lo)
+        self._measure_index = None
+        self._numeric_index = None
+        return splice.remove(self, x, lo)
 
     @_assert_pieces_are_ascending
     def remove(self, x: Interval|Scalar) -> None:
@@ -852,9 +975,9 @@ class Set:
     def copy(self) -> Set:
         """
         Return a copy of the Set.
-        Intervals are recreated.
+        Intervals are recreated, except FrozenIntervals, which are shared.
+        Pieces of a Set built from a FrozenSet or FrozenIntervals are thus shared,
+        while those of other Sets, including results of Set operations, are copied.
         copy is safe as long as endpoint values are of immutable types.
         """
-        new = Set()
-        new.pieces = _copy_pieces(self.pieces)
-        return new
+        return type(self)._from_normalized(_copy_pieces(self.pieces))
@@ -0,0 +1,254 @@
+"""
+In-place algorithms of Set: binary search of a scalar in ascending pieces,
+and splicing a single piece into them or out of them.
+
+Pieces around the spliced one are merged or split as needed, and replaced
+rather than changed in place, so that they can be shared with copies,
+see PersistentSet. add() and remove() take a Set s, so that its search()
+is used, and return the index to continue from with the following pieces
+of an ascending sequence, which makes adding or removing all pieces of
+another Set a single pass over both.
+"""
+from __future__ import annotations
+
+from set_algebra.endpoint import Endpoint, are_bounding
+from set_algebra.infinity import is_finite
+from set_algebra.interval import Interval
+
+
+Scalar = object # For type annotations
+
+
+def _search(pieces, x: Scalar, lo: int = 0, hi: int|None = None
+            ) -> tuple[int, Interval|Scalar|None]:
+    """Binary search of scalar x in ascending pieces, see Set.search."""
+    if hi is None:
+        hi = len(pieces)
+
+    while lo < hi:
+        mid = (lo+hi) // 2
+        piece = pieces[mid]
+
+        if isinstance(piece, Interval):
+            start, end = piece.a, piece.b
+        else:
+            start, end = piece, piece
+
+        if end < x:
+            lo = mid + 1
+        elif start > x:
+            hi = mid
+        else:
+            return mid, piece
+
+    return lo, None
+
+
+def _add_scalar(s, x: Scalar, lo: int = 0) -> int:
+
+    if not is_finite(x):
+        raise ValueError('x must be finite')
+
+    idx, piece = s.search(x, lo)
+
+    if piece is not None:
+        return idx
+
+    pieces = s.pieces
+    pre = pieces[idx-1] if idx > 0 else None
+    nex = pieces[idx] if len(pieces) >= idx+1 else None
+    pre, nex = (isinstance(p, Interval) and p or None for p in [pre, nex])
+
+    if pre is not None:
+        if pre.b.value == x:
+            if nex is not None and nex.a.value == x:
+                # Adding b to (a, b), (b, c)
+                interval = Interval._make(pre.a, nex.b)
+                pieces[idx-1:idx+1] = [interval]
+                return idx - 1
+
+            # Adding b to (a, b)
+            b = Endpoint._make(x, False, False)
+            pieces[idx-1] = Interval._make(pre.a, b)
+
+            return idx
+
+    if nex is not None and nex.a.value == x:
+        # Adding a to (a, b)
+        a = Endpoint._make(x, False, True)
+        pieces[idx] = Interval._make(a, nex.b)
+
+        return idx
+
+    pieces.insert(idx, x)
+
+    return idx + 1
+
+
+def _add_interval(s, x: Interval, lo: int = 0) -> int:
+
+    pieces = s.pieces
+
+    idx1, piece1 = s.search(x.a, lo)
+    idx2, piece2 = s.search(x.b, idx1)
+
+    a = x.a
+
+    if piece1 is not None:
+        if isinstance(piece1, Interval):
+            a = piece1.a
+
+    elif idx1 > 0:
+        pre = pieces[idx1-1]
+        if isinstance(pre, Interval):
+            if are_bounding(pre.b, x.a):
+                a = pre.a
+                idx1 -= 1
+        elif pre == x.a.value:
+            a = Endpoint._make(pre, False, True)
+            idx1 -= 1
+
+    b = x.b
+
+    if piece2 is not None:
+        idx2 += 1
+        if isinstance(piece2, Interval):
+            b = piece2.b
+
+    elif len(pieces) >= idx2+1:
+        nex = pieces[idx2]
+        if isinstance(nex, Interval):
+            if are_bounding(x.b, nex.a):
+                b = nex.b
+                idx2 += 1
+
+        elif nex == x.b.value:
+            b = Endpoint._make(nex, False, False)
+            idx2 += 1
+
+    # Endpoints of x belong to the caller, those of pieces to the Set.
+    if a is x.a:
+        a = a.copy()
+    if b is x.b:
+        b = b.copy()
+    pieces[idx1:idx2] = [Interval._make(a, b)]
+
+    # The new interval may extend beyond x, so it is where to search next.
+    return idx1
+
+
+def _remove_scalar(s, x: Scalar, lo: int = 0) -> int:
+
+    idx, piece = s.search(x, lo)
+
+    if piece is None:
+        return idx
+
+    # Pieces are replaced rather than changed in place,
+    # so that they can be shared with copies, see PersistentSet.
+    if isinstance(piece, Interval):
+        if piece.a.value == x:
+            s.pieces[idx] = Interval._make(Endpoint._make(x, True, True), piece.b)
+        elif piece.b.value == x:
+            s.pieces[idx] = Interval._make(piece.a, Endpoint._make(x, True, False))
+        else:
+            # Split interval by x.
+            b1 = Endpoint._make(x, True, False)
+            i1 = Interval._make(piece.a, b1)
+            a2 = Endpoint._make(x, True, True)
+            i2 = Interval._make(a2, piece.b)
+            s.pieces[idx:idx+1] = [i1, i2]
+    else:
+        s.pieces[idx:idx+1] = []
+
+    return idx
+
+
+def _remove_interval(s, x: Interval, lo: int = 0) -> int:
+
+    pieces = s.pieces
+
+    idx1, piece1 = s.search(x.a, lo)
+    idx2, piece2 = s.search(x.b, idx1)
+
+    if piece1 is piece2 and piece1 is not None: # same interval
+        new_pieces = []
+
+        if x.a.value == piece1.a.value:
+            if x.a.open and not piece1.a.open:
+                new_pieces.append(x.a.value)
+        else:
+            new_pieces.append(Interval._make(piece1.a, ~x.a))
+
+        if x.b.value == piece1.b.value:
+            if x.b.open and not piece1.b.open:
+                new_pieces.append(x.b.value)
+        else:
+            new_pieces.append(Interval._make(~x.b, piece2.b))
+
+        pieces[idx1:idx1+1] = new_pieces
+
+        return idx1
+
+    if piece1 is not None:
+        if isinstance(piece1, Interval):
+            if x.a.value == piece1.a.value:
+                if x.a.open and not piece1.a.open:
+                    pieces[idx1] = x.a.value
+                    idx1 += 1
+            else:
+                pieces[idx1] = Interval._make(piece1.a, ~x.a)
+                idx1 += 1
+
+    if piece2 is not None:
+        if isinstance(piece2, Interval):
+            if x.b.value == piece2.b.value:
+                if x.b.open and not piece2.b.open:
+                    pieces[idx2] = x.b.value
+                else:
+                    idx2 += 1
+            else:
+                pieces[idx2] = Interval._make(~x.b, piece2.b)
+        else:
+            idx2 += 1
+
+    pieces[idx1:idx2] = []
+
+    return idx1
+
+
+def add(s, x: Interval|Scalar, lo: int = 0) -> int:
+    """
+    Add scalar or interval x to pieces of Set s, starting from piece at index lo.
+    Return index to start adding the following pieces of a Set from:
+    that of the first piece that may contain anything after x.
+    """
+    if isinstance(x, Interval):
+        if x.is_degenerate:
+            # Collapse degenerate interval into scalar.
+            # Only [a,a] contains that point; the other bound combos are empty.
+            if (not x.a.open) and (not x.b.open):
+                return _add_scalar(s, x.a.value, lo)
+            return lo  # empty interval, nothing to add
+
+        return _add_interval(s, x, lo)
+
+    return _add_scalar(s, x, lo)
+
+
+def remove(s, x: Interval|Scalar, lo: int = 0) -> int:
+    """
+    Remove scalar or interval x from pieces of Set s, starting from piece at index lo.
+    return index of the first piece that does not intersect with x.
+    """
+    if isinstance(x, Interval):
+        if x.is_degenerate:
+            # Collapse degenerate interval into scalar.
+            # Only [a,a] contains that point; the other bound combos are empty.
+            if (not x.a.open) and (not x.b.open):
+                return _remove_scalar(s, x.a.value, lo)
+            return lo  # empty interval, nothing to remove
+
+        return _remove_interval(s, x, lo)
+
+    return _remove_scalar(s, x, lo)
@@ -0,0 +1,107 @@
+"""
+Set operations on streams of pieces.
+
+Operands are Sets and iterables of pieces - Intervals and scalars - in ascending order,
+such as generators reading sorted intervals from a file or a database cursor.
+Pieces of every stream must not intersect and there must be a gap between any two of them,
+as in Set.pieces. This is checked as they come, and ValueError is raised
+on the first offending pair, unless validate is False.
+
+Results are generators of ascending pieces, so that arbitrarily long streams
+are processed in O(1) memory per operand, and they can be chained
+or collected with Set.from_pieces(..., presorted=True).
+
+>>> from set_algebra import Interval, Set
+>>> def read_log():
+...     yield Interval('[0, 10)')
+...     yield Interval('[12, 20)')
+...     yield 25
+>>> maintenance = Set('[5, 13], {25}')
+>>> list(difference(read_log(), maintenance))
+[Interval('[0, 5)'), Interval('(13, 20)')]
+"""
+from __future__ import annotations
+import functools
+import operator
+from typing import Iterable, Iterator
+
+from set_algebra.cuts import _difference_op, _merge_cuts, _piece_from_cuts, _span
+from set_algebra.interval import Interval
+from set_algebra.set_ import Scalar, Set
+from set_algebra.validation import pair_error
+
+
+Operand = Set | Iterable[Interval|Scalar] # For type annotations
+
+
+def _cuts(operand: Operand, number: int, validate: bool):
+    """Yield cuts of pieces of an operand, checking pieces of a stream if validate is True."""
+    if isinstance(operand, Set):
+        pieces = operand.pieces
+        validate = False
+    else:
+        pieces = operand
+
+    prev = None
+    prev_i = 0
+    for i, piece in enumerate(pieces):
+        start, end = _span(piece)
+        if not start < end:
+            # Degenerate interval other than [a, a] is empty.
+            continue
+        if validate:
+            if prev is not None:
+                error = pair_error(prev, piece)
+                if error is not None:
+                    raise ValueError('operand %d, pieces[%d] and pieces[%d]: %s'
+                                     % (number, prev_i, i, error))
+            prev = piece
+            prev_i = i
+        yield start
+        yield end
+
+
+def _pieces(cuts) -> Iterator[Interval|Scalar]:
+    it = iter(cuts)
+    for start, end in zip(it, it):
+        yield _piece_from_cuts(start, end)
+
+
+def _sweep(operands: tuple[Operand, ...], op, validate: bool) -> Iterator[Interval|Scalar]:
+    if not operands:
+        return iter(())
+
+    cuts = [_cuts(operand, number, validate) for number, operand in enumerate(operands)]
+    return _pieces(functools.reduce(lambda c1, c2: _merge_cuts(c1, c2, op), cuts))
+
+
+def union(*operands: Operand, validate: bool = True) -> Iterator[Interval|Scalar]:
+    """Yield ascending pieces of everything in any of the operands."""
+    return _sweep(operands, operator.or_, validate)
+
+
+def intersection(*operands: Operand, validate: bool = True) -> Iterator[Interval|Scalar]:
+    """
+    Yield ascending pieces of everything in all of the operands.
+    Raise ValueError if there are no operands, as their intersection is unbounded.
+    """
+    if not operands:
+        raise ValueError('intersection() requires at least one operand')
+    return _sweep(operands, operator.and_, validate)
+
+
+def difference(first: Operand, *others: Operand, validate: bool = True
+               ) -> Iterator[Interval|Scalar]:
+    """Yield ascending pieces of everything in the first operand but not in any of the others."""
+    if not others:
+        return _sweep((first,), operator.or_, validate)
+
+    # first - (a | b | ...), each operand swept once.
+    rest = [_cuts(other, number, validate) for number, other in enumerate(others, 1)]
+    rest = functools.reduce(lambda c1, c2: _merge_cuts(c1, c2, operator.or_), rest)
+    return _pieces(_merge_cuts(_cuts(first, 0, validate), rest, _difference_op))
+
+
+def symmetric_difference(*operands: Operand, validate: bool = True) -> Iterator[Interval|Scalar]:
+    """Yield ascending pieces of everything in an odd number of the operands."""
+    return _sweep(operands, operator.xor, validate)
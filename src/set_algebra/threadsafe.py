@@ -0,0 +1,236 @@
+"""
+Set shared between threads.
+
+ConcurrentSet holds a FrozenSet snapshot, replaced as a whole on every change.
+Readers take the current snapshot with a single attribute read and query it
+without locking, so reads never block and scale across threads, including
+free-threaded builds of CPython. A snapshot never changes once published:
+a reader sees the Set either before or after a change, never in between.
+
+Writers are serialized by a lock. A change copies the pieces, applies the
+in-place Set algorithm to the copy and publishes the result as a new snapshot,
+so every write is O(n). Batch many changes in one transaction().
+
+>>> from set_algebra import Set
+>>> shared = ConcurrentSet('[0, 10)')
+>>> before = shared.snapshot()
+>>> shared.remove(Interval('[2, 3]'))
+>>> 2.5 in shared, 2.5 in before
+(False, True)
+>>> with shared.transaction() as s:
+...     s.add(Interval('[20, 30]'))
+...     s -= Set('{25}')
+>>> shared
+ConcurrentSet('[0, 2), (3, 10), [20, 25), (25, 30]')
+"""
+from __future__ import annotations
+from contextlib import contextmanager
+import threading
+from typing import Iterable, Iterator
+
+from set_algebra.frozen import FrozenSet
+from set_algebra.interval import Interval
+from set_algebra.set_ import Scalar, Set, _copy_pieces
+
+
+class ConcurrentSet:
+    """
+    Thread-safe Set with lock-free snapshot reads and serialized writes.
+
+    ConcurrentSet is instantiated the same way as Set. Queries run on the
+    current snapshot, a FrozenSet returned by snapshot(); to make several
+    queries consistent with each other, take a snapshot once and query it.
+    Operators (|, &, -, ^, ~) and union(), intersection(), difference() and
+    symmetric_difference() return FrozenSets computed from the snapshot.
+    Mutating methods and augmented assignments change the ConcurrentSet in place.
+    """
+
+    __slots__ = ('_snapshot', '_lock')
+
+    def __init__(self, arg: str | Iterable[Interval|Scalar] | Set | None = None):
+        self._lock = threading.Lock()
+        self._snapshot = arg if isinstance(arg, FrozenSet) else FrozenSet(arg)
+
+    def snapshot(self) -> FrozenSet:
+        """Return the current state as a FrozenSet, which later changes do not affect."""
+        return self._snapshot
+
+    def copy(self) -> ConcurrentSet:
+        """Return a new ConcurrentSet starting from the current snapshot."""
+        return type(self)(self._snapshot)
+
+    @property
+    def pieces(self) -> tuple:
+        return self._snapshot.pieces
+
+    def __repr__(self) -> str:
+        return '%s(%r)' % (type(self).__name__, self._snapshot.notation)
+
+    @property
+    def notation(self) -> str:
+        return self._snapshot.notation
+
+    # Queries
+
+    def __bool__(self) -> bool:
+        return bool(self._snapshot)
+
+    def __contains__(self, x: Interval|Scalar) -> bool:
+        return x in self._snapshot
+
+    def __eq__(self, other: Set|ConcurrentSet|object) -> bool:
+        if isinstance(other, ConcurrentSet):
+            other = other.snapshot()
+        return self._snapshot == other
+
+    def __ne__(self, other: Set|ConcurrentSet|object) -> bool:
+        return not self == other
+
+    __hash__ = None # Mutable
+
+    def __lt__(self, other: Set|ConcurrentSet|object) -> bool:
+        if isinstance(other, ConcurrentSet):
+            other = other.snapshot()
+        return self._snapshot < other
+
+    def __le__(self, other: Set|ConcurrentSet|object) -> bool:
+        if isinstance(other, ConcurrentSet):
+            other = other.snapshot()
+        return self._snapshot <= other
+
+    def __gt__(self, other: Set|ConcurrentSet|object) -> bool:
+        if isinstance(other, ConcurrentSet):
+            other = other.snapshot()
+        return self._snapshot > other
+
+    def __ge__(self, other: Set|ConcurrentSet|object) -> bool:
+        if isinstance(other, ConcurrentSet):
+            other = other.snapshot()
+        return self._snapshot >= other
+
+    def search(self, x: Scalar, lo: int = 0, hi: int|None = None
+               ) -> tuple[int, Interval|Scalar|None]:
+        return self._snapshot.search(x, lo, hi)
+
+    def contains_many(self, values: Iterable[Scalar]):
+        return self._snapshot.contains_many(values)
+
+    def bounds(self) -> Interval|None:
+        return self._snapshot.bounds()
+
+    def measure(self):
+        return self._snapshot.measure()
+
+    def measure_between(self, a: Scalar, b: Scalar):
+        return self._snapshot.measure_between(a, b)
+
+    def irange(self, window: Interval|Scalar) -> Iterator[Interval|Scalar]:
+        return self._snapshot.irange(window)
+
+    def gaps(self, window: Interval|Scalar|None = None) -> Iterator[Interval|Scalar]:
+        return self._snapshot.gaps(window)
+
+    def issubset(self, other: Set|object) -> bool:
+        return self._snapshot.issubset(other)
+
+    def issuperset(self, other: Set|object) -> bool:
+        return self._snapshot.issuperset(other)
+
+    def isdisjoint(self, other: Set) -> bool:
+        return self._snapshot.isdisjoint(other)
+
+    def __invert__(self) -> FrozenSet:
+        return ~self._snapshot
+
+    def __or__(self, other: Set) -> FrozenSet:
+        return self._snapshot | other
+
+    def __and__(self, other: Set) -> FrozenSet:
+        return self._snapshot & other
+
+    def __sub__(self, other: Set) -> FrozenSet:
+        return self._snapshot - other
+
+    def __xor__(self, other: Set) -> FrozenSet:
+        return self._snapshot ^ other
+
+    def union(self, *others: Set | Iterable[Interval|Scalar]) -> FrozenSet:
+        return self._snapshot.union(*others)
+
+    def intersection(self, *others: Set | str | Iterable[Interval|Scalar] | None) -> FrozenSet:
+        return self._snapshot.intersection(*others)
+
+    def difference(self, *others: Set | Iterable[Interval|Scalar]) -> FrozenSet:
+        return self._snapshot.difference(*others)
+
+    def symmetric_difference(self, *others: Set | str | Iterable[Interval|Scalar] | None
+                             ) -> FrozenSet:
+        return self._snapshot.symmetric_difference(*others)
+
+    # Changes
+
+    @contextmanager
+    def transaction(self) -> Iterator[Set]:
+        """
+        Hold the write lock and yield a mutable copy of the Set,
+        published as the new snapshot when the block exits without an exception.
+        Readers see the state before the block until then, and nothing of it
+        if the block raises. The lock is not reentrant: change the yielded Set,
+        not the ConcurrentSet, inside the block.
+        """
+        with self._lock:
+            s = Set._from_normalized(_copy_pieces(self._snapshot.pieces))
+            yield s
+            self._snapshot = FrozenSet._from_normalized(s.pieces)
+
+    def add(self, x: Interval|Scalar) -> None:
+        """Add scalar or interval x to the Set."""
+        with self.transaction() as s:
+            s.add(x)
+
+    def remove(self, x: Interval|Scalar) -> None:
+        """Remove scalar or interval x from the Set."""
+        with self.transaction() as s:
+            s.remove(x)
+
+    def clear(self) -> None:
+        """Remove all pieces from the Set."""
+        with self._lock:
+            self._snapshot = FrozenSet()
+
+    def update(self, *others: Set | Iterable[Interval|Scalar]) -> None:
+        with self.transaction() as s:
+            s.update(*others)
+
+    def intersection_update(self, *others: Set | str | Iterable[Interval|Scalar] | None) -> None:
+        with self.transaction() as s:
+            s.intersection_update(*others)
+
+    def difference_update(self, *others: Set | Iterable[Interval|Scalar]) -> None:
+        with self.transaction() as s:
+            s.difference_update(*others)
+
+    def symmetric_difference_update(self, *others: Set | str | Iterable[Interval|Scalar] | None
+                                    ) -> None:
+        with self.transaction() as s:
+            s.symmetric_difference_update(*others)
+
+    def __ior__(self, other: Set) -> ConcurrentSet:
+        with self.transaction() as s:
+            s |= other
+        return self
+
+    def __iand__(self, other: Set) -> ConcurrentSet:
+        with self.transaction() as s:
+            s &= other
+        return self
+
+    def __isub__(self, other: Set) -> ConcurrentSet:
+        with self.transaction() as s:
+            s -= other
+        return self
+
+    def __ixor__(self, other: Set) -> ConcurrentSet:
+        with self.transaction() as s:
+            s ^= other
+        return self
@@ -0,0 +1,153 @@
+"""
+Validation of Set pieces.
+
+Pieces of a Set must be sorted in ascending order, must not intersect,
+and there must be a gap between any two of them.
+Set mutators check this after every call according to the validation mode:
+    'off'       no checks
+    'sampled'   check SAMPLE_SIZE randomly chosen pairs of adjacent pieces
+    'full'      check every pair of adjacent pieces, O(n) per call
+
+The initial mode is read from SET_ALGEBRA_VALIDATION environment variable
+and is 'off' when the variable is not set. An unknown value is warned about
+and treated as 'off', rather than failing the import.
+
+>>> from set_algebra import Set
+>>> s = Set()
+>>> s.pieces = [2, 1]
+>>> with validation('full'):
+...     s.add(5)
+Traceback (most recent call last):
+...
+set_algebra.validation.PiecesError: pieces[0] and pieces[1]: 2 >= 1
+"""
+from __future__ import annotations
+import contextlib
+import contextvars
+import os
+import random
+import warnings
+from typing import Iterator, Sequence
+
+from set_algebra.endpoint import are_bounding
+from set_algebra.interval import Interval
+
+
+OFF = 'off'
+SAMPLED = 'sampled'
+FULL = 'full'
+MODES = (OFF, SAMPLED, FULL)
+
+ENV_VAR = 'SET_ALGEBRA_VALIDATION'
+
+# Number of adjacent pairs checked in 'sampled' mode.
+SAMPLE_SIZE = 8
+
+# Generator choosing the pairs, so that validation leaves the sequence of the random module alone.
+_random = random.Random()
+
+
+class PiecesError(AssertionError):
+    """
+    Raised when Set pieces are out of order, intersect or touch.
+    Attribute index is the index of the first piece of the offending pair.
+    """
+    def __init__(self, msg: str, index: int) -> None:
+        super().__init__(msg)
+        self.index = index
+
+
+def _parse_mode(mode: str) -> str:
+    if mode not in MODES:
+        raise ValueError(f'validation mode must be one of {", ".join(MODES)}, not {mode!r}')
+    return mode
+
+
+def _mode_from_env(environ=os.environ) -> str:
+    try:
+        return _parse_mode(environ.get(ENV_VAR, OFF).strip().lower() or OFF)
+    except ValueError as error:
+        warnings.warn(f'{ENV_VAR}: {error}; validation is off', RuntimeWarning, stacklevel=2)
+        return OFF
+
+
+_default_mode = _mode_from_env()
+_context_mode: contextvars.ContextVar[str|None] = contextvars.ContextVar(
+    'set_algebra_validation_mode', default=None)
+
+
+def get_validation_mode() -> str:
+    """Return validation mode in effect."""
+    return _context_mode.get() or _default_mode
+
+
+def set_validation_mode(mode: str) -> None:
+    """Set module-wide validation mode."""
+    global _default_mode # pylint: disable=global-statement
+    _default_mode = _parse_mode(mode)
+
+
+@contextlib.contextmanager
+def validation(mode: str) -> Iterator[None]:
+    """
+    Context manager setting validation mode within the block.
+    The mode is local to the current thread or asyncio task.
+    """
+    token = _context_mode.set(_parse_mode(mode))
+    try:
+        yield
+    finally:
+        _context_mode.reset(token)
+
+
+def pair_error(cur: Interval|object, nex: Interval|object) -> str|None:
+    """
+    Return description of what is wrong with two adjacent pieces,
+    or None if nex follows cur with a gap between them.
+    """
+    if isinstance(cur, Interval):
+        if isinstance(nex, Interval):
+            if cur.b >= nex.a:
+                return '%s >= %s' % (cur.b.notation, nex.a.notation)
+            if are_bounding(cur.b, nex.a):
+                return 'no gap between %s and %s' % (cur.b.notation, nex.a.notation)
+        else:
+            if cur.b >= nex:
+                return '%s >= %s' % (cur.b.notation, nex)
+            if cur.b.value == nex:
+                return 'no gap between %s and %s' % (cur.b.notation, nex)
+    else:
+        if isinstance(nex, Interval):
+            if cur >= nex.a:
+                return '%s >= %s' % (cur, nex.a.notation)
+            if cur == nex.a.value:
+                return 'no gap between %s and %s' % (cur, nex.a.notation)
+        else:
+            if cur >= nex:
+                return '%s >= %s' % (cur, nex)
+
+    return None
+
+
+def check_pieces(pieces: Sequence[Interval|object], mode: str|None = None) -> None:
+    """
+    Check pieces according to mode, by default the one in effect.
+    Raise PiecesError naming indices of the first offending pair found.
+    """
+    if mode is None:
+        mode = get_validation_mode()
+
+    if mode == OFF:
+        return
+
+    n = len(pieces) - 1
+
+    if mode == SAMPLED and n > SAMPLE_SIZE:
+        indices = sorted(_random.sample(range(n), SAMPLE_SIZE))
+    else:
+        indices = range(n)
+
+    for i in indices:
+        error = pair_error(pieces[i], pieces[i+1])
+        if error is not None:
+            raise PiecesError('pieces[%d] and pieces[%d]: %s' % (i, i+1, error), i)
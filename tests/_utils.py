@@ -26,3 +26,28 @@ def do_bulk_tests(tests, fn, mode):
             assert s.pieces == expected
         else:
             raise ValueError('Invalid mode')
+
+
+def random_set(rnd, n):
+    """Set of up to n pieces over small integer values, so that pieces often touch."""
+    s = Set()
+    for _ in range(n):
+        a = rnd.randint(0, 3 * n)
+        if rnd.random() < 0.3:
+            s.add(a)
+        else:
+            b = a + rnd.randint(0, 4)
+            bounds = rnd.choice(['[]', '[)', '(]', '()'])
+            s.add(Interval(a, b, bounds))
+    return s
+
+
+def check_same(chunked, reference):
+    assert len(chunked) == len(reference)
+    assert list(chunked) == reference
+    assert chunked == reference
+    assert list(reversed(chunked)) == reference[::-1]
+    for i in range(-len(reference), len(reference)):
+        assert chunked[i] == reference[i]
+    assert all(len(c) <= 2 * chunked.LOAD for c in chunked._chunks)
+    assert all(chunked._chunks)
@@ -0,0 +1,5 @@
+from set_algebra.validation import FULL, set_validation_mode
+
+
+# Check Set pieces after every mutation throughout the test suite.
+set_validation_mode(FULL)
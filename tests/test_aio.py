@@ -0,0 +1,116 @@
+import asyncio
+import doctest
+import random
+
+import pytest
+
+from set_algebra import FrozenSet, Interval, Set
+from set_algebra import aio
+
+from ._utils import random_set
+
+
+def random_pieces(rnd, n):
+    pieces = []
+    for _ in range(n):
+        a = rnd.randint(0, 60)
+        if rnd.random() < 0.2:
+            pieces.append(a)
+        else:
+            pieces.append(Interval(a, a + rnd.randint(0, 8), rnd.choice(['[]', '[)', '(]', '()'])))
+    return pieces
+
+
+async def aiterate(pieces):
+    for piece in pieces:
+        yield piece
+
+
+def test_doctest():
+
+    assert doctest.testmod(aio).failed == 0
+
+
+def test_from_pieces_matches_from_pieces():
+
+    rnd = random.Random(22)
+    for _ in range(200):
+        pieces = random_pieces(rnd, rnd.randint(0, 30))
+        chunk_size = rnd.randint(1, 8)
+        expected = Set.from_pieces(pieces)
+
+        result = asyncio.run(aio.from_pieces(pieces, chunk_size=chunk_size))
+        assert result.pieces == expected.pieces
+        result = asyncio.run(aio.from_pieces(aiterate(pieces), chunk_size=chunk_size))
+        assert result.pieces == expected.pieces
+
+        pieces.sort(key=lambda p: (p.a.value, p.a.open) if isinstance(p, Interval) else (p, False))
+        result = asyncio.run(aio.from_pieces(pieces, presorted=True, chunk_size=chunk_size))
+        assert result.pieces == expected.pieces
+
+
+def test_operations_match_set_operations():
+
+    rnd = random.Random(23)
+    for _ in range(100):
+        x = random_set(rnd, rnd.randint(0, 10))
+        others = [random_set(rnd, rnd.randint(0, 10)) for _ in range(rnd.randint(0, 3))]
+        chunk_size = rnd.randint(1, 5)
+
+        async def run():
+            assert await aio.union(x, *others, chunk_size=chunk_size) == x.union(*others)
+            assert await aio.intersection(x, *others, chunk_size=chunk_size) == x.intersection(*others)
+            assert await aio.difference(x, *others, chunk_size=chunk_size) == x.difference(*others)
+            assert await aio.symmetric_difference(x, *others, chunk_size=chunk_size) == \
+                x.symmetric_difference(*others)
+
+            # Iterables and asynchronous iterables of pieces.
+            iterables = [aiterate(other.pieces) if i % 2 else list(other.pieces)
+                         for i, other in enumerate(others)]
+            assert await aio.union(x, *iterables, chunk_size=chunk_size) == x.union(*others)
+
+            s = x.copy()
+            await aio.update(s, *others, chunk_size=chunk_size)
+            assert s == x.union(*others)
+
+        asyncio.run(run())
+
+
+def test_event_loop_is_not_blocked():
+
+    pieces = [Interval(i * 10, i * 10 + 5, '[)') for i in range(2000)]
+    random.Random(24).shuffle(pieces)
+
+    async def run():
+        ticks = 0
+        done = False
+
+        async def tick():
+            nonlocal ticks
+            while not done:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticker = asyncio.create_task(tick())
+        await asyncio.sleep(0)
+        s = await aio.from_pieces(pieces, chunk_size=100)
+        s = await aio.union(s, Set('[0, 100]'), chunk_size=100)
+        done = True
+        await ticker
+        return s, ticks
+
+    s, ticks = asyncio.run(run())
+    assert len(s.pieces) == 1990
+    assert ticks > 40
+
+
+def test_frozen_set():
+
+    async def run():
+        s = await aio.from_pieces([Interval('[0, 1]')], cls=FrozenSet)
+        assert type(s) is FrozenSet
+        assert type(await aio.union(s, [5])) is FrozenSet
+        with pytest.raises(TypeError):
+            await aio.update(s, [5])
+
+    asyncio.run(run())
@@ -0,0 +1,36 @@
+"""Smoke test of the benchmark suite, so that it does not rot between releases."""
+import json
+
+from benchmarks import compare, run
+from benchmarks.cases import CASES
+from benchmarks.generators import GENERATORS
+from set_algebra.validation import FULL, check_pieces
+
+
+def test_generators():
+
+    for generate in GENERATORS.values():
+        s = generate(200)
+        assert len(s.pieces) == 200
+        check_pieces(s.pieces, FULL)
+        assert s == generate(200)
+        assert s != generate(200, seed=1)
+
+
+def test_run_and_compare(tmp_path, capsys):
+
+    baseline = tmp_path / 'baseline.json'
+    new = tmp_path / 'new.json'
+    args = ['--sizes', '20', '--kinds', 'mixed', '--repeat', '1', '--min-time', '0', '-q']
+
+    assert run.main(args + ['-o', str(baseline)]) == 0
+    assert run.main(args + ['--cases', 'search', 'union', '-o', str(new)]) == 0
+
+    report = json.loads(baseline.read_text())
+    assert {r['case'] for r in report['results']} == set(CASES)
+    assert report['meta']['set_algebra']
+
+    assert compare.main([str(baseline), str(new), '--threshold', '1e9']) == 0
+    out = capsys.readouterr().out
+    assert 'search' in out
+    assert 'parse' not in out
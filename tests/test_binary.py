@@ -0,0 +1,148 @@
+from array import array
+import mmap
+import struct
+
+import pytest
+
+from set_algebra import CompactSet, Set, binary
+from set_algebra.infinity import inf, neg_inf
+
+
+def test_set_round_trip():
+
+    for notation in ('', '{1}', '[1, 2], {3}, (5, inf)', '(-inf, 0), (0, 1], [2.5, 3)', '(-inf, inf)'):
+        s = Set(notation or None)
+        assert Set.from_buffer(s.to_bytes()) == s
+
+    s = Set.from_buffer(Set('(-inf, 0], {1}').to_bytes())
+    assert s.pieces[0].a.value is neg_inf
+    assert s.pieces[1] == 1.0
+
+
+def test_compact_set_round_trip():
+
+    c = CompactSet('[1, 2], {3}, (5, inf)')
+    data = c.to_bytes()
+    assert data == Set('[1, 2], {3}, (5, inf)').to_bytes()
+    assert len(data) == 16 + 17 * 3
+
+    loaded = CompactSet.from_buffer(data)
+    assert loaded == c
+    assert loaded.notation == c.notation
+    assert (~loaded).to_set() == ~c.to_set()
+    assert inf not in loaded
+
+
+def test_compact_set_from_buffer_does_not_copy():
+
+    buf = bytearray(CompactSet('[1, 2], [3, 4]').to_bytes())
+    c = CompactSet.from_buffer(buf)
+    assert isinstance(c.lefts, memoryview)
+
+    struct.pack_into('=d', buf, 16, 0.5)
+    assert c.pieces[0] == Set('[0.5, 2]').pieces[0]
+
+    copied = c.copy()
+    assert isinstance(copied.lefts, array)
+    assert copied == c
+
+
+def test_from_mmap(tmp_path):
+
+    s = Set('[1, 2], {3}, (5, inf)')
+    path = tmp_path / 'set.bin'
+    path.write_bytes(s.to_bytes())
+
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            assert Set.from_buffer(m) == s
+            c = CompactSet.from_buffer(m)
+            assert 4 not in c
+            assert 6 in c
+            del c
+
+
+def test_foreign_byte_order():
+
+    s = Set('[1, 2], {3}, (5, inf)')
+    data = bytearray(s.to_bytes())
+    n = len(s.pieces)
+
+    foreign = b'>' if data[5:6] == b'<' else b'<'
+    data[5:6] = foreign
+    data[8:16] = data[8:16][::-1]
+    for i in range(2 * n):
+        offset = 16 + 8*i
+        data[offset:offset+8] = data[offset:offset+8][::-1]
+
+    assert Set.from_buffer(data) == s
+    assert CompactSet.from_buffer(data) == CompactSet(s)
+
+
+def test_invalid_buffer():
+
+    data = Set('[1, 2]').to_bytes()
+
+    with pytest.raises(ValueError, match='too short'):
+        Set.from_buffer(data[:10])
+
+    with pytest.raises(ValueError, match='does not contain'):
+        Set.from_buffer(b'XXXX' + data[4:])
+
+    with pytest.raises(ValueError, match='version'):
+        Set.from_buffer(data[:4] + b'\x09' + data[5:])
+
+    with pytest.raises(ValueError, match='byte order'):
+        Set.from_buffer(data[:5] + b'?' + data[6:])
+
+    with pytest.raises(ValueError, match='buffer size'):
+        Set.from_buffer(data + b'\x00')
+
+
+def test_unsorted_buffer():
+
+    lefts = array('d', [3, 1])
+    rights = array('d', [4, 2])
+    flags = array('B', [0, 0])
+
+    for cls in (Set, CompactSet):
+        with pytest.raises(ValueError, match=r'pieces\[0\] and pieces\[1\]: 4.0 > 1.0'):
+            cls.from_buffer(binary.dumps(lefts, rights, flags))
+
+
+def test_non_numeric_values():
+
+    with pytest.raises(TypeError):
+        Set(['a']).to_bytes()
+
+
+def test_corrupt_buffer():
+
+    def corrupt(notation, offset, value):
+        data = bytearray(Set(notation).to_bytes())
+        struct.pack_into('=d', data, offset, value)
+        return data
+
+    for data, message in [
+        # Right value of the first piece moved past left value of the second.
+        (corrupt('[1, 2], [3, 4]', 16 + 8*2, 3.5), '3.5 > 3.0'),
+        (corrupt('[1, 2]', 16, 5), 'empty'),
+        (corrupt('[1, 2]', 16, float('nan')), 'empty'),
+        (corrupt('[1, 2]', 16, float('-inf')), 'closed at infinity'),
+    ]:
+        for cls in (Set, CompactSet):
+            with pytest.raises(ValueError, match=message):
+                cls.from_buffer(data)
+
+    # Left value of the second piece moved to [1, 2), [2, 4].
+    with pytest.raises(ValueError, match='no gap at 2.0'):
+        Set.from_buffer(corrupt('[1, 2), [3, 4]', 16 + 8, 2))
+
+    bad_flags = bytearray(Set('[1, 2]').to_bytes())
+    bad_flags[-1] = 4
+    with pytest.raises(ValueError, match='invalid flags'):
+        CompactSet.from_buffer(bad_flags)
+
+    # Trusted data is not checked.
+    assert Set.from_buffer(corrupt('[1, 2]', 16, 5), validate=False).pieces[0].a.value == 5
+    assert Set.from_buffer(Set('(1, 2), (2, 3)').to_bytes()) == Set('(1, 2), (2, 3)')
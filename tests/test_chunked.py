@@ -0,0 +1,123 @@
+import random
+
+import pytest
+
+from set_algebra import ChunkedSet, Interval, Set
+from set_algebra.chunked import ChunkedList
+
+from ._utils import check_same, random_set
+
+
+class TinyChunkedList(ChunkedList):
+    __slots__ = ()
+    LOAD = 4
+
+
+class TinyChunkedSet(ChunkedSet):
+    container = TinyChunkedList
+
+
+def test_chunked_list_matches_list():
+
+    rnd = random.Random(5)
+    reference = list(range(30))
+    chunked = TinyChunkedList(reference)
+    check_same(chunked, reference)
+
+    for _ in range(2000):
+        n = len(reference)
+        action = rnd.randrange(5)
+        i = rnd.randint(0, n)
+        j = rnd.randint(i, min(n, i + 12))
+        items = [rnd.random() for _ in range(rnd.randint(0, 12))]
+
+        if action == 0:
+            reference.insert(i, items[:1])
+            chunked.insert(i, items[:1])
+        elif action == 1:
+            reference[i:j] = items
+            chunked[i:j] = items
+        elif action == 2:
+            del reference[i:j]
+            del chunked[i:j]
+        elif action == 3 and n:
+            k = rnd.randrange(n)
+            reference[k] = items
+            chunked[k] = items
+            del reference[k]
+            del chunked[k]
+        else:
+            assert chunked[i:j] == reference[i:j]
+
+        check_same(chunked, reference)
+
+
+def test_chunked_list_errors_and_slices():
+
+    chunked = TinyChunkedList(range(10))
+
+    with pytest.raises(IndexError):
+        chunked[10]
+    with pytest.raises(IndexError):
+        chunked[-11]
+
+    assert chunked[::2] == [0, 2, 4, 6, 8]
+    assert chunked[8:2] == []
+    chunked[::3] = ['a', 'b', 'c', 'd']
+    assert chunked == ['a', 1, 2, 'b', 4, 5, 'c', 7, 8, 'd']
+    del chunked[1::2]
+    assert chunked == ['a', 2, 4, 'c', 8]
+    chunked.insert(-100, 'x')
+    chunked.insert(100, 'y')
+    chunked.append('z')
+    assert chunked == ['x', 'a', 2, 4, 'c', 8, 'y', 'z']
+    assert chunked != ['x']
+    assert chunked.copy() == chunked
+    assert chunked + [1] == ['x', 'a', 2, 4, 'c', 8, 'y', 'z', 1]
+
+
+def test_chunked_set_matches_set():
+
+    rnd = random.Random(6)
+    s = Set()
+    c = TinyChunkedSet()
+
+    for _ in range(1000):
+        a = rnd.randint(0, 200)
+        b = a + rnd.randint(0, 6)
+        piece = rnd.choice([a, Interval(a, b, rnd.choice(['[]', '[)', '(]', '()']))])
+
+        if rnd.random() < 0.6:
+            s.add(piece)
+            c.add(piece)
+        else:
+            s.remove(piece)
+            c.remove(piece)
+
+        assert isinstance(c.pieces, TinyChunkedList)
+        assert c.pieces == s.pieces
+
+    n = len(s.pieces)
+    for x in range(-1, 210):
+        assert c.search(x) == s.search(x)
+        lo = rnd.randint(0, n)
+        hi = rnd.randint(lo, n)
+        assert c.search(x, lo) == s.search(x, lo)
+        assert c.search(x, lo, hi) == s.search(x, lo, hi)
+
+
+def test_chunked_set_operations():
+
+    rnd = random.Random(7)
+    x = random_set(rnd, 50)
+    y = random_set(rnd, 50)
+    cx = ChunkedSet(x)
+    cy = ChunkedSet(y)
+
+    for result, expected in [(cx | cy, x | y), (cx & cy, x & y), (cx - cy, x - y),
+                             (cx ^ cy, x ^ y), (~cx, ~x), (cx.copy(), x)]:
+        assert type(result) is ChunkedSet
+        assert isinstance(result.pieces, ChunkedList)
+        assert result == expected
+
+    assert repr(ChunkedSet('[1, 2], {3}')) == "ChunkedSet([Interval('[1, 2]'), 3])"
@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from set_algebra import CompactSet, Interval, Set, inf, neg_inf
+
+from ._utils import random_set
+
+
+
+def test_compact_set_init():
+
+    assert CompactSet().pieces == []
+    assert not CompactSet()
+    assert CompactSet(Set()).pieces == []
+
+    c = CompactSet('(-inf, 0), {1}, [2, 3), (4, inf)')
+    assert c.pieces == [Interval('(-inf, 0)'), 1, Interval('[2, 3)'), Interval('(4, inf)')]
+    assert c.pieces[0].a.value is neg_inf
+    assert c.pieces[-1].b.value is inf
+    assert c.notation == '(-inf, 0.0), {1.0}, [2.0, 3.0), (4.0, inf)'
+    assert list(c.flags) == [3, 0, 2, 3]
+
+    assert CompactSet([Interval('[2, 3]'), 1, Interval('(0, 1)')]).pieces == [Interval('(0, 1]'), Interval('[2, 3]')]
+    assert CompactSet(c) == c
+    assert CompactSet(c) is not c
+    assert c.copy() == c
+    assert CompactSet(c.to_set()) == c
+
+    with pytest.raises(TypeError):
+        CompactSet(['a'])
+
+
+def test_compact_set_search_and_contains():
+
+    rnd = random.Random(3)
+
+    for _ in range(50):
+        s = random_set(rnd, 10)
+        c = CompactSet(s)
+        for x in range(-1, 40):
+            x /= 2
+            assert c.search(x) == s.search(x)
+            assert (x in c) is (x in s)
+
+        for p in s.pieces:
+            if isinstance(p, Interval):
+                assert p in c
+                closed = Interval(p.a.value, p.b.value, '[]')
+                assert (closed in c) is (closed in s)
+
+
+def test_compact_set_operations():
+
+    rnd = random.Random(4)
+
+    for _ in range(200):
+        x = random_set(rnd, rnd.randint(0, 10))
+        y = random_set(rnd, rnd.randint(0, 10))
+        cx = CompactSet(x)
+        cy = CompactSet(y)
+
+        assert (cx | cy).to_set() == x | y
+        assert (cx & cy).to_set() == x & y
+        assert (cx - cy).to_set() == x - y
+        assert (cx ^ cy).to_set() == x ^ y
+        assert (~cx).to_set() == ~x
+        assert ~~cx == cx
+
+        assert cx | y == cx | cy
+        assert cx - y == cx - cy
+
+    with pytest.raises(TypeError):
+        CompactSet() | [1]
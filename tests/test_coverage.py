@@ -0,0 +1,68 @@
+import functools
+import itertools
+import operator
+import random
+
+import pytest
+
+from set_algebra import Interval, Set, inf, neg_inf
+from set_algebra.coverage import at_least, coverage
+
+from ._utils import random_set
+
+
+def at_least_reference(sets, k):
+    """Union of intersections of all combinations of k sets."""
+    result = Set()
+    for combination in itertools.combinations(sets, k):
+        result |= functools.reduce(operator.and_, combination)
+    return result
+
+
+def test_coverage_depths():
+
+    rnd = random.Random(5)
+
+    for _ in range(100):
+        sets = [random_set(rnd, rnd.randint(0, 8)) for _ in range(rnd.randint(1, 5))]
+        pieces = coverage(sets)
+
+        assert Set.from_pieces(p for p, _ in pieces) == Set.union_all(sets)
+
+        for (p, depth), (q, next_depth) in zip(pieces, pieces[1:]):
+            if len(Set([p, q]).pieces) == 1:
+                # Touching pieces must be of different depths.
+                assert depth != next_depth
+
+        for p, depth in pieces:
+            x = (p.a.value + p.b.value) / 2 if isinstance(p, Interval) else p
+            assert depth == sum(x in s for s in sets)
+
+
+def test_at_least():
+
+    rnd = random.Random(6)
+
+    for _ in range(100):
+        sets = [random_set(rnd, rnd.randint(0, 8)) for _ in range(rnd.randint(1, 4))]
+        for k in range(1, len(sets) + 2):
+            assert at_least(sets, k) == at_least_reference(sets, k)
+
+    with pytest.raises(ValueError):
+        at_least([Set('[1, 2]')], 0)
+
+
+def test_coverage_unbounded():
+
+    sets = [Set('(-inf, 5]'), Set('[0, inf)'), [Interval('[2, 3]')]]
+    assert coverage(sets) == [
+        (Interval('(-inf, 0)'), 1),
+        (Interval('[0, 2)'), 2),
+        (Interval('[2, 3]'), 3),
+        (Interval('(3, 5]'), 2),
+        (Interval('(5, inf)'), 1),
+    ]
+    assert coverage([]) == []
+    assert at_least(sets, 2) == Set('[0, 5]')
+    assert at_least(sets, 1).pieces[0].a.value is neg_inf
+    assert at_least(sets, 1).pieces[-1].b.value is inf
@@ -1,6 +1,6 @@
 import pytest
 
-from set_algebra import Endpoint, are_bounding, inf, neg_inf
+from set_algebra import Endpoint, FrozenEndpoint, are_bounding, inf, neg_inf
 
 
 def test_endpoint_init_from_notation_int():
@@ -103,6 +103,15 @@ def test_endpoint_invert():
     assert ~Endpoint('1]') == Endpoint('(1')
     assert ~Endpoint('1)') == Endpoint('[1')
     assert ~~Endpoint('[2') == Endpoint('[2')
+    with pytest.raises(ValueError):
+        ~Endpoint('(-inf') # pylint: disable=expression-not-assigned
+
+
+def test_endpoint_make():
+    e = Endpoint._make(1, True, False)
+    assert e == Endpoint('1)')
+    assert type(e) is Endpoint
+    assert type(FrozenEndpoint._make(1, True, False)) is FrozenEndpoint
 
 
 def test_endpoint_notation():
@@ -417,6 +426,31 @@ def test_endpoint_copy():
     assert e1 is not e2
 
 
+def test_frozen_endpoint():
+    e = FrozenEndpoint('(1')
+    assert e == Endpoint('(1')
+    assert e != 1
+    assert e.copy() is e
+    assert ~e == Endpoint('1]')
+    assert type(~e) is FrozenEndpoint
+    assert hash(e) == hash(FrozenEndpoint(1, '('))
+    assert len({e, FrozenEndpoint('(1'), FrozenEndpoint('[1')}) == 2
+
+    # Closed FrozenEndpoints are equal to their values, so hash the same.
+    for closed in [FrozenEndpoint('[1'), FrozenEndpoint('1]'), FrozenEndpoint(1.5, ']')]:
+        assert closed == closed.value
+        assert hash(closed) == hash(closed.value)
+    assert {1: 'one'}[FrozenEndpoint('[1')] == 'one'
+    assert 1 not in {e}
+
+    with pytest.raises(AttributeError):
+        e.open = False
+    with pytest.raises(AttributeError):
+        del e.value
+    with pytest.raises(ValueError):
+        FrozenEndpoint('[inf')
+
+
 def test_are_bounding():
     assert not are_bounding(Endpoint('(1'), Endpoint('1)'))
     assert are_bounding(Endpoint('(1'), Endpoint('1]'))
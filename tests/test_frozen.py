@@ -0,0 +1,187 @@
+import pickle
+
+import pytest
+
+from set_algebra import (Endpoint, FrozenEndpoint, FrozenInterval, FrozenSet, Interval, Set, inf,
+    unbounded)
+
+
+def test_frozen_interval():
+
+    i = FrozenInterval('[1, 2)')
+    assert i == Interval('[1, 2)')
+    assert Interval('[1, 2)') == i
+    assert hash(i) == hash(FrozenInterval(1, 2, '[)'))
+    assert i.copy() is i
+    assert type(Interval.copy(i)) is Interval
+
+    with pytest.raises(AttributeError):
+        i.a = i.b
+    with pytest.raises(AttributeError):
+        del i.b
+
+    assert hash(FrozenInterval('(-inf, inf)')) == hash(FrozenInterval('(-inf, inf)'))
+
+    # Endpoints are frozen as well.
+    a = Endpoint('[1')
+    i = FrozenInterval(a, Endpoint('2)'))
+    assert type(i.a) is type(i.b) is FrozenEndpoint
+    a.open = True
+    assert i == Interval('[1, 2)')
+    with pytest.raises(AttributeError):
+        i.a.open = True
+
+
+def test_frozen_pieces_are_shared():
+
+    s = FrozenSet('[1, 2], {3}, (5, inf)')
+    t = Set(s)
+    assert all(p1 is p2 for p1, p2 in zip(s.pieces, t.pieces))
+    assert s.copy() is s
+
+    # Changes replace shared pieces, never change them.
+    t.remove(Interval('[1.5, 6)'))
+    t.add(Interval('[0, 1]'))
+    assert t == Set('[0, 1.5), [6, inf)')
+    assert s == Set('[1, 2], {3}, (5, inf)')
+    # The right endpoint of the last piece is still that of s.
+    assert FrozenSet(t).pieces[1].b is t.pieces[1].b is s.pieces[2].b
+
+
+def test_infinite_endpoints_are_interned():
+
+    left = FrozenSet('(-inf, 0)').pieces[0].a
+    assert type(left) is FrozenEndpoint
+    assert (~FrozenSet('[0, inf)')).pieces[0].a is left
+    assert (FrozenSet('(-inf, 1)') | Set('[1, 2]')).pieces[0].a is left
+    right = FrozenInterval('(0, inf)').b
+    assert (~FrozenSet('(-inf, 0]')).pieces[0].b is right
+    assert FrozenSet([Interval('(-inf, 0)')]).pieces[0].a is left
+
+
+def test_mutable_sets_have_mutable_infinite_endpoints():
+
+    for s in [Set('(-inf, 0), (1, inf)'), ~Set('[0, 1]'), Set('(-inf, 1)') | Set('[1, 2], (3, inf)'),
+              Set([Interval('(-inf, 0)'), Interval('(1, inf)')]), Set([unbounded]), ~Set()]:
+        for endpoint in s.pieces[0].a, s.pieces[-1].b:
+            assert type(endpoint) is Endpoint
+        s.pieces[0].a.open = True
+        assert 'Frozen' not in repr(s)
+
+    assert type(unbounded.a) is Endpoint and type(unbounded.b) is Endpoint
+
+
+def test_set_does_not_share_endpoints_of_the_caller():
+
+    x = Interval('[1, 2]')
+    s = Set()
+    s.add(x)
+    s.add(Interval('[2, 3]'))
+    x.a.value = 0
+    x.b.open = True
+    assert s == Set('[1, 3]')
+
+
+def test_frozen_set_init():
+
+    s = FrozenSet('[1, 2], {3}, (5, inf)')
+    assert s == Set('[1, 2], {3}, (5, inf)')
+    assert Set('[1, 2], {3}, (5, inf)') == s
+    assert s != Set('[1, 2], {3}')
+    assert isinstance(s.pieces, tuple)
+    assert all(type(p) is FrozenInterval for p in s.pieces if isinstance(p, Interval))
+    assert repr(s) == "FrozenSet([FrozenInterval('[1, 2]'), 3, FrozenInterval('(5, inf)')])"
+
+    assert FrozenSet([Interval('[3, 4]'), Interval('[1, 3)')]) == FrozenSet('[1, 4]')
+    assert FrozenSet(Set('{1}')) == FrozenSet.from_pieces([1])
+    assert FrozenSet() == FrozenSet(None) == Set()
+
+
+def test_frozen_set_hash():
+
+    a = FrozenSet('[1, 2], {3}')
+    b = FrozenSet([3, Interval('[1, 2]')])
+    assert a is not b
+    assert hash(a) == hash(b)
+    assert len({a, b, FrozenSet('{3}')}) == 2
+    assert {a: 1}[b] == 1
+
+    with pytest.raises(TypeError):
+        hash(Set('{1}'))
+
+
+def test_frozen_set_is_immutable():
+
+    s = FrozenSet('[1, 2], {3}')
+
+    for method, args in [('add', (5,)), ('remove', (3,)), ('clear', ()),
+                         ('update', ([5],)), ('intersection_update', ([5],)),
+                         ('difference_update', ([5],)), ('symmetric_difference_update', ([5],))]:
+        with pytest.raises(TypeError):
+            getattr(s, method)(*args)
+
+    with pytest.raises(AttributeError):
+        s.pieces = []
+
+    with pytest.raises(AttributeError):
+        s.pieces[0].b = s.pieces[0].a
+
+    assert s == Set('[1, 2], {3}')
+
+
+def test_frozen_set_operations():
+
+    s = FrozenSet('[1, 2], {3}')
+    other = Set('[2, 4]')
+
+    for result in (s | other, s & other, s - other, s ^ other, ~s,
+                   s.union([5]), s.intersection(other), s.difference([1]),
+                   s.symmetric_difference(other)):
+        assert type(result) is FrozenSet
+
+    assert s | other == Set('[1, 4]')
+    assert s.union([5]) == Set('[1, 2], {3}, {5}')
+    assert s.difference([1]) == Set('(1, 2], {3}')
+    assert type(other | s) is Set
+
+    t = s
+    t |= Set('{5}')
+    assert t == Set('[1, 2], {3}, {5}')
+    assert s == Set('[1, 2], {3}')
+    t -= Set('{3}')
+    assert t == Set('[1, 2], {5}')
+    t &= Set('[0, 2]')
+    assert t == Set('[1, 2]')
+    t ^= Set('[1, 2]')
+    assert t == Set()
+
+    assert s.copy() is s
+    mutable = Set(s)
+    mutable.add(Interval('[2, 3]'))
+    assert mutable == Set('[1, 3]')
+    assert s == Set('[1, 2], {3}')
+
+
+def test_frozen_set_caches():
+
+    s = FrozenSet('[1, 2], {3}, [5, 7)')
+
+    assert ~s is ~s
+    assert ~~s is s
+    assert ~s == ~Set(s)
+
+    assert s.bounds() == Interval('[1, 7)')
+    assert s.bounds() is s.bounds()
+    assert s.measure() == 3
+    assert FrozenSet('(-inf, 0)').measure() is inf
+    assert FrozenSet().bounds() is None
+
+
+def test_frozen_set_pickle():
+
+    s = FrozenSet('[1, 2], {3}')
+    hash(s)
+    t = pickle.loads(pickle.dumps(s))
+    assert t == s
+    assert hash(t) == hash(s)
+    assert type(t) is FrozenSet
@@ -0,0 +1,60 @@
+import random
+
+from set_algebra import CompactSet, Interval, IntervalIndex, Set
+
+from ._utils import random_set
+
+
+def test_index_matches_linear_scan():
+
+    rnd = random.Random(8)
+    items = []
+    for i in range(60):
+        if rnd.random() < 0.3:
+            a = rnd.randint(0, 40)
+            obj = Interval(a, a + rnd.randint(0, 6), rnd.choice(['[]', '[)', '(]', '()']))
+        else:
+            obj = random_set(rnd, rnd.randint(0, 5))
+        items.append(('label%d' % i, obj))
+
+    index = IntervalIndex(items)
+    assert len(index) == 60
+
+    def as_set(obj):
+        return obj if isinstance(obj, Set) else Set([obj])
+
+    for x in range(-2, 50):
+        for value in (x, x + 0.5):
+            assert index.stab(value) == [label for label, obj in items if value in obj]
+
+    for _ in range(300):
+        a = rnd.randint(-2, 48)
+        query = Interval(a, a + rnd.randint(0, 5), rnd.choice(['[]', '[)', '(]', '()']))
+        expected = [label for label, obj in items if not as_set(obj).isdisjoint(Set([query]))]
+        assert index.overlapping(query) == expected
+
+
+def test_index_open_and_closed_endpoints():
+
+    index = IntervalIndex()
+    index.add('open', Interval('(1, 2)'))
+    index.add('closed', Interval('[2, 3]'))
+    index.add('empty', Interval('(5, 5)'))
+    index.add('scalar', 4)
+    index.add('unbounded', Set('(-inf, 0), (6, inf)'))
+    index.add('compact', CompactSet('[0.5, 1]'))
+
+    assert index.stab(1) == ['compact']
+    assert index.stab(2) == ['closed']
+    assert index.stab(1.5) == ['open']
+    assert index.stab(5) == []
+    assert index.stab(4) == ['scalar']
+    assert index.stab(-1e9) == ['unbounded']
+
+    assert index.overlapping(Interval('[1, 2)')) == ['open', 'compact']
+    assert index.overlapping(Interval('[0, 6]')) == ['open', 'closed', 'scalar', 'compact']
+    assert index.overlapping(Set('{2}, {7}')) == ['closed', 'unbounded']
+    assert index.overlapping(Interval('(5, 5)')) == []
+
+    index.add('late', Interval('[0, 10]'))
+    assert index.stab(5) == ['late']
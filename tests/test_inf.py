@@ -1,4 +1,4 @@
-from set_algebra import inf, neg_inf
+from set_algebra import inf, is_finite, neg_inf
 
 
 def test_eq():
@@ -92,3 +92,15 @@ def test_other_gt_inf():
 
 def test_neg():
     assert -inf is neg_inf
+
+
+def test_is_finite():
+    assert is_finite(1)
+    assert is_finite(True)
+    assert is_finite(1.5)
+    assert is_finite('A')
+    assert not is_finite(inf)
+    assert not is_finite(neg_inf)
+    assert not is_finite(float('inf'))
+    assert not is_finite(float('-inf'))
+    assert not is_finite(float('nan'))
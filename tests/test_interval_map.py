@@ -0,0 +1,141 @@
+import random
+
+import pytest
+
+from set_algebra import Interval, IntervalMap, Set
+
+
+def random_key(rnd):
+    a = rnd.randint(0, 30)
+    if rnd.random() < 0.2:
+        return a
+    return Interval(a, a + rnd.randint(0, 6), rnd.choice(['[]', '[)', '(]', '()']))
+
+
+def probes():
+    return [x / 2 for x in range(-4, 80)]
+
+
+def reference_assign(ref, key, value):
+    for x in probes():
+        if x in Set([key]):
+            ref[x] = value
+
+
+def reference_remove(ref, key):
+    for x in probes():
+        if x in Set([key]):
+            ref.pop(x, None)
+
+
+def test_assign_and_remove_match_reference():
+
+    rnd = random.Random(14)
+    for _ in range(30):
+        imap = IntervalMap()
+        ref = {}
+        for _ in range(25):
+            key = random_key(rnd)
+            if rnd.random() < 0.25:
+                imap.remove(key)
+                reference_remove(ref, key)
+            else:
+                value = rnd.choice('abc')
+                imap[key] = value
+                reference_assign(ref, key, value)
+
+            for x in probes():
+                assert imap.get(x) == ref.get(x)
+                assert (x in imap) == (x in ref)
+
+            # Touching pieces always have different values.
+            items = list(imap.items())
+            for (p1, v1), (p2, v2) in zip(items, items[1:]):
+                if v1 == v2:
+                    assert len((Set([p1]) | Set([p2])).pieces) == 2
+
+            assert imap.domain() == Set(p for p, v in items)
+
+
+def test_assign_splits_and_coalesces():
+
+    imap = IntervalMap()
+    imap[Interval('[0, 10]')] = 1
+    imap[Interval('(3, 5)')] = 2
+    assert list(imap.items()) == [
+        (Interval('[0, 3]'), 1), (Interval('(3, 5)'), 2), (Interval('[5, 10]'), 1)]
+    assert len(imap) == 3
+
+    imap[4] = 1
+    assert list(imap.items()) == [(Interval('[0, 3]'), 1), (Interval('(3, 4)'), 2), (4, 1),
+                                  (Interval('(4, 5)'), 2), (Interval('[5, 10]'), 1)]
+
+    imap[Interval('(3, 5)')] = 1
+    assert list(imap.items()) == [(Interval('[0, 10]'), 1)]
+
+    imap.assign(Set('[20, 25], {30}'), 1)
+    assert list(imap.items()) == [(Interval('[0, 10]'), 1), (Interval('[20, 25]'), 1), (30, 1)]
+
+    del imap[Interval('(5, 22)')]
+    assert list(imap.items()) == [(Interval('[0, 5]'), 1), (Interval('[22, 25]'), 1), (30, 1)]
+
+
+def test_lookup():
+
+    imap = IntervalMap([(Interval('[0, 1)'), 'a'), (Interval('(1, 2]'), 'b')])
+    assert imap[0] == 'a'
+    assert imap[2] == 'b'
+    assert imap.get(1) is None
+    assert imap.get(1, 'x') == 'x'
+    assert 1 not in imap
+    with pytest.raises(KeyError):
+        imap[1]
+    assert not IntervalMap()
+    assert IntervalMap().get(0) is None
+
+
+def test_items_within():
+
+    imap = IntervalMap([(Interval('[0, 10)'), 'a'), (Interval('[10, 20]'), 'b'), (30, 'c')])
+    assert list(imap.items(Interval('(5, 15)'))) == [(Interval('(5, 10)'), 'a'), (Interval('[10, 15)'), 'b')]
+    assert list(imap.items(Interval('[20, 30]'))) == [(20, 'b'), (30, 'c')]
+    assert list(imap.items(10)) == [(10, 'b')]
+    assert list(imap.items(Interval('(20, 30)'))) == []
+
+
+def test_combine():
+
+    rnd = random.Random(15)
+    for _ in range(50):
+        m1 = IntervalMap((random_key(rnd), rnd.randint(0, 2)) for _ in range(rnd.randint(0, 8)))
+        m2 = IntervalMap((random_key(rnd), rnd.randint(0, 2)) for _ in range(rnd.randint(0, 8)))
+        combined = m1.combine(m2, lambda v1, v2: v1 + v2, default=0)
+
+        expected = IntervalMap()
+        for piece, value in m1.items():
+            expected[piece] = value
+        for piece, value in m2.items():
+            for clipped, old in list(expected.items(piece)):
+                expected[clipped] = old + value
+            for gap in (Set([piece]) - expected.domain()).pieces:
+                expected[gap] = value
+
+        assert combined == expected
+        for x in probes():
+            if x in m1 or x in m2:
+                assert combined[x] == m1.get(x, 0) + m2.get(x, 0)
+            else:
+                assert x not in combined
+
+    with pytest.raises(TypeError):
+        IntervalMap().combine({}, max)
+
+
+def test_copy_and_equality():
+
+    imap = IntervalMap([(Interval('[0, 1]'), 'a')])
+    copy = imap.copy()
+    assert copy == imap
+    copy[5] = 'b'
+    assert copy != imap
+    assert repr(imap) == "IntervalMap([(Interval('[0, 1]'), 'a')])"
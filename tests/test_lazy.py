@@ -0,0 +1,127 @@
+import random
+
+import pytest
+
+from set_algebra import Interval, Set
+from set_algebra.lazy import Complement, Intersection, Leaf, SymmetricDifference, Union, lazy
+
+from ._utils import random_set
+
+
+def random_expression(rnd, sets, depth):
+    """Return a pair (lazy expression, eagerly computed Set)."""
+    if depth == 0 or rnd.random() < 0.3:
+        s = rnd.choice(sets)
+        return lazy(s), s
+
+    op = rnd.choice(['|', '&', '-', '^', '~'])
+    x, x_set = random_expression(rnd, sets, depth - 1)
+    if op == '~':
+        return ~x, ~x_set
+
+    y, y_set = random_expression(rnd, sets, depth - 1)
+    choice = rnd.random()
+    if choice < 0.4:
+        # Plain Set as the right operand.
+        y = y_set
+    elif choice < 0.8:
+        # Plain Set as the left operand.
+        x = x_set
+    if op == '|':
+        return x | y, x_set | y_set
+    if op == '&':
+        return x & y, x_set & y_set
+    if op == '-':
+        return x - y, x_set - y_set
+    return x ^ y, x_set ^ y_set
+
+
+def test_lazy_matches_eager():
+
+    rnd = random.Random(15)
+    for _ in range(300):
+        sets = [random_set(rnd, rnd.randint(0, 8)) for _ in range(4)]
+        sets.append(Set('(-inf, 3], [20, inf)'))
+        expr, expected = random_expression(rnd, sets, 4)
+
+        assert expr.evaluate() == expected
+        assert expr.simplify().evaluate() == expected
+        assert bool(expr) == bool(expected)
+
+        for x in range(-1, 30):
+            for value in (x, x + 0.5):
+                assert (value in expr) == (value in expected)
+
+        other = random_set(rnd, 4)
+        assert expr.isdisjoint(other) == expected.isdisjoint(other)
+
+        a = rnd.randint(0, 25)
+        interval = Interval(a, a + rnd.randint(1, 4), rnd.choice(['[]', '[)', '(]', '()']))
+        assert (interval in expr) == (expected & Set([interval]) == Set([interval]))
+
+
+def test_simplify_pushes_complements_to_leaves():
+
+    a, b, c, d = Set('[0, 1]'), Set('[2, 3]'), Set('[4, 5]'), Set('[6, 7]')
+    expr = ~((lazy(a) | b) & ~(lazy(c) ^ d)) | a
+
+    simple = expr.simplify()
+    assert isinstance(simple, Union)
+    assert len(simple.operands) == 3
+
+    def walk(node):
+        if isinstance(node, Complement):
+            assert isinstance(node.operand, Leaf)
+        for child in getattr(node, 'operands', ()):
+            assert type(child) is not type(node)
+            walk(child)
+
+    walk(simple)
+    assert simple.evaluate() == (~((a | b) & ~(c ^ d)) | a)
+
+
+def test_same_set_is_swept_once():
+
+    a, b = Set('[0, 10]'), Set('[5, 15]')
+    expr = (lazy(a) & b) | (lazy(a) - b)
+    assert len(expr.simplify()._leaves()) == 2
+    assert expr.evaluate() == a
+
+
+def test_complement_of_empty_and_unbounded():
+
+    empty = Set()
+    assert (~lazy(empty)).evaluate() == Set('(-inf, inf)')
+    assert not ~lazy(Set('(-inf, inf)'))
+    assert (~lazy(Set('(-inf, 0)'))).evaluate() == Set('[0, inf)')
+    assert (lazy(empty) | empty).evaluate() == empty
+
+
+def test_operators_and_type_errors():
+
+    a, b = Set('[0, 2]'), Set('[1, 3]')
+    assert isinstance(lazy(b) ^ a, SymmetricDifference)
+    assert isinstance(Intersection(lazy(a), lazy(b)), Intersection)
+    with pytest.raises(TypeError):
+        lazy(a) | [Interval('[0, 1]')]
+    with pytest.raises(TypeError):
+        Leaf([1, 2])
+
+
+def test_set_as_left_operand():
+
+    a, b = Set('[0, 10]'), Set('[5, 20]')
+
+    for expr, expected in [
+        (a | lazy(b), a | b),
+        (a & lazy(b), a & b),
+        (a - lazy(b), a - b),
+        (a ^ lazy(b), a ^ b),
+    ]:
+        assert isinstance(expr, Intersection | Union | SymmetricDifference)
+        assert expr.evaluate() == expected
+
+    with pytest.raises(TypeError):
+        a | 1
+    with pytest.raises(TypeError):
+        1 | lazy(a)
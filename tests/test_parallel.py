@@ -0,0 +1,88 @@
+import concurrent.futures
+import operator
+import random
+
+import pytest
+
+from set_algebra import CompactSet, Endpoint, Set
+from set_algebra import parallel
+
+from ._utils import random_set
+
+
+OPERATIONS = [
+    (parallel.union, operator.or_),
+    (parallel.intersection, operator.and_),
+    (parallel.difference, operator.sub),
+    (parallel.symmetric_difference, operator.xor),
+]
+
+
+def random_boundaries(rnd):
+    notations = []
+    for _ in range(rnd.randint(0, 5)):
+        value = rnd.randint(-2, 40)
+        notations.append(rnd.choice(['[%d', '(%d', '%d]', '%d)']) % value)
+    return [Endpoint(notation) for notation in notations]
+
+
+def test_partitioned_operations_match_operators():
+
+    rnd = random.Random(20)
+    for _ in range(200):
+        x = random_set(rnd, rnd.randint(0, 12))
+        y = random_set(rnd, rnd.randint(0, 12))
+        boundaries = random_boundaries(rnd)
+
+        for fn, op in OPERATIONS:
+            expected = op(x, y)
+            result = fn(x, y, boundaries=boundaries, executor=parallel.serial)
+            assert type(result) is Set
+            assert result == expected
+
+            result = fn(x, y, partitions=rnd.randint(2, 6), executor=parallel.serial)
+            assert result == expected
+
+            result = fn(CompactSet(x), y, boundaries=boundaries, executor=parallel.serial)
+            assert type(result) is CompactSet
+            assert result == CompactSet(expected)
+
+
+def test_seams_are_coalesced():
+
+    a = Set('(-inf, 5), (5, 10), [20, 30]')
+    b = Set('{5}, [10, 15)')
+    boundaries = [Endpoint('5]'), Endpoint('[10'), Endpoint('(10'), Endpoint('25)')]
+    result = parallel.union(a, b, boundaries=boundaries, executor=parallel.serial)
+    assert result == Set('(-inf, 15), [20, 30]')
+    assert len(result.pieces) == 2
+
+
+def test_process_pool():
+
+    rnd = random.Random(21)
+    x = random_set(rnd, 300)
+    y = random_set(rnd, 300)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as pool:
+        assert parallel.union(x, y, partitions=3, executor=pool) == x | y
+        assert parallel.difference(CompactSet(x), y, partitions=3, executor=pool) == CompactSet(x - y)
+
+
+def test_small_and_invalid_operands():
+
+    a = Set('[1, 2]')
+    # Too few pieces to partition: computed by the calling process, in the same representation.
+    result = parallel.union(a, Set('{3}'))
+    assert result == Set('[1, 2], {3}')
+    assert type(result.pieces[0].a.value) is float
+    assert parallel.union(a, CompactSet('{3}')) == \
+        parallel.union(a, CompactSet('{3}'), partitions=2, executor=parallel.serial)
+    result = parallel.difference(CompactSet('[0, 5]'), a)
+    assert type(result) is CompactSet
+    assert result == CompactSet('[0, 1), (2, 5]')
+    assert parallel.intersection(Set(), Set(), partitions=4, executor=parallel.serial) == Set()
+
+    with pytest.raises(TypeError):
+        parallel.union(a, [1])
+    with pytest.raises(TypeError):
+        parallel.union(Set(['a']), Set(['b']), partitions=2, executor=parallel.serial)
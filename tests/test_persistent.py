@@ -0,0 +1,122 @@
+import doctest
+import random
+
+from set_algebra import Interval, PersistentSet, Set
+from set_algebra import persistent
+from set_algebra.persistent import PersistentList
+
+from ._utils import check_same, random_set
+
+
+class TinyPersistentList(PersistentList):
+    __slots__ = ()
+    LOAD = 4
+
+
+class TinyPersistentSet(PersistentSet):
+    container = TinyPersistentList
+
+
+def test_doctest():
+
+    assert doctest.testmod(persistent).failed == 0
+
+
+def test_versions_do_not_affect_each_other():
+
+    rnd = random.Random(23)
+    versions = [(TinyPersistentList(range(40)), list(range(40)))]
+
+    for _ in range(3000):
+        lst, reference = rnd.choice(versions)
+        if rnd.random() < 0.1:
+            versions.append((lst.copy(), list(reference)))
+            continue
+
+        n = len(reference)
+        i = rnd.randint(0, n)
+        j = rnd.randint(i, min(n, i + 12))
+        items = [rnd.random() for _ in range(rnd.randint(0, 12))]
+        action = rnd.randrange(4)
+
+        if action == 0:
+            reference.insert(i, items[:1])
+            lst.insert(i, items[:1])
+        elif action == 1:
+            reference[i:j] = items
+            lst[i:j] = items
+        elif action == 2:
+            del reference[i:j]
+            del lst[i:j]
+        elif n:
+            k = rnd.randrange(n)
+            reference[k] = items
+            lst[k] = items
+
+    for lst, reference in versions:
+        check_same(lst, reference)
+
+
+def test_chunks_are_shared():
+
+    base = TinyPersistentList(range(100))
+    copy = base.copy()
+    assert copy._chunks is base._chunks
+
+    copy[50] = 'x'
+    shared = sum(c1 is c2 for c1, c2 in zip(base._chunks, copy._chunks))
+    assert shared == len(base._chunks) - 1
+    assert base[50] == 50
+
+    # The copied chunk is owned now and changed in place.
+    chunk = copy._chunks[copy._locate(50)[0]]
+    copy[51] = 'y'
+    assert copy._chunks[copy._locate(51)[0]] is chunk
+
+
+def test_set_versions():
+
+    rnd = random.Random(24)
+    versions = [(TinyPersistentSet(), Set())]
+
+    for _ in range(1000):
+        s, reference = rnd.choice(versions)
+        other = random_set(rnd, rnd.randint(0, 3))
+        action = rnd.randrange(6)
+
+        if action == 0:
+            versions.append((s.copy(), reference.copy()))
+        elif action == 1:
+            versions.append((s | other, reference | other))
+        elif action == 2:
+            versions.append((s - other, reference - other))
+        elif action == 3:
+            s |= other
+            reference |= other
+        elif action == 4:
+            s -= other
+            reference -= other
+        else:
+            x = Interval(rnd.randint(0, 30), rnd.randint(30, 40), '[)')
+            s.add(x)
+            reference.add(x)
+
+    for s, reference in versions:
+        assert type(s) is TinyPersistentSet
+        assert s == reference
+        assert s.measure() == reference.measure()
+
+
+def test_copy_is_constant_time():
+
+    s = PersistentSet([Interval(i, i + 0.5, '[)') for i in range(10000)])
+    s.measure()
+    copy = s.copy()
+    assert copy.pieces._chunks is s.pieces._chunks
+    assert copy._measure_index is s._measure_index
+
+    copy.remove(Interval('[100, 200)'))
+    assert s.measure() == 5000
+    assert copy.measure() == 4950
+    assert len(copy.pieces) == 9900
+    assert copy.pieces[100] is s.pieces[200]
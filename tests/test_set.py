@@ -1,6 +1,8 @@
+import datetime
+
 import pytest
 
-from set_algebra import Endpoint, Interval, Set, inf, unbounded
+from set_algebra import ChunkedSet, Endpoint, Interval, Set, inf, unbounded
 
 
 def test_set_init():
@@ -78,6 +80,37 @@ def test_set_init():
     assert s.pieces == [Interval('(0, 1)'), Interval('(1, 2)')]
 
 
+def test_set_from_pieces():
+
+    s = Set.from_pieces([])
+    assert s.pieces == []
+
+    s = Set.from_pieces([8, 6, Interval('(4, 6)'), 2, 5])
+    assert s.pieces == [2, Interval('(4, 6]'), 8]
+
+    s = Set.from_pieces([Interval('[2, 3)'), 1, Interval('[0, 1)'), Interval('(3, 4)')])
+    assert s.pieces == [Interval('[0, 1]'), Interval('[2, 3)'), Interval('(3, 4)')]
+
+    s = Set.from_pieces([Interval('(1, 1)'), Interval('[2, 2)'), Interval('[3, 3]')])
+    assert s.pieces == [3]
+
+    s = Set.from_pieces([Interval('(-inf, 0)'), Interval('[0, 1]'), Interval('(1, inf)')])
+    assert s.pieces == [unbounded]
+
+    i = Interval('[1, 9]')
+    s = Set.from_pieces([i])
+    assert s.pieces[0] is not i
+
+    s = Set.from_pieces([0, Interval('[0, 2]'), Interval('[1, 5)'), 5], presorted=True)
+    assert s.pieces == [Interval('[0, 5]')]
+
+    with pytest.raises(ValueError):
+        Set.from_pieces([Interval('[1, 2]'), 0], presorted=True)
+
+    with pytest.raises(ValueError):
+        Set.from_pieces([inf])
+
+
 def test_set_init_from_notation():
 
     s = Set('[1, 2]')
@@ -126,6 +159,127 @@ def test_set_init_from_notation_raises():
             s = Set(notation)
 
 
+def test_set_from_notation():
+
+    notation = '(-inf, -1.5), {0}, [1, 2), (2, 3], {4}, (5, inf)'
+    s = Set.from_notation(notation)
+    assert s.notation == notation
+    assert s == Set.from_notation(notation, validate=False)
+    assert s.pieces[2] == Interval('[1, 2)')
+    assert s.pieces[1] == 0
+    assert isinstance(s.pieces[1], int)
+
+    s = Set.from_notation(' [ 1 ,2 ] ,{ 3 },\n(4,5)\n')
+    assert s.notation == '[1, 2], {3}, (4, 5)'
+
+    # Degenerate intervals are kept as they are.
+    assert Set('[1, 1]').pieces == [Interval('[1, 1]')]
+
+    assert type(ChunkedSet.from_notation('[1, 2]')) is ChunkedSet
+
+    for notation in ('[1, 2],', '[1, 2] [3, 4]', '[1, 2]x', '{1}}', '(1, 2, 3)'):
+        for validate in (True, False):
+            with pytest.raises(ValueError):
+                Set.from_notation(notation, validate)
+
+    # Trusted input is not checked for order.
+    s = Set.from_notation('[3, 4], {1}', validate=False)
+    assert s.pieces == [Interval('[3, 4]'), 1]
+
+    with pytest.raises(ValueError):
+        Set.from_notation('[3, 4], {1}')
+
+
+def test_set_bounds_and_measure():
+
+    s = Set('[1, 2], {3}, (5, 7.5)')
+    assert s.bounds() == Interval('[1, 7.5)')
+    assert s.measure() == 3.5
+
+    assert Set('{4}').bounds() == Interval('[4, 4]')
+    assert Set('{4}').measure() == 0
+    assert Set().bounds() is None
+    assert Set().measure() == 0
+
+    assert Set('(-inf, 0)').measure() is inf
+    assert Set('{0}, (5, inf)').measure() is inf
+    assert Set('(-inf, inf)').bounds() == unbounded
+
+
+def test_set_measure_between():
+
+    s = Set('(-inf, -10], [0, 2], {3}, (5, 7.5), [10, 20]')
+    assert s.measure_between(1, 6) == 2
+    assert s.measure_between(0, 20) == 14.5
+    assert s.measure_between(-5, 0) == 0
+    assert s.measure_between(3, 3) == 0
+    assert s.measure_between(7.5, 10) == 0
+    assert s.measure_between(-12, 1) == 3
+    assert s.measure_between(-inf, 1) is inf
+    assert s.measure_between(15, inf) == 5
+    assert Set().measure_between(0, 1) == 0
+    assert Set('{1}, {2}').measure_between(0, 3) == 0
+    with pytest.raises(ValueError):
+        s.measure_between(2, 1)
+
+    # The index is rebuilt after every change.
+    assert s.measure() is inf
+    assert s.measure_between(0, 20) == 14.5
+    s.add(Interval('[2, 5]'))
+    assert s.measure_between(0, 20) == 17.5
+    s.remove(Interval('[15, 20]'))
+    assert s.measure_between(0, 20) == 12.5
+    s -= Set('(-inf, 0)')
+    assert s.measure() == 12.5
+    s.clear()
+    assert s.measure_between(0, 20) == 0
+
+    day = datetime.date(2026, 1, 1)
+    week = datetime.timedelta(days=7)
+    s = Set([Interval(day, day + week, '[)'), Interval(day + 2 * week, day + 3 * week, '[)')])
+    assert s.measure() == 2 * week
+    assert s.measure_between(day + datetime.timedelta(days=3), day + 4 * week) == week + datetime.timedelta(days=4)
+
+
+def test_set_nearest_points_and_gaps():
+
+    s = Set('[0, 10), {12}, (14, 20], [25, 30]')
+    assert s.next_bound(5) == Endpoint('[5')
+    assert s.next_bound(11) == Endpoint('[12')
+    assert s.next_bound(13) == Endpoint('(14')
+    assert s.next_bound(31) is None
+    assert s.prev_bound(13) == Endpoint('12]')
+    assert s.prev_bound(10) == Endpoint('10)')
+    assert s.prev_bound(9.5) == Endpoint('9.5]')
+    assert s.prev_bound(-1) is None
+    assert Set().next_bound(0) is None
+    assert s.next_bound(11) == 12 and s.next_bound(13) != 14
+    assert s.next_bound(13) is not s.pieces[2].a
+
+    assert list(s.gaps()) == [Interval('(-inf, 0)'), Interval('[10, 12)'), Interval('(12, 14]'),
+                              Interval('(20, 25)'), Interval('(30, inf)')]
+    assert list(s.gaps(Interval('[5, 26]'))) == [
+        Interval('[10, 12)'), Interval('(12, 14]'), Interval('(20, 25)')]
+    assert list(s.gaps(Interval('[2, 3]'))) == []
+    assert list(s.gaps(11)) == [11]
+    assert list(Set().gaps()) == [unbounded]
+    assert list(Set('(-inf, 0), (0, inf)').gaps()) == [0]
+
+    assert s.next_gap(3) == Interval('[10, 12)')
+    assert s.next_gap(11) == Interval('[11, 12)')
+    assert s.next_gap(3, min_length=3) == Interval('(20, 25)')
+    assert s.next_gap(3, min_length=100) == Interval('(30, inf)')
+    assert Set('(-inf, inf)').next_gap(0) is None
+    assert Set('(-inf, 0), (0, inf)').next_gap(-5) == 0
+    assert Set('(-inf, 0), (0, inf)').next_gap(-5, min_length=0) is None
+
+    day = datetime.date(2026, 1, 1)
+    busy = Set([Interval(day, day + datetime.timedelta(days=2), '[)'),
+                Interval(day + datetime.timedelta(days=3), day + datetime.timedelta(days=10), '[)')])
+    gap = busy.next_gap(day, min_length=datetime.timedelta(days=2))
+    assert gap.a.value == day + datetime.timedelta(days=10)
+
+
 def test_set_repr():
 
     s = Set()
@@ -423,6 +577,32 @@ def test_set_search():
     assert s.search(9) == (3, None)
 
 
+def test_set_irange_and_slice():
+
+    s = Set('(-inf, -5), [0, 10), {12}, (14, 20], [25, 30]')
+    assert list(s.irange(Interval('[5, 26)'))) == [
+        Interval('[5, 10)'), 12, Interval('(14, 20]'), Interval('[25, 26)')]
+    assert list(s.irange(Interval('[10, 12)'))) == []
+    assert list(s.irange(12)) == [12]
+    assert list(s.irange(13)) == []
+    assert list(s.irange(Interval('(1, 1)'))) == []
+    assert list(s.irange(Interval('(-inf, -10]'))) == [Interval('(-inf, -10]')]
+
+    # Pieces within the window are not copied.
+    assert list(s.irange(Interval('[-1, 21]')))[2] is s.pieces[3]
+
+    assert s.slice(Interval('[5, 26)')) == Set('[5, 10), {12}, (14, 20], [25, 26)')
+    assert s.slice(unbounded) == s
+    assert s.slice(Interval('(20, 25)')) == Set()
+    sliced = s.slice(Interval('[12, 30]'))
+    sliced.add(Interval('[19, 26]'))
+    assert s == Set('(-inf, -5), [0, 10), {12}, (14, 20], [25, 30]')
+
+    c = ChunkedSet(s)
+    assert type(c.slice(12)) is ChunkedSet
+    assert c.slice(Interval('[5, 26)')).pieces == s.slice(Interval('[5, 26)')).pieces
+
+
 def test_set_contains_scalar():
 
     s = Set()
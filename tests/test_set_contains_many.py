@@ -0,0 +1,127 @@
+import datetime
+
+import pytest
+
+from set_algebra import Endpoint, FrozenSet, Interval, Set
+import set_algebra.set_
+
+
+SETS = [
+    None,
+    '{0}',
+    '[0, 1]',
+    '(0, 1)',
+    '(-inf, 0), {1}, (1.5, 2], [3, 4), {5}, (6, inf)',
+    '(-inf, inf)',
+    '[-2.5, -1.5), (0.25, 0.75]',
+]
+
+VALUES = [-10, -2.5, -2, -1.5, -1, 0, 0.25, 0.5, 0.75, 1, 1.5, 2, 2.5, 3, 3.5, 4, 5, 5.5, 6, 7, 1e300]
+
+
+def check_contains_many(values):
+
+    for notation in SETS:
+        s = Set(notation)
+        result = s.contains_many(values)
+        assert list(result) == [x in s for x in values], notation
+
+
+def test_contains_many_numpy():
+
+    np = pytest.importorskip('numpy')
+
+    check_contains_many(VALUES)
+    check_contains_many(np.array(VALUES))
+    check_contains_many(np.arange(-3, 8))
+
+    s = Set('[0, 1]')
+    result = s.contains_many(np.array([[0, 2], [1, 3]]))
+    assert result.dtype == bool
+    assert result.tolist() == [[True, False], [True, False]]
+
+    result = s.contains_many(np.array([float('nan'), float('inf'), float('-inf')]))
+    assert result.tolist() == [False, False, False]
+
+    # 0-d arrays give 0-d results.
+    assert s.contains_many(np.array(1)).shape == ()
+    assert s.contains_many(np.float64(0.5)).tolist() is True
+    assert s.contains_many(np.array(2 ** 60)).tolist() is False
+    assert Set('[0.5, 1]').contains_many(np.array(2 ** 60)).tolist() is False
+    assert Set().contains_many(np.array(1)).tolist() is False
+
+
+def test_contains_many_large_integers():
+
+    np = pytest.importorskip('numpy')
+
+    t = 1_700_000_000_000_000_001
+    s = Set([Interval(t, t + 10, '(]')])
+    assert s.contains_many(np.array([t, t + 1])).tolist() == [False, True]
+    assert s.contains_many(np.array([[t], [t + 1]], dtype=np.uint64)).tolist() == [[False], [True]]
+
+    # Integers beyond 2**53 with pieces that are not all integers.
+    big = 2 ** 60
+    for notation in ['(-inf, 0.5), (2, inf)', '(-inf, 0), (2, inf)']:
+        s = Set(notation)
+        values = [-2 ** 63, -big, 0, 1, 3, big, 2 ** 63 - 1]
+        assert s.contains_many(np.array(values)).tolist() == [x in s for x in values]
+
+    s = Set([Interval(0.5, big, '[]')])
+    values = [1, big, big + 1]
+    assert s.contains_many(np.array(values)).tolist() == [x in s for x in values]
+    assert s.contains_many(np.array([float(big), 1e30])).tolist() == [True, False]
+
+
+def test_contains_many_longdouble():
+
+    np = pytest.importorskip('numpy')
+
+    one = np.longdouble(1)
+    above = one + np.finfo(np.longdouble).eps
+    below = one - np.finfo(np.longdouble).eps
+    values = [below, one, above, np.longdouble(0.5)]
+    for notation in ['[0, 1]', '[0, 1)', '(1, 2]', '{1}']:
+        s = Set(notation)
+        assert s.contains_many(np.array(values)).tolist() == [x in s for x in values], notation
+
+
+def test_contains_many_cache():
+
+    np = pytest.importorskip('numpy')
+
+    s = Set('[0, 1], {3}')
+    values = np.array([0.5, 2, 3, 5])
+    assert s.contains_many(values).tolist() == [True, False, True, False]
+    arrays = s._numeric_arrays(np, False)
+    assert s._numeric_arrays(np, False) is arrays
+
+    s.add(Interval('[4, 6]'))
+    assert s.contains_many(values).tolist() == [True, False, True, True]
+    s.remove(3)
+    assert s.contains_many(values).tolist() == [True, False, False, True]
+    s.pieces = [2]
+    assert s.contains_many(values).tolist() == [False, True, False, False]
+
+    f = FrozenSet('[0, 1], {3}')
+    assert f.contains_many(values).tolist() == [True, False, True, False]
+    assert f._numeric_arrays(np, False) is f._numeric_arrays(np, False)
+
+
+def test_contains_many_without_numpy(monkeypatch):
+
+    monkeypatch.setattr(set_algebra.set_, '_import_numpy', lambda: None)
+
+    check_contains_many(VALUES)
+    assert Set('[0, 1]').contains_many(x / 2 for x in range(4)) == [True, True, True, False]
+    assert Set().contains_many([1, 2]) == [False, False]
+
+
+def test_contains_many_non_numeric():
+
+    d1 = datetime.date(2026, 1, 1)
+    d2 = datetime.date(2026, 1, 10)
+    s = Set([Interval(Endpoint(d1, '['), Endpoint(d2, ')'))])
+    days = [d1 + datetime.timedelta(days=i) for i in range(-2, 12)]
+
+    assert list(s.contains_many(days)) == [d in s for d in days]
@@ -0,0 +1,140 @@
+import random
+
+from set_algebra import Interval, Set, inf
+
+from ._utils import random_set
+
+
+def reference_union(x, y):
+    new = x.copy()
+    for p in y.pieces:
+        new.add(p)
+    return new
+
+
+def reference_difference(x, y):
+    new = x.copy()
+    for p in y.pieces:
+        new.remove(p)
+    return new
+
+
+def test_merge_matches_incremental_algorithms():
+
+    rnd = random.Random(1)
+
+    for _ in range(300):
+        x = random_set(rnd, rnd.randint(0, 12))
+        y = random_set(rnd, rnd.randint(0, 12))
+
+        union = reference_union(x, y)
+        diff_xy = reference_difference(x, y)
+        diff_yx = reference_difference(y, x)
+
+        assert x | y == union
+        assert x - y == diff_xy
+        assert x & y == reference_difference(x, diff_xy)
+        assert x ^ y == reference_union(diff_xy, diff_yx)
+
+
+def test_merge_does_not_share_pieces():
+
+    x = Set('[0, 2], [4, 6]')
+    y = Set('[1, 3]')
+
+    for z in (x | y, x & y, x - y, x ^ y):
+        for p in z.pieces:
+            assert all(p is not q for q in x.pieces + y.pieces)
+
+    z = x - y
+    z.remove(5)
+    assert x == Set('[0, 2], [4, 6]')
+
+
+def test_inplace_merge_with_many_pieces():
+
+    rnd = random.Random(2)
+    x = random_set(rnd, 200)
+    y = random_set(rnd, 200)
+    assert len(y.pieces) > 64
+
+    z = x.copy()
+    z |= y
+    assert z == reference_union(x, y)
+
+    z = x.copy()
+    z -= y
+    assert z == reference_difference(x, y)
+
+
+def test_inplace_splice_matches_merge():
+
+    rnd = random.Random(7)
+
+    for _ in range(500):
+        x = random_set(rnd, rnd.randint(0, 10))
+        y = random_set(rnd, rnd.randint(0, 10))
+
+        z = x.copy()
+        z |= y
+        assert z == x | y
+
+        z = x.copy()
+        z -= y
+        assert z == x - y
+
+    z = Set('{0}, (2, 8], (10, 14]')
+    z |= Set('(0, 5], {6}, (13, 18]')
+    assert z == Set('[0, 8], (10, 18]')
+
+
+def test_slice_matches_intersection():
+
+    rnd = random.Random(17)
+
+    for _ in range(300):
+        x = random_set(rnd, rnd.randint(0, 12))
+        a = rnd.randint(-2, 40)
+        window = Interval(a, a + rnd.randint(0, 8), rnd.choice(['[]', '[)', '(]', '()']))
+        expected = x & Set([window])
+        assert list(x.irange(window)) == expected.pieces
+        assert x.slice(window) == expected
+        assert x.slice(a) == x & Set([a])
+
+
+def test_measure_between_matches_slice():
+
+    rnd = random.Random(18)
+
+    for _ in range(300):
+        x = random_set(rnd, rnd.randint(0, 12))
+        for _ in range(5):
+            a = rnd.randint(-2, 40)
+            b = a + rnd.randint(0, 10)
+            assert x.measure_between(a, b) == x.slice(Interval(a, b, '[]')).measure()
+        x.add(Interval(rnd.randint(0, 30), 31, '[]'))
+        assert x.measure_between(-2, 50) == x.measure()
+
+
+def test_gaps_match_complement():
+
+    rnd = random.Random(19)
+
+    for _ in range(300):
+        x = random_set(rnd, rnd.randint(0, 12))
+        complement = ~x
+        assert list(x.gaps()) == complement.pieces
+
+        a = rnd.randint(-2, 40)
+        window = Interval(a, a + rnd.randint(0, 8), rnd.choice(['[]', '[)', '(]', '()']))
+        assert list(x.gaps(window)) == complement.slice(window).pieces
+
+        after = complement.slice(Interval(a, inf, '[)')).pieces
+        assert x.next_gap(a) == (after[0] if after else None)
+        long_enough = [p for p in after if isinstance(p, Interval) and Set([p]).measure() >= 2]
+        assert x.next_gap(a, min_length=2) == (long_enough[0] if long_enough else None)
+
+        nxt = x.slice(Interval(a, inf, '[)'))
+        assert x.next_bound(a) == (nxt.bounds().a if nxt else None)
+        prv = x.slice(Interval(f'(-inf, {a}]'))
+        assert x.prev_bound(a) == (prv.bounds().b if prv else None)
@@ -349,3 +349,20 @@ def test_remove_interval_from_three_intervals_and_two_scalars():
     assert i1 == Interval('(-inf, 0)')
     assert i2 == Interval('(0, 1)')
     assert i3 == Interval('[10, inf)')
+
+
+def test_remove_degenerate_interval():
+
+    i = Interval('(121, 129]')
+    pieces = [i, 130]
+
+    tests = [
+        (pieces, Interval('(128, 128)'), [i, 130]),
+        (pieces, Interval('[128, 128)'), [i, 130]),
+        (pieces, Interval('(128, 128]'), [i, 130]),
+        (pieces, Interval('[128, 128]'), [Interval('(121, 128)'), Interval('(128, 129]'), 130]),
+        (pieces, Interval('[130, 130]'), [i]),
+        (pieces, Interval('(130, 130)'), [i, 130]),
+    ]
+
+    do_bulk_remove_tests(tests)
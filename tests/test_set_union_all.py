@@ -0,0 +1,67 @@
+import functools
+import operator
+import random
+
+import pytest
+
+from set_algebra import ChunkedSet, Interval, Set
+
+from ._utils import random_set
+
+
+def test_union_all_and_intersection_all_match_folding():
+
+    rnd = random.Random(3)
+
+    for _ in range(200):
+        sets = [random_set(rnd, rnd.randint(0, 10)) for _ in range(rnd.randint(1, 6))]
+        assert Set.union_all(sets) == functools.reduce(operator.or_, sets)
+        assert Set.intersection_all(sets) == functools.reduce(operator.and_, sets)
+
+
+def test_union_all():
+
+    assert Set.union_all([]) == Set()
+    assert Set.union_all([Set('(0, 1)'), Set('{1}'), Set('(1, 2)')]) == Set('(0, 2)')
+    assert Set.union_all([Set('[0, 1)'), Set('[1, 2]'), Set('(2, inf)')]) == Set('[0, inf)')
+    assert Set.union_all([Set('(-inf, 0)'), [5], '{7}']) == Set('(-inf, 0), {5}, {7}')
+
+    sets = [Set('[1, 2]'), Set('[1, 2]')]
+    s = Set.union_all(sets)
+    assert s.pieces[0] is not sets[0].pieces[0]
+
+    assert type(ChunkedSet.union_all(sets)) is ChunkedSet
+
+
+def test_intersection_all():
+
+    sets = [Set('[0, 10]'), Set('(2, 8), {9}'), Set('[1, 3], [5, inf)')]
+    assert Set.intersection_all(sets) == Set('(2, 3], [5, 8), {9}')
+    assert Set.intersection_all([Set('[0, 1)'), Set('[1, 2]')]) == Set()
+    assert Set.intersection_all([Set('[1, 2]')]) == Set('[1, 2]')
+
+    with pytest.raises(ValueError):
+        Set.intersection_all([])
+
+
+def test_union_and_update_of_many_sets():
+
+    rnd = random.Random(4)
+    s = random_set(rnd, 30)
+    others = [random_set(rnd, 30) for _ in range(10)]
+    expected = functools.reduce(operator.or_, others, s)
+
+    assert s.union(*others) == expected
+    assert s.union(*[o.pieces for o in others]) == expected
+
+    t = s.copy()
+    t.update(*others)
+    assert t == expected
+
+    t = s.copy()
+    t.intersection_update(*others[:2])
+    assert t == s & others[0] & others[1]
+
+    t = s.copy()
+    t.update([Interval('[1000, 1001]')])
+    assert t == s | Set('[1000, 1001]')
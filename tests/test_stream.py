@@ -0,0 +1,65 @@
+import itertools
+import random
+
+import pytest
+
+from set_algebra import Interval, Set
+from set_algebra import stream
+
+from ._utils import random_set
+
+
+def test_stream_operations_match_set_operations():
+
+    rnd = random.Random(16)
+    for _ in range(200):
+        sets = [random_set(rnd, rnd.randint(0, 10)) for _ in range(rnd.randint(1, 4))]
+        streams = lambda: [iter(s.pieces) for s in sets]
+
+        assert list(stream.union(*streams())) == Set.union_all(sets).pieces
+        assert list(stream.intersection(*streams())) == Set.intersection_all(sets).pieces
+        assert list(stream.difference(*streams())) == sets[0].difference(*sets[1:]).pieces
+        assert list(stream.symmetric_difference(*streams())) == \
+            sets[0].symmetric_difference(*sets[1:]).pieces
+
+        # Sets and streams mixed.
+        assert list(stream.union(sets[0], *streams()[1:])) == Set.union_all(sets).pieces
+
+
+def test_stream_is_lazy():
+
+    def endless():
+        for i in itertools.count():
+            yield Interval(10 * i, 10 * i + 5, '[]')
+
+    reference = Set('[3, 12], {24}, [33, 34]')
+    result = stream.union(endless(), reference)
+    assert list(itertools.islice(result, 3)) == [
+        Interval('[0, 15]'), Interval('[20, 25]'), Interval('[30, 35]')]
+
+    result = stream.difference(endless(), reference)
+    assert list(itertools.islice(result, 4)) == [
+        Interval('[0, 3)'), Interval('(12, 15]'), Interval('[20, 24)'), Interval('(24, 25]')]
+
+
+def test_stream_validation():
+
+    with pytest.raises(ValueError, match='operand 1, pieces.0. and pieces.1.: 3 >= 2'):
+        list(stream.union([1, 2], [3, 2]))
+
+    with pytest.raises(ValueError, match='no gap'):
+        list(stream.intersection([Interval('[0, 1)'), Interval('[1, 2]')]))
+
+    # Not checked.
+    list(stream.union([3, 2], validate=False))
+
+    # Empty degenerate intervals are skipped.
+    assert list(stream.union([Interval('(1, 1)'), 1, Interval('[2, 3]')])) == [1, Interval('[2, 3]')]
+
+
+def test_stream_no_operands():
+
+    assert list(stream.union()) == []
+    with pytest.raises(ValueError):
+        stream.intersection()
+    assert list(stream.difference([1, 2])) == [1, 2]
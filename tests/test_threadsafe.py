@@ -0,0 +1,147 @@
+import doctest
+import random
+import threading
+
+import pytest
+
+from set_algebra import ConcurrentSet, FrozenSet, Interval, Set
+from set_algebra import threadsafe
+
+from ._utils import random_set
+
+
+def test_doctest():
+
+    assert doctest.testmod(threadsafe).failed == 0
+
+
+def test_changes_match_set():
+
+    rnd = random.Random(21)
+    for _ in range(100):
+        x = random_set(rnd, rnd.randint(0, 10))
+        y = random_set(rnd, rnd.randint(0, 10))
+        s = ConcurrentSet(x)
+        before = s.snapshot()
+
+        s |= y
+        assert s == x | y
+        s -= x
+        assert s == (x | y) - x
+        s ^= y
+        assert s == ((x | y) - x) ^ y
+        s &= x
+        assert s == (((x | y) - x) ^ y) & x
+
+        # Published snapshots are never changed.
+        assert before == x
+        assert type(s.snapshot()) is FrozenSet
+
+
+def test_add_remove_and_queries():
+
+    s = ConcurrentSet('[0, 10]')
+    s.add(Interval('[20, 30)'))
+    s.remove(5)
+    s.update([40], Set('{50}'))
+    s.difference_update([Interval('[25, 40]')])
+    assert s == Set('[0, 5), (5, 10], [20, 25), {50}')
+    assert s.pieces == FrozenSet('[0, 5), (5, 10], [20, 25), {50}').pieces
+    assert 4 in s and 5 not in s
+    assert s.search(50) == (3, 50)
+    assert s.measure() == 15
+    assert list(s.irange(Interval('[8, 22]'))) == [Interval('[8, 10]'), Interval('[20, 22]')]
+    assert s | Set('{60}') == Set('[0, 5), (5, 10], [20, 25), {50}, {60}')
+    assert ~s == ~Set('[0, 5), (5, 10], [20, 25), {50}')
+    assert s != ConcurrentSet()
+
+    s.clear()
+    assert not s
+    assert s == ConcurrentSet()
+
+    with pytest.raises(TypeError):
+        hash(s)
+
+
+def test_comparisons_copy_and_named_operations():
+
+    s = ConcurrentSet('[0, 10]')
+    small, other = Set('[2, 3]'), Set('[5, 20]')
+    assert small < s and small <= s and s > small and s >= small
+    assert s <= Set('[0, 10]') and not s < Set('[0, 10]')
+    assert ConcurrentSet(small) < s and s >= ConcurrentSet(s.snapshot())
+    assert not s > other
+
+    c = s.copy()
+    assert type(c) is ConcurrentSet and c == s
+    c.add(20)
+    assert 20 in c and 20 not in s
+
+    for name in ('union', 'intersection', 'difference', 'symmetric_difference'):
+        result = getattr(s, name)(other, '{30}')
+        assert type(result) is FrozenSet
+        assert result == getattr(Set('[0, 10]'), name)(other, '{30}')
+
+
+def test_transaction_rollback():
+
+    s = ConcurrentSet('[0, 10]')
+    with pytest.raises(RuntimeError):
+        with s.transaction() as t:
+            t.remove(Interval('[2, 3]'))
+            raise RuntimeError
+    assert s == Set('[0, 10]')
+
+
+def test_readers_see_consistent_snapshots():
+
+    states = [FrozenSet('[0, 10), (10, 20]'), FrozenSet('{0}, [5, 15], {20}')]
+    s = ConcurrentSet(states[0])
+    stop = threading.Event()
+    errors = []
+
+    def write():
+        for i in range(300):
+            with s.transaction() as t:
+                # Several steps, none of them seen by readers.
+                t.clear()
+                for piece in states[i % 2 - 1].pieces:
+                    t.add(piece)
+        stop.set()
+
+    def read():
+        while not stop.is_set():
+            snapshot = s.snapshot()
+            if snapshot not in states:
+                errors.append(snapshot)
+            # 10 is in the second state only, 2 in the first one only.
+            if (10 in snapshot) is (2 in snapshot):
+                errors.append(snapshot)
+
+    readers = [threading.Thread(target=read) for _ in range(3)]
+    writer = threading.Thread(target=write)
+    for thread in readers + [writer]:
+        thread.start()
+    for thread in readers + [writer]:
+        thread.join()
+
+    assert errors == []
+    assert s == states[0]
+
+
+def test_concurrent_writers():
+
+    s = ConcurrentSet()
+
+    def write(k):
+        for i in range(50):
+            s.add(Interval(k * 1000 + i * 10, k * 1000 + i * 10 + 5, '[)'))
+
+    writers = [threading.Thread(target=write, args=(k,)) for k in range(4)]
+    for thread in writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+
+    assert len(s.pieces) == 200
+    assert s.measure() == 1000
@@ -0,0 +1,112 @@
+import random
+
+import pytest
+
+from set_algebra import Interval, Set
+from set_algebra.validation import (FULL, OFF, SAMPLED, PiecesError, _mode_from_env,
+    check_pieces, get_validation_mode, set_validation_mode, validation)
+
+
+def test_mode_from_env():
+
+    assert _mode_from_env({}) == OFF
+    assert _mode_from_env({'SET_ALGEBRA_VALIDATION': ''}) == OFF
+    assert _mode_from_env({'SET_ALGEBRA_VALIDATION': 'full'}) == FULL
+    assert _mode_from_env({'SET_ALGEBRA_VALIDATION': ' Sampled '}) == SAMPLED
+
+    with pytest.warns(RuntimeWarning, match='SET_ALGEBRA_VALIDATION'):
+        assert _mode_from_env({'SET_ALGEBRA_VALIDATION': 'on'}) == OFF
+
+
+def test_validation_context_manager():
+
+    assert get_validation_mode() == FULL
+
+    with validation(OFF):
+        assert get_validation_mode() == OFF
+        with validation(SAMPLED):
+            assert get_validation_mode() == SAMPLED
+        assert get_validation_mode() == OFF
+
+    assert get_validation_mode() == FULL
+
+    with pytest.raises(ValueError):
+        with validation('everything'):
+            pass
+
+
+def test_set_validation_mode():
+
+    try:
+        set_validation_mode(OFF)
+        assert get_validation_mode() == OFF
+        with validation(FULL):
+            assert get_validation_mode() == FULL
+    finally:
+        set_validation_mode(FULL)
+
+    with pytest.raises(ValueError):
+        set_validation_mode(None)
+
+
+def test_check_pieces():
+
+    valid = [
+        [],
+        [1],
+        [1, 2],
+        [Interval('[1, 2)'), Interval('(2, 3)'), 4],
+    ]
+    for pieces in valid:
+        for mode in (OFF, SAMPLED, FULL):
+            check_pieces(pieces, mode)
+
+    invalid = [
+        ([2, 1], 0),
+        ([1, 1], 0),
+        ([0, Interval('[1, 2)'), Interval('[2, 3)')], 1),
+        ([0, Interval('[1, 3]'), Interval('[2, 4]')], 1),
+        ([Interval('[1, 2)'), 2, 3], 0),
+        ([0, 1, 2, Interval('[1, 3]')], 2),
+    ]
+    for pieces, index in invalid:
+        check_pieces(pieces, OFF)
+
+        with pytest.raises(PiecesError) as exc_info:
+            check_pieces(pieces, FULL)
+        assert exc_info.value.index == index
+        assert 'pieces[%d] and pieces[%d]' % (index, index+1) in str(exc_info.value)
+
+
+def test_check_pieces_sampled():
+
+    pieces = list(range(100))
+    pieces[50] = 49
+
+    with pytest.raises(PiecesError):
+        for _ in range(500):
+            check_pieces(pieces, SAMPLED)
+
+
+def test_sampled_check_keeps_random_sequence():
+
+    pieces = list(range(100))
+    random.seed(3)
+    expected = [random.random() for _ in range(3)]
+
+    random.seed(3)
+    for _ in range(3):
+        check_pieces(pieces, SAMPLED)
+    assert [random.random() for _ in range(3)] == expected
+
+
+def test_mutators_follow_validation_mode():
+
+    s = Set()
+    s.pieces = [2, 1]
+
+    with validation(OFF):
+        s.add(5)
+
+    with pytest.raises(AssertionError):
+        s.add(6)